@@ -0,0 +1,30 @@
+"""add image variant columns
+
+Revision ID: 8d4b6f02e1a7
+Revises: 7c3e5a91d2f4
+Create Date: 2026-10-16 23:31:40.912736
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d4b6f02e1a7'
+down_revision: Union[str, None] = '7c3e5a91d2f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('projects', sa.Column('image_variants', sa.JSON(), nullable=True))
+    op.add_column('users', sa.Column('avatar_variants', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'avatar_variants')
+    op.drop_column('projects', 'image_variants')
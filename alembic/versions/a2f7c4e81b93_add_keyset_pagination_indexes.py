@@ -0,0 +1,37 @@
+"""add keyset pagination indexes
+
+Revision ID: a2f7c4e81b93
+Revises: 8d4b6f02e1a7
+Create Date: 2026-10-17 00:12:08.530417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2f7c4e81b93'
+down_revision: Union[str, None] = '8d4b6f02e1a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables listed through BaseRepository.paginate, all of them have an is_visible flag
+VISIBLE_TABLES = ['projects', 'reviews', 'experiences', 'skill_groups', 'project_categories']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in VISIBLE_TABLES:
+        op.create_index(f'ix_{table}_created_at_id', table, ['created_at', 'id'], unique=False)
+        op.create_index(f'ix_{table}_is_visible_created_at_id', table, ['is_visible', 'created_at', 'id'], unique=False)
+    op.create_index('ix_chat_sessions_created_at_id', 'chat_sessions', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_chat_sessions_created_at_id', table_name='chat_sessions')
+    for table in reversed(VISIBLE_TABLES):
+        op.drop_index(f'ix_{table}_is_visible_created_at_id', table_name=table)
+        op.drop_index(f'ix_{table}_created_at_id', table_name=table)
@@ -0,0 +1,31 @@
+"""add content hash to vector embeddings
+
+Revision ID: c81e4a9d2b36
+Revises: b6d2f8a40c57
+Create Date: 2026-10-17 02:20:37.118452
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81e4a9d2b36'
+down_revision: Union[str, None] = 'b6d2f8a40c57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows get no hash and are re-embedded once by the next sync
+    op.add_column('vector_embeddings', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_index('ix_vector_embeddings_source_type_source_id', 'vector_embeddings', ['source_type', 'source_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_vector_embeddings_source_type_source_id', table_name='vector_embeddings')
+    op.drop_column('vector_embeddings', 'content_hash')
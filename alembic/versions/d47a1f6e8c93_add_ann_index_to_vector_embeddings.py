@@ -0,0 +1,50 @@
+"""add ann index to vector embeddings
+
+Revision ID: d47a1f6e8c93
+Revises: c81e4a9d2b36
+Create Date: 2026-10-17 03:02:45.871206
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.config.settings import VECTOR_DISTANCE_METRIC, VECTOR_INDEX_TYPE, VECTOR_IVFFLAT_LISTS
+from app.models.vector_store import VECTOR_OPERATOR_CLASSES
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd47a1f6e8c93'
+down_revision: Union[str, None] = 'c81e4a9d2b36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = 'ix_vector_embeddings_embedding_ann'
+
+
+def _supports_hnsw() -> bool:
+    """HNSW indexes need pgvector 0.5.0 or later"""
+    version = op.get_bind().execute(sa.text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")).scalar()
+    if not version:
+        return False
+    major, minor = (int(part) for part in version.split(".")[:2])
+    return (major, minor) >= (0, 5)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The operator class has to match VectorService.search's distance metric for the index to be used
+    operator_class = VECTOR_OPERATOR_CLASSES[VECTOR_DISTANCE_METRIC]
+    if VECTOR_INDEX_TYPE == 'hnsw' and _supports_hnsw():
+        op.execute(f"CREATE INDEX {INDEX_NAME} ON vector_embeddings USING hnsw (embedding {operator_class})")
+    else:
+        op.execute(
+            f"CREATE INDEX {INDEX_NAME} ON vector_embeddings USING ivfflat (embedding {operator_class}) "
+            f"WITH (lists = {VECTOR_IVFFLAT_LISTS})"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
@@ -0,0 +1,28 @@
+"""add github validators to projects
+
+Revision ID: e5b90d3c7a14
+Revises: a2f7c4e81b93
+Create Date: 2026-10-17 01:04:51.227860
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b90d3c7a14'
+down_revision: Union[str, None] = 'a2f7c4e81b93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('projects', sa.Column('github_validators', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('projects', 'github_validators')
@@ -0,0 +1,39 @@
+"""create query embedding cache table
+
+Revision ID: e92c5b7f1a08
+Revises: d47a1f6e8c93
+Create Date: 2026-10-17 03:41:09.352674
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+import pgvector
+
+# revision identifiers, used by Alembic.
+revision: str = 'e92c5b7f1a08'
+down_revision: Union[str, None] = 'd47a1f6e8c93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('query_embedding_cache',
+    sa.Column('key_hash', sa.String(length=64), nullable=False),
+    sa.Column('query_text', sa.Text(), nullable=False),
+    sa.Column('embedding', pgvector.sqlalchemy.vector.VECTOR(dim=768), nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_query_embedding_cache_key_hash'), 'query_embedding_cache', ['key_hash'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_query_embedding_cache_key_hash'), table_name='query_embedding_cache')
+    op.drop_table('query_embedding_cache')
@@ -1,14 +1,99 @@
-from sqlalchemy import create_engine
+import time
+from contextvars import ContextVar
+from typing import Optional
+from sqlalchemy import event
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from app.config.settings import settings
+from app.utils.db_pool import create_pooled_engine
+from app.utils.metrics import instrument_queries
+from app.utils.query_inspector import instrument_statement_shapes
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    connect_args={"connect_timeout": 10}
-)
+# Pool class, sizes, timeouts and statement timeout come from the DB_POOL_PRESET and DB_* settings
+engine = create_pooled_engine(settings.DATABASE_URL, settings)
+instrument_queries(engine, "primary")
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Optional read replica, only used for read-only public traffic through `get_read_session`
+replica_engine = create_pooled_engine(settings.DATABASE_REPLICA_URL, settings) if settings.DATABASE_REPLICA_URL else None
+if replica_engine is not None:
+    instrument_queries(replica_engine, "replica")
+
+ReplicaSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine) if replica_engine else None
+
+# Statement shapes are only tracked in development and tests, for the query inspector
+if settings.QUERY_INSPECTOR_ENABLED:
+    for inspected_engine in (engine, replica_engine):
+        if inspected_engine is not None:
+            instrument_statement_shapes(inspected_engine)
+
 Base = declarative_base()
+
+# Tables public endpoints never read, writing them doesn't pin reads to the primary
+REPLICA_LAG_EXEMPT_TABLES = {"chat_sessions", "chat_messages", "email_outbox", "query_embedding_cache"}
+
+# Monotonic time of the last transaction that wrote public content to the primary in this process
+_last_primary_write = 0.0
+
+# Cookie holding the epoch time until which a client that wrote public content reads from the
+# primary. Unlike `_last_primary_write` it follows the client across worker processes and instances.
+READ_PRIMARY_COOKIE = "read_primary_until"
+
+class RequestWrites:
+    """Whether the current request committed public content to the primary, shared by the threads serving it"""
+
+    def __init__(self):
+        self.committed = False
+
+# Set by the read-your-writes middleware; the threadpool copies the context, so sync handlers see it too
+current_request_writes: ContextVar[Optional[RequestWrites]] = ContextVar("current_request_writes", default=None)
+
+@event.listens_for(SessionLocal, "after_flush")
+def _mark_orm_write(session, flush_context):
+    changed = list(session.new) + list(session.dirty) + list(session.deleted)
+    if any(instance.__tablename__ not in REPLICA_LAG_EXEMPT_TABLES for instance in changed):
+        session.info["has_writes"] = True
+
+@event.listens_for(SessionLocal, "do_orm_execute")
+def _mark_bulk_write(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        mapper = orm_execute_state.bind_mapper
+        if mapper is None or mapper.local_table.name not in REPLICA_LAG_EXEMPT_TABLES:
+            orm_execute_state.session.info["has_writes"] = True
+
+@event.listens_for(SessionLocal, "after_commit")
+def _record_primary_write(session):
+    global _last_primary_write
+    if session.info.pop("has_writes", False):
+        _last_primary_write = time.monotonic()
+        writes = current_request_writes.get()
+        if writes is not None:
+            writes.committed = True
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_writes(session):
+    session.info.pop("has_writes", None)
+
+def read_primary_until(cookie: Optional[str]) -> float:
+    """Epoch time until which the client's reads are pinned to the primary, from its READ_PRIMARY_COOKIE"""
+    try:
+        return float(cookie) if cookie else 0.0
+    except ValueError:
+        return 0.0
+
+def should_read_from_replica(pinned_until: float = 0.0) -> bool:
+    """
+    Whether read-only traffic can go to the replica: one is configured, the client
+    isn't pinned to the primary by a recent write of its own (`pinned_until`) and this
+    process hasn't committed a write within the last DB_REPLICA_LAG_SECONDS.
+    """
+    return (
+        ReplicaSessionLocal is not None
+        and time.time() >= pinned_until
+        and time.monotonic() - _last_primary_write >= settings.DB_REPLICA_LAG_SECONDS
+    )
+
+def get_read_session(pinned_until: float = 0.0) -> Session:
+    """Open a session for read-only work, on the replica when it is safe to"""
+    return ReplicaSessionLocal() if should_read_from_replica(pinned_until) else SessionLocal()
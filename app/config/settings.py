@@ -7,6 +7,22 @@ load_dotenv()
 
 # Database settings
 DATABASE_URL = os.getenv("DATABASE_URL", "")
+# Connection pool preset: "default" (long-running server), "serverless" (no pooling, e.g. Vercel)
+# or "pgbouncer" (no pooling behind an external transaction pooler). Defaults to "serverless" on Vercel.
+DB_POOL_PRESET = os.getenv("DB_POOL_PRESET", "serverless" if os.getenv("VERCEL") else "default").lower()
+# Optional overrides of the preset, left unset to use the preset's value
+DB_POOL_SIZE = os.getenv("DB_POOL_SIZE")
+DB_MAX_OVERFLOW = os.getenv("DB_MAX_OVERFLOW")
+DB_POOL_TIMEOUT = os.getenv("DB_POOL_TIMEOUT")
+DB_POOL_RECYCLE = os.getenv("DB_POOL_RECYCLE")
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING")
+# Server-side statement timeout in milliseconds (0 disables it) and the connect timeout in seconds
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))
+DB_CONNECT_TIMEOUT = int(os.getenv("DB_CONNECT_TIMEOUT", "10"))
+# Optional read replica serving public reads and chatbot retrieval, and how long after a write
+# this process keeps reading from the primary so visitors don't see data the replica hasn't replayed yet
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL", "")
+DB_REPLICA_LAG_SECONDS = float(os.getenv("DB_REPLICA_LAG_SECONDS", "5"))
 
 # API settings
 API_PREFIX = os.getenv("API_PREFIX", "/api/v1")
@@ -16,6 +32,67 @@ DEBUG = os.getenv("DEBUG", "False").lower() == "true"
 MAX_DB_RETRIES = int(os.getenv("MAX_DB_RETRIES", "3"))
 RETRY_BACKOFF = float(os.getenv("RETRY_BACKOFF", "0.5"))
 
+# Query inspector (development and tests): counts the SQL statements of each request, logs statement
+# shapes repeated at least QUERY_N_PLUS_ONE_THRESHOLD times as likely N+1 queries, and checks route budgets.
+# QUERY_BUDGET_DEFAULT applies to routes without a budget (0 = none), QUERY_BUDGET_STRICT fails overruns.
+QUERY_INSPECTOR_ENABLED = os.getenv("QUERY_INSPECTOR_ENABLED", str(DEBUG)).lower() == "true"
+QUERY_N_PLUS_ONE_THRESHOLD = int(os.getenv("QUERY_N_PLUS_ONE_THRESHOLD", "3"))
+QUERY_BUDGET_DEFAULT = int(os.getenv("QUERY_BUDGET_DEFAULT", "0"))
+QUERY_BUDGET_STRICT = os.getenv("QUERY_BUDGET_STRICT", "False").lower() == "true"
+
+# Cache settings
+PUBLIC_DATA_CACHE_TTL = int(os.getenv("PUBLIC_DATA_CACHE_TTL", "300"))
+# Chatbot query embeddings: in-memory LRU size, TTL, and whether the Postgres table backs the cache
+QUERY_EMBEDDING_CACHE_SIZE = int(os.getenv("QUERY_EMBEDDING_CACHE_SIZE", "1000"))
+QUERY_EMBEDDING_CACHE_TTL = int(os.getenv("QUERY_EMBEDDING_CACHE_TTL", "86400"))
+QUERY_EMBEDDING_CACHE_PERSIST = os.getenv("QUERY_EMBEDDING_CACHE_PERSIST", "False").lower() == "true"
+# Chatbot answers reused for near-duplicate first questions: cache size, TTL and minimum cosine similarity
+CHAT_ANSWER_CACHE_SIZE = int(os.getenv("CHAT_ANSWER_CACHE_SIZE", "500"))
+CHAT_ANSWER_CACHE_TTL = int(os.getenv("CHAT_ANSWER_CACHE_TTL", "3600"))
+CHAT_ANSWER_CACHE_THRESHOLD = float(os.getenv("CHAT_ANSWER_CACHE_THRESHOLD", "0.95"))
+
+# Asset settings
+# Public origin of this API, used to build absolute asset URLs (e.g. https://api.your-domain.com)
+ASSET_BASE_URL = os.getenv("ASSET_BASE_URL", "").rstrip("/")
+# Widths (in pixels) of the WebP variants generated for uploaded project images and avatars
+IMAGE_VARIANT_WIDTHS = [int(width) for width in os.getenv("IMAGE_VARIANT_WIDTHS", "320,640,1280").split(",") if width.strip()]
+IMAGE_VARIANT_QUALITY = int(os.getenv("IMAGE_VARIANT_QUALITY", "80"))
+
+# Outbound HTTP client settings, shared by the GitHub and Mailgun integrations
+HTTP_TIMEOUT_SECONDS = float(os.getenv("HTTP_TIMEOUT_SECONDS", "15"))
+HTTP_CONNECT_TIMEOUT_SECONDS = float(os.getenv("HTTP_CONNECT_TIMEOUT_SECONDS", "5"))
+# Connection pool size per integration, and how long idle connections are kept alive
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "10"))
+HTTP_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", "30"))
+
+# GitHub refresh settings
+# Number of projects refreshed concurrently by the scheduled batch refresh
+GITHUB_REFRESH_CONCURRENCY = int(os.getenv("GITHUB_REFRESH_CONCURRENCY", "8"))
+# Number of refreshed projects written per commit
+GITHUB_REFRESH_BATCH_SIZE = int(os.getenv("GITHUB_REFRESH_BATCH_SIZE", "20"))
+# Retries of rate limited (403/429) GitHub requests, and the longest backoff we are willing to wait
+GITHUB_MAX_RETRIES = int(os.getenv("GITHUB_MAX_RETRIES", "2"))
+GITHUB_MAX_BACKOFF_SECONDS = float(os.getenv("GITHUB_MAX_BACKOFF_SECONDS", "60"))
+
+# Vector search settings
+# Distance metric of the chatbot vector search ("l2", "cosine" or "inner_product"), the ANN index is built for it
+VECTOR_DISTANCE_METRIC = os.getenv("VECTOR_DISTANCE_METRIC", "cosine")
+# ANN index type created by the migration ("hnsw", or "ivfflat" on pgvector < 0.5) and the default per-query tuning
+VECTOR_INDEX_TYPE = os.getenv("VECTOR_INDEX_TYPE", "hnsw")
+VECTOR_HNSW_EF_SEARCH = int(os.getenv("VECTOR_HNSW_EF_SEARCH", "40"))
+VECTOR_IVFFLAT_LISTS = int(os.getenv("VECTOR_IVFFLAT_LISTS", "100"))
+VECTOR_IVFFLAT_PROBES = int(os.getenv("VECTOR_IVFFLAT_PROBES", "10"))
+# Vector sync: texts per embed_documents call and concurrent calls
+VECTOR_EMBED_BATCH_SIZE = int(os.getenv("VECTOR_EMBED_BATCH_SIZE", "100"))
+VECTOR_EMBED_CONCURRENCY = int(os.getenv("VECTOR_EMBED_CONCURRENCY", "4"))
+# Quiet period after the last admin change before the touched records are re-embedded
+VECTOR_INDEX_DEBOUNCE_SECONDS = float(os.getenv("VECTOR_INDEX_DEBOUNCE_SECONDS", "5"))
+
+# LLM settings
+# Build the shared LLM clients (and make one small embedding call) at startup
+LLM_WARM_UP = os.getenv("LLM_WARM_UP", "True").lower() == "true"
+
 # Authentication settings
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "YOUR_DEFAULT_SECRET_KEY_CHANGE_THIS")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
@@ -35,6 +112,14 @@ ADMIN_EMAIL = os.getenv("ADMIN_EMAIL", "your-email@domain.com")
 MAILGUN_NOTIFICATION_TEMPLATE_ID = os.getenv("MAILGUN_NOTIFICATION_TEMPLATE_ID", "test-id")
 MAILGUN_CONFIRMATION_TEMPLATE_ID = os.getenv("MAILGUN_CONFIRMATION_TEMPLATE_ID", "test-id")
 
+# Email outbox settings
+# How often the outbox worker polls for due emails, and how many it delivers per poll
+EMAIL_OUTBOX_POLL_SECONDS = float(os.getenv("EMAIL_OUTBOX_POLL_SECONDS", "30"))
+EMAIL_OUTBOX_BATCH_SIZE = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", "20"))
+# Delivery attempts before an email is marked failed, with exponential backoff between them
+EMAIL_MAX_ATTEMPTS = int(os.getenv("EMAIL_MAX_ATTEMPTS", "5"))
+EMAIL_RETRY_BACKOFF_SECONDS = float(os.getenv("EMAIL_RETRY_BACKOFF_SECONDS", "30"))
+
 # CORS settings
 def get_cors_origins() -> List[str]:
     cors_origins = os.getenv("CORS_ORIGINS", "*")
@@ -47,10 +132,48 @@ CORS_ORIGINS = get_cors_origins()
 # Create a settings class for compatibility, but using variables directly
 class Settings:
     DATABASE_URL = DATABASE_URL
+    DB_POOL_PRESET = DB_POOL_PRESET
+    DB_POOL_SIZE = DB_POOL_SIZE
+    DB_MAX_OVERFLOW = DB_MAX_OVERFLOW
+    DB_POOL_TIMEOUT = DB_POOL_TIMEOUT
+    DB_POOL_RECYCLE = DB_POOL_RECYCLE
+    DB_POOL_PRE_PING = DB_POOL_PRE_PING
+    DB_STATEMENT_TIMEOUT_MS = DB_STATEMENT_TIMEOUT_MS
+    DB_CONNECT_TIMEOUT = DB_CONNECT_TIMEOUT
+    DATABASE_REPLICA_URL = DATABASE_REPLICA_URL
+    DB_REPLICA_LAG_SECONDS = DB_REPLICA_LAG_SECONDS
     API_PREFIX = API_PREFIX
     DEBUG = DEBUG
     MAX_DB_RETRIES = MAX_DB_RETRIES
     RETRY_BACKOFF = RETRY_BACKOFF
+    QUERY_INSPECTOR_ENABLED = QUERY_INSPECTOR_ENABLED
+    QUERY_N_PLUS_ONE_THRESHOLD = QUERY_N_PLUS_ONE_THRESHOLD
+    QUERY_BUDGET_DEFAULT = QUERY_BUDGET_DEFAULT
+    QUERY_BUDGET_STRICT = QUERY_BUDGET_STRICT
+    PUBLIC_DATA_CACHE_TTL = PUBLIC_DATA_CACHE_TTL
+    QUERY_EMBEDDING_CACHE_SIZE = QUERY_EMBEDDING_CACHE_SIZE
+    QUERY_EMBEDDING_CACHE_TTL = QUERY_EMBEDDING_CACHE_TTL
+    QUERY_EMBEDDING_CACHE_PERSIST = QUERY_EMBEDDING_CACHE_PERSIST
+    CHAT_ANSWER_CACHE_SIZE = CHAT_ANSWER_CACHE_SIZE
+    CHAT_ANSWER_CACHE_TTL = CHAT_ANSWER_CACHE_TTL
+    CHAT_ANSWER_CACHE_THRESHOLD = CHAT_ANSWER_CACHE_THRESHOLD
+    ASSET_BASE_URL = ASSET_BASE_URL
+    IMAGE_VARIANT_WIDTHS = IMAGE_VARIANT_WIDTHS
+    IMAGE_VARIANT_QUALITY = IMAGE_VARIANT_QUALITY
+    HTTP_TIMEOUT_SECONDS = HTTP_TIMEOUT_SECONDS
+    HTTP_CONNECT_TIMEOUT_SECONDS = HTTP_CONNECT_TIMEOUT_SECONDS
+    HTTP_MAX_CONNECTIONS = HTTP_MAX_CONNECTIONS
+    HTTP_MAX_KEEPALIVE_CONNECTIONS = HTTP_MAX_KEEPALIVE_CONNECTIONS
+    HTTP_KEEPALIVE_EXPIRY_SECONDS = HTTP_KEEPALIVE_EXPIRY_SECONDS
+    GITHUB_REFRESH_CONCURRENCY = GITHUB_REFRESH_CONCURRENCY
+    GITHUB_REFRESH_BATCH_SIZE = GITHUB_REFRESH_BATCH_SIZE
+    GITHUB_MAX_RETRIES = GITHUB_MAX_RETRIES
+    GITHUB_MAX_BACKOFF_SECONDS = GITHUB_MAX_BACKOFF_SECONDS
+    VECTOR_DISTANCE_METRIC = VECTOR_DISTANCE_METRIC
+    VECTOR_INDEX_TYPE = VECTOR_INDEX_TYPE
+    VECTOR_HNSW_EF_SEARCH = VECTOR_HNSW_EF_SEARCH
+    VECTOR_IVFFLAT_LISTS = VECTOR_IVFFLAT_LISTS
+    VECTOR_IVFFLAT_PROBES = VECTOR_IVFFLAT_PROBES
     CORS_ORIGINS = CORS_ORIGINS
     JWT_SECRET_KEY = JWT_SECRET_KEY
     ACCESS_TOKEN_EXPIRE_MINUTES = ACCESS_TOKEN_EXPIRE_MINUTES
@@ -69,10 +192,20 @@ class Settings:
     ADMIN_EMAIL = ADMIN_EMAIL
     MAILGUN_NOTIFICATION_TEMPLATE_ID = MAILGUN_NOTIFICATION_TEMPLATE_ID
     MAILGUN_CONFIRMATION_TEMPLATE_ID = MAILGUN_CONFIRMATION_TEMPLATE_ID
+    EMAIL_OUTBOX_POLL_SECONDS = EMAIL_OUTBOX_POLL_SECONDS
+    EMAIL_OUTBOX_BATCH_SIZE = EMAIL_OUTBOX_BATCH_SIZE
+    EMAIL_MAX_ATTEMPTS = EMAIL_MAX_ATTEMPTS
+    EMAIL_RETRY_BACKOFF_SECONDS = EMAIL_RETRY_BACKOFF_SECONDS
 
     # LLM settings
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
     GEMINI_MODEL = os.getenv("GEMINI_MODEL", "")
     GEMINI_EMBEDDING_MODEL = os.getenv("GEMINI_EMBEDDING_MODEL", "")
+    LLM_WARM_UP = LLM_WARM_UP
+
+    # Vector sync settings
+    VECTOR_EMBED_BATCH_SIZE = VECTOR_EMBED_BATCH_SIZE
+    VECTOR_EMBED_CONCURRENCY = VECTOR_EMBED_CONCURRENCY
+    VECTOR_INDEX_DEBOUNCE_SECONDS = VECTOR_INDEX_DEBOUNCE_SECONDS
 
 settings = Settings()
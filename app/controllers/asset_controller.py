@@ -0,0 +1,42 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Request, Response
+from sqlalchemy.orm import Session
+from app.dependencies.database import get_read_db
+from app.services.asset_service import AssetService
+from app.utils.http_cache import is_not_modified
+from app.utils.query_inspector import query_budget
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/assets",
+    tags=["Assets"]
+)
+
+# Assets are addressed by their content hash, so a URL never changes its content
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+@router.get("/{asset_hash}")
+@query_budget(1)
+def get_asset(
+    request: Request,
+    asset_hash: str = Path(..., pattern=r"^[0-9a-f]{64}$"),
+    db: Session = Depends(get_read_db)
+):
+    """Serve a stored asset as raw bytes (public endpoint, no authentication required)"""
+    etag = f'"{asset_hash}"'
+    headers = {"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+    
+    # The content behind a hash can't change, so there is no need to hit the database
+    if is_not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    service = AssetService(db)
+    asset = service.get_asset(asset_hash)
+    if not asset:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Asset {asset_hash} not found"
+        )
+    
+    return Response(content=asset.data, media_type=asset.content_type, headers=headers)
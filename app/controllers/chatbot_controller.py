@@ -1,13 +1,18 @@
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, HTTPException
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
+from app.config.database import READ_PRIMARY_COOKIE, get_read_session, read_primary_until
 from app.dependencies.database import get_db
 from app.services.vector_service import VectorService
-from app.utils.llm_factory import LLMFactory
+from app.utils.llm_factory import llm_clients
 from app.repositories.chat_repository import ChatRepository
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
 from app.dependencies.auth import get_current_user
 from app.models.user_model import User
+from app.utils.pagination import parse_cursor
+from app.utils.answer_cache import answer_cache
+from app.utils.db_utils import run_db
+from app.utils.metrics import ChatTurnTimer, observe_outbound
 from typing import List, Optional
 import logging
 
@@ -21,11 +26,15 @@ router = APIRouter(
 logger = logging.getLogger(__name__)
 settings = Settings()
 
+# Characters per chunk when replaying a cached answer
+ANSWER_REPLAY_CHUNK_SIZE = 40
+
 @router.post("/sync")
 def sync_context(db: Session = Depends(get_db)):
     """
-    Triggers a manual refresh of the Vector Store.
-    Fetches all Projects, Skills, etc., and re-generates embeddings.
+    Triggers a full incremental sync of the Vector Store.
+    Admin changes are already indexed as they happen, so this is a repair tool:
+    it re-embeds whatever changed since the last sync and drops stale vectors.
     """
     service = VectorService(db)
     try:
@@ -34,23 +43,36 @@ def sync_context(db: Session = Depends(get_db)):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/health")
+def get_llm_health(current_user: User = Depends(get_current_user)):
+    """
+    Report the shared LLM and embeddings clients: when they were built,
+    how long that took, and the latency or error of the startup warm-up.
+    """
+    return llm_clients.health()
+
 @router.get("/sessions")
 def get_chat_sessions(
+    response: Response,
     limit: int = 50, 
     offset: int = 0, 
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Fetch all chat sessions for the admin dashboard.
+    Fetch chat sessions for the admin dashboard, newest first.
     Returns session details including message count and last active time.
+    The cursor of the next page is sent in the X-Next-Cursor header.
     """
     repo = ChatRepository(db)
-    results = repo.get_all_sessions(limit, offset)
+    page = repo.get_all_sessions(limit, offset, after=parse_cursor(cursor))
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
     
     # Format the response
     sessions = []
-    for session, count, last_active in results:
+    for session, count, last_active in page.items:
         sessions.append({
             "id": str(session.id),
             "created_at": session.created_at,
@@ -93,10 +115,11 @@ def get_session_messages(
 async def websocket_endpoint(websocket: WebSocket, db: Session = Depends(get_db)):
     await websocket.accept()
     
-    service = VectorService(db)
-    # Instantiate the LLM (Gemini by default)
+    # Chat history is written to the primary, retrieval gets a read session per turn
+    service = await run_db(VectorService, db)
+    # Shared LLM client (Gemini by default), only built by the first connection
     try:
-        llm = LLMFactory.create_chat_model("gemini")
+        llm = llm_clients.get_chat_model("gemini")
     except Exception as e:
         await websocket.send_text(f"Error initializing LLM: {str(e)}")
         await websocket.close()
@@ -108,11 +131,11 @@ async def websocket_endpoint(websocket: WebSocket, db: Session = Depends(get_db)
     session_id = websocket.query_params.get("session_id")
     
     # Check if session actually exists first (explicit check as requested)
-    existing_session = chat_repo.get_session(session_id)
+    existing_session = await run_db(chat_repo.get_session, session_id)
     
     recent_msgs = []
     if existing_session:
-        recent_msgs = chat_repo.get_recent_messages(session_id)
+        recent_msgs = await run_db(chat_repo.get_recent_messages, session_id)
     
     # Send history to frontend
     history_payload = [{"sender": m.sender, "text": m.content} for m in recent_msgs]
@@ -126,14 +149,18 @@ async def websocket_endpoint(websocket: WebSocket, db: Session = Depends(get_db)
             chat_history.append(HumanMessage(content=m.content))
         else:
             chat_history.append(AIMessage(content=m.content))
+
+    # End the history read transaction, so an idle chat doesn't keep a pooled connection
+    await run_db(db.rollback)
     
     try:
         while True:
             # 1. Receive User Message
             data = await websocket.receive_text()
+            turn_timer = ChatTurnTimer()
             
             # Save User Message
-            chat_repo.add_message(session_id, "user", data)
+            await run_db(chat_repo.add_message, session_id, "user", data)
             
             # 1.5. Intent Classification (Filter Logic)
             # Heuristic map to identify filters from query keywords.
@@ -160,46 +187,79 @@ async def websocket_endpoint(websocket: WebSocket, db: Session = Depends(get_db)
 
             print(f"DEBUG: Detected Filters: {filters}")
 
-            # 2. Retrieve Context (RAG)
-            # Find top relevant documents (Increased to 100 to fit "all" docs for Gemini Context)
-            relevant_docs = service.search(data, limit=100, filters=filters)
+            # Short-lived read session (replica when safe, chosen again every turn), closed
+            # as soon as retrieval is done so the connection isn't held while the answer streams
+            read_db = get_read_session(read_primary_until(websocket.cookies.get(READ_PRIMARY_COOKIE)))
+            service.read_db = read_db
+            try:
+                # 1.75. Semantic Answer Cache
+                # First questions are mostly FAQ-style, so a near-duplicate of an earlier first
+                # question is answered from the cache as long as the vector store hasn't changed.
+                # Follow-up questions depend on the conversation and always go to the LLM.
+                cacheable = not chat_history and answer_cache.enabled
+                cached_answer = None
+                if cacheable:
+                    question_vector = await run_db(service.get_query_embedding, data)
+                    index_version = await run_db(service.get_index_version)
+                    cached_answer = answer_cache.lookup(question_vector, index_version)
+
+                if not cached_answer:
+                    # 2. Retrieve Context (RAG)
+                    # Find top relevant documents (Increased to 100 to fit "all" docs for Gemini Context)
+                    relevant_docs = await run_db(service.search, data, limit=100, filters=filters)
+                    turn_timer.mark_retrieval()
+            finally:
+                await run_db(read_db.close)
+
+            if cached_answer:
+                # Replay the cached answer as a stream of chunks
+                full_response = cached_answer
+                turn_timer.mark_first_token()
+                for start in range(0, len(cached_answer), ANSWER_REPLAY_CHUNK_SIZE):
+                    await websocket.send_json({"type": "content", "payload": cached_answer[start:start + ANSWER_REPLAY_CHUNK_SIZE]})
+            else:
+                # DEBUG LOGGING
+                if settings.DEBUG:
+                    logger.info(f"\n--- User Query: {data} ---")
+                    logger.info(f"--- Retrieved {len(relevant_docs)} Docs ---")
+                    for i, doc in enumerate(relevant_docs):
+                        logger.info(f"Doc {i+1}: {doc.content[:100]}...")
+                    logger.info("--------------------------------\n")
+
+                context_text = "\n\n".join([doc.content for doc in relevant_docs])
             
-            # DEBUG LOGGING
-            if settings.DEBUG:
-                logger.info(f"\n--- User Query: {data} ---")
-                logger.info(f"--- Retrieved {len(relevant_docs)} Docs ---")
-                for i, doc in enumerate(relevant_docs):
-                    logger.info(f"Doc {i+1}: {doc.content[:100]}...")
-                logger.info("--------------------------------\n")
-
-            context_text = "\n\n".join([doc.content for doc in relevant_docs])
+                # 3. Construct Prompt with Context
+                system_prompt = f"""You are a helpful portfolio assistant for Daryl Fernandes.
+                Use the following context to answer the user's question.
+                If the answer is not in the context, just say you don't know, but be friendly.
             
-            # 3. Construct Prompt with Context
-            system_prompt = f"""You are a helpful portfolio assistant for Daryl Fernandes.
-            Use the following context to answer the user's question.
-            If the answer is not in the context, just say you don't know, but be friendly.
+                CONTEXT:
+                {context_text}
+                """
             
-            CONTEXT:
-            {context_text}
-            """
+                # 4. Stream Response from LLM
+                # We use the LangChain invoke/stream method
+                # Reconstruct messages with History
+                messages = [SystemMessage(content=system_prompt)] + chat_history + [HumanMessage(content=data)]
             
-            # 4. Stream Response from LLM
-            # We use the LangChain invoke/stream method
-            # Reconstruct messages with History
-            messages = [SystemMessage(content=system_prompt)] + chat_history + [HumanMessage(content=data)]
+                full_response = ""
+                with observe_outbound("gemini", "chat_stream"):
+                    async for chunk in llm.astream(messages):
+                        if chunk.content:
+                            turn_timer.mark_first_token()
+                            full_response += chunk.content
+                            # Send JSON structure
+                            await websocket.send_json({"type": "content", "payload": chunk.content})
             
-            full_response = ""
-            async for chunk in llm.astream(messages):
-                if chunk.content:
-                    full_response += chunk.content
-                    # Send JSON structure
-                    await websocket.send_json({"type": "content", "payload": chunk.content})
+                if cacheable:
+                    answer_cache.store(question_vector, full_response, index_version)
             
             # Send End of Stream signal
             await websocket.send_json({"type": "end"})
+            turn_timer.finish("cache" if cached_answer else "llm")
             
             # Save Bot Message
-            chat_repo.add_message(session_id, "bot", full_response)
+            await run_db(chat_repo.add_message, session_id, "bot", full_response)
             
             # 5. Update History (In-Memory)
             # Keep only last 20 turns for context window
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, HTTPException, Request, Depends
+from fastapi import APIRouter, HTTPException, Request, Depends, status
 from typing import List, Dict, Optional
 from sqlalchemy.orm import Session
 # from app.utils.sendgrid_utils import SendGridEmail
-from app.utils.mailgun_utils import MailgunEmail
+from app.jobs.email_outbox import queue_emails
 from app.dependencies.database import get_db
+from app.utils.db_utils import run_db
 from app.models.user_model import User
 from app.schemas.contact_schema import SocialLink, ContactRequest
 from uuid import UUID
@@ -11,18 +12,20 @@ from app.config.settings import CORS_ORIGINS
 
 router = APIRouter(tags=["Contact"])
 
-@router.post("/contact/{user_id}")
+@router.post("/contact/{user_id}", status_code=status.HTTP_202_ACCEPTED)
 async def send_contact_email(
     user_id: UUID,
     contact_data: ContactRequest,
     request: Request,
     db: Session = Depends(get_db)
 ):
+    """
+    Queue the confirmation and admin notification emails of a contact form submission.
+    The emails are delivered by the background outbox worker, so the response doesn't wait on Mailgun.
+    """
     try:
-        email_sender = MailgunEmail()
-        
         # Get the specific user from the database using user_id
-        user = db.query(User).filter(User.id == user_id).first()
+        user = await run_db(lambda: db.query(User).filter(User.id == user_id).first())
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
         
@@ -35,27 +38,36 @@ async def send_contact_email(
         # Get full name
         full_name = f"{user.name} {user.surname}" if user.name and user.surname else user.name or user.username
         
-        # Send confirmation email to user
-        email_sender.send_confirmation_email(
-            name=contact_data.name,
-            email=contact_data.email,
-            subject=contact_data.subject,
-            message=contact_data.message,
-            social_links=social_links,
-            portfolio_url=portfolio_url,
-            your_name=full_name
-        )
-        
-        # Send notification email to admin
-        email_sender.send_notification_email(
-            name=contact_data.name,
-            email=contact_data.email,
-            subject=contact_data.subject,
-            message=contact_data.message,
-            your_name=full_name
-        )
+        await run_db(queue_emails, db, [
+            # Confirmation email to the user
+            {
+                "kind": "confirmation",
+                "payload": {
+                    "name": contact_data.name,
+                    "email": contact_data.email,
+                    "subject": contact_data.subject,
+                    "message": contact_data.message,
+                    "social_links": social_links,
+                    "portfolio_url": portfolio_url,
+                    "your_name": full_name
+                }
+            },
+            # Notification email to the admin
+            {
+                "kind": "notification",
+                "payload": {
+                    "name": contact_data.name,
+                    "email": contact_data.email,
+                    "subject": contact_data.subject,
+                    "message": contact_data.message,
+                    "your_name": full_name
+                }
+            }
+        ])
         
-        return {"message": "Emails sent successfully"}
+        return {"message": "Emails queued for delivery"}
         
+    except HTTPException:
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) 
+        raise HTTPException(status_code=500, detail=str(e))
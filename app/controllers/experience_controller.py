@@ -1,6 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
-from app.dependencies.database import get_db
+from app.dependencies.database import get_db, get_read_db
 from app.dependencies.auth import get_current_user
 from app.models.user_model import User
 from app.services.experience_service import ExperienceService
@@ -8,6 +8,10 @@ from app.schemas.experience_schema import (
     ExperienceCreate, ExperienceUpdate, ExperienceResponse,
     ExperienceListResponse, ExperienceVisibilityUpdate
 )
+from app.utils.http_cache import make_etag, conditional_response
+from app.utils.pagination import parse_cursor
+from app.utils.field_selection import parse_fields, sparse_response
+from app.utils.query_inspector import query_budget
 from typing import Optional
 import logging
 import uuid
@@ -31,13 +35,19 @@ def create_experience(
 
 @router.get("", response_model=ExperienceListResponse)
 def get_experiences(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor; takes precedence over skip"),
+    include_total: bool = Query(True, description="Set to false to skip counting the total number of rows"),
     type: Optional[str] = Query(None, description="Filter by type ('experience' or 'education')"),
+    fields: Optional[str] = Query(None, description="Comma separated list of fields to return, e.g. \"id,title\"; only those columns are loaded"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get all experiences and education entries including hidden ones (requires authentication)"""
+    selected_fields = parse_fields(fields, ExperienceResponse)
+    after = parse_cursor(cursor)
     service = ExperienceService(db)
     
     if type:
@@ -46,29 +56,52 @@ def get_experiences(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Type must be either 'experience' or 'education'"
             )
-        return service.get_experiences_by_type(type, skip, limit, only_visible=False)
+        result = service.get_experiences_by_type(type, skip, limit, only_visible=False, fields=selected_fields, after=after, include_total=include_total)
+    else:
+        result = service.get_experiences(skip, limit, only_visible=False, fields=selected_fields, after=after, include_total=include_total)
     
-    return service.get_experiences(skip, limit, only_visible=False)
+    return sparse_response(result, response) if selected_fields else result
 
 @router.get("/public", response_model=ExperienceListResponse)
+@query_budget(3)
 def get_public_experiences(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor; takes precedence over skip"),
+    include_total: bool = Query(True, description="Set to false to skip counting the total number of rows"),
     type: Optional[str] = Query(None, description="Filter by type ('experience' or 'education')"),
-    db: Session = Depends(get_db)
+    fields: Optional[str] = Query(None, description="Comma separated list of fields to return, e.g. \"id,title\"; only those columns are loaded"),
+    db: Session = Depends(get_read_db)
 ):
-    """Get only visible experiences and education entries (public endpoint, no authentication required)"""
+    """
+    Get only visible experiences and education entries (public endpoint, no authentication required).
+    Supports conditional requests via If-None-Match and
+    sparse fieldsets via `fields`.
+    """
+    selected_fields = parse_fields(fields, ExperienceResponse)
+    after = parse_cursor(cursor)
     service = ExperienceService(db)
     
+    if type and type not in ["experience", "education"]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Type must be either 'experience' or 'education'"
+        )
+    
+    last_modified, count = service.get_version(only_visible=True)
+    etag = make_etag("experiences", last_modified, count, skip, limit, cursor, include_total, type, selected_fields)
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+    
     if type:
-        if type not in ["experience", "education"]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Type must be either 'experience' or 'education'"
-            )
-        return service.get_experiences_by_type(type, skip, limit, only_visible=True)
+        result = service.get_experiences_by_type(type, skip, limit, only_visible=True, fields=selected_fields, after=after, include_total=include_total)
+    else:
+        result = service.get_experiences(skip, limit, only_visible=True, fields=selected_fields, after=after, include_total=include_total)
     
-    return service.get_experiences(skip, limit, only_visible=True)
+    return sparse_response(result, response) if selected_fields else result
 
 @router.get("/{experience_id}", response_model=ExperienceResponse)
 def get_experience(
@@ -1,6 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
-from app.dependencies.database import get_db
+from app.dependencies.database import get_db, get_read_db
 from app.dependencies.auth import get_current_user
 from app.models.user_model import User
 from app.services.project_category_service import ProjectCategoryService
@@ -10,6 +10,10 @@ from app.schemas.project_category_schema import (
     ProjectCategoryUpdate,
     ProjectCategoryCreate
 )
+from app.utils.http_cache import make_etag, conditional_response
+from app.utils.pagination import parse_cursor
+from app.utils.query_inspector import query_budget
+from typing import Optional
 import logging
 import uuid
 
@@ -34,22 +38,38 @@ def create_category(
 def get_categories(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor; takes precedence over skip"),
+    include_total: bool = Query(True, description="Set to false to skip counting the total number of rows"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get all project categories including hidden ones (requires authentication)"""
     service = ProjectCategoryService(db)
-    return service.get_categories(skip, limit, only_visible=False)
+    return service.get_categories(skip, limit, only_visible=False, after=parse_cursor(cursor), include_total=include_total)
 
 @router.get("/public", response_model=ProjectCategoryListResponse)
+@query_budget(3)
 def get_public_categories(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor; takes precedence over skip"),
+    include_total: bool = Query(True, description="Set to false to skip counting the total number of rows"),
+    db: Session = Depends(get_read_db)
 ):
-    """Get only visible project categories (public endpoint, no authentication required)"""
+    """
+    Get only visible project categories (public endpoint, no authentication required).
+    Supports conditional requests via If-None-Match.
+    """
+    after = parse_cursor(cursor)
     service = ProjectCategoryService(db)
-    return service.get_categories(skip, limit, only_visible=True)
+    last_modified, count = service.get_version(only_visible=True)
+    etag = make_etag("project_categories", last_modified, count, skip, limit, cursor, include_total)
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+    return service.get_categories(skip, limit, only_visible=True, after=after, include_total=include_total)
 
 @router.get("/{category_id}", response_model=ProjectCategoryResponse)
 def get_category(
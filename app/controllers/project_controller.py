@@ -1,13 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
-from app.dependencies.database import get_db
+from app.dependencies.database import get_db, get_read_db
 from app.dependencies.auth import get_current_user
 from app.models.user_model import User
 from app.services.project_service import ProjectService
 from app.schemas.project_schema import (
-    ProjectCreate, ProjectUpdate, ProjectResponse, 
-    ProjectListResponse, ProjectVisibilityUpdate
+    ProjectCreate, ProjectUpdate, ProjectResponse, ProjectWithDataResponse,
+    ProjectListResponse, ProjectVisibilityUpdate, ProjectDetailsResponse
 )
+from app.utils.http_cache import make_etag, conditional_response
+from app.utils.pagination import parse_cursor
+from app.utils.field_selection import parse_fields, sparse_response
+from app.utils.db_utils import run_db
+from app.utils.query_inspector import query_budget
 from typing import Optional
 import logging
 import uuid
@@ -19,7 +24,7 @@ router = APIRouter(
     tags=["Projects"]
 )
 
-@router.post("", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
+@router.post("", response_model=ProjectWithDataResponse, status_code=status.HTTP_201_CREATED)
 async def create_project(
     project_data: ProjectCreate,
     db: Session = Depends(get_db),
@@ -31,26 +36,77 @@ async def create_project(
 
 @router.get("", response_model=ProjectListResponse)
 async def get_projects(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor; takes precedence over skip"),
+    include_total: bool = Query(True, description="Set to false to skip counting the total number of rows"),
+    fields: Optional[str] = Query(None, description="Comma separated list of fields to return, e.g. \"id,title\"; only those columns are loaded"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get all projects including hidden ones (requires authentication)"""
+    selected_fields = parse_fields(fields, ProjectResponse)
     service = ProjectService(db)
-    return await service.get_projects(skip, limit, only_visible=False)
+    result = await service.get_projects(skip, limit, only_visible=False, fields=selected_fields, after=parse_cursor(cursor), include_total=include_total)
+    return sparse_response(result, response) if selected_fields else result
 
 @router.get("/public", response_model=ProjectListResponse)
+@query_budget(3)
 async def get_public_projects(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor; takes precedence over skip"),
+    include_total: bool = Query(True, description="Set to false to skip counting the total number of rows"),
+    fields: Optional[str] = Query(None, description="Comma separated list of fields to return, e.g. \"id,title\"; only those columns are loaded"),
+    db: Session = Depends(get_read_db)
 ):
-    """Get only visible projects (public endpoint, no authentication required)"""
+    """
+    Get only visible projects (public endpoint, no authentication required).
+    Supports conditional requests via If-None-Match and
+    sparse fieldsets via `fields`.
+    """
+    selected_fields = parse_fields(fields, ProjectResponse)
+    after = parse_cursor(cursor)
     service = ProjectService(db)
-    return await service.get_projects(skip, limit, only_visible=True)
+    last_modified, count = await run_db(service.get_version, only_visible=True)
+    etag = make_etag("projects", last_modified, count, skip, limit, cursor, include_total, selected_fields)
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+    result = await service.get_projects(skip, limit, only_visible=True, fields=selected_fields, after=after, include_total=include_total)
+    return sparse_response(result, response) if selected_fields else result
+
+@router.get("/public/{project_id}/details", response_model=ProjectDetailsResponse)
+@query_budget(1)
+def get_public_project_details(
+    project_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_read_db)
+):
+    """
+    Get the README, language breakdown and repository stats of a visible project
+    (public endpoint, no authentication required). The project lists leave this
+    data out so it can be fetched lazily, e.g. when a project modal is opened.
+    Supports conditional requests via If-None-Match / If-Modified-Since.
+    """
+    service = ProjectService(db)
+    details = service.get_public_project_details(project_id)
+    if not details:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project with ID {project_id} not found or not visible"
+        )
+    etag = make_etag("project-details", project_id, details.updated_at)
+    not_modified = conditional_response(request, response, etag, details.updated_at)
+    if not_modified:
+        return not_modified
+    return details
 
-@router.get("/{project_id}", response_model=ProjectResponse)
+@router.get("/{project_id}", response_model=ProjectWithDataResponse)
 async def get_project(
     project_id: uuid.UUID,
     db: Session = Depends(get_db),
@@ -81,7 +137,7 @@ async def get_project(
 #         )
 #     return project
 
-@router.put("/{project_id}", response_model=ProjectResponse)
+@router.put("/{project_id}", response_model=ProjectWithDataResponse)
 async def update_project(
     project_id: uuid.UUID,
     project_data: ProjectUpdate,
@@ -116,7 +172,7 @@ def update_project_visibility(
     return updated_project
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_project(
+def delete_project(
     project_id: uuid.UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -130,7 +186,7 @@ async def delete_project(
             detail=f"Project with ID {project_id} not found"
         )
 
-@router.post("/{project_id}/refresh", response_model=ProjectResponse)
+@router.post("/{project_id}/refresh", response_model=ProjectWithDataResponse)
 async def refresh_project(
     project_id: uuid.UUID,
     db: Session = Depends(get_db),
@@ -142,8 +198,8 @@ async def refresh_project(
     """
     service = ProjectService(db)
     
-    # Check if project exists
-    project = await service.get_project(project_id)
+    # Check if project exists, without get_project's background refresh of expired data
+    project = await run_db(service.repository.get_by_id, project_id)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
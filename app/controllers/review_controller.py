@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
-from app.dependencies.database import get_db
+from app.dependencies.database import get_db, get_read_db
 from app.dependencies.auth import get_current_user
 from app.models.user_model import User
 from app.services.review_service import ReviewService
 from app.schemas.review_schema import ReviewCreate, ReviewResponse, ReviewListResponse, ReviewVisibilityUpdate
+from app.utils.http_cache import make_etag, conditional_response
+from app.utils.pagination import parse_cursor
+from app.utils.field_selection import parse_fields, sparse_response
+from app.utils.query_inspector import query_budget
 from typing import Optional
 import logging
 import uuid
@@ -27,24 +31,48 @@ def create_review(
 
 @router.get("", response_model=ReviewListResponse)
 def get_reviews(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor; takes precedence over skip"),
+    include_total: bool = Query(True, description="Set to false to skip counting the total number of rows"),
+    fields: Optional[str] = Query(None, description="Comma separated list of fields to return, e.g. \"id,title\"; only those columns are loaded"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get all reviews including hidden ones (requires authentication)"""
+    selected_fields = parse_fields(fields, ReviewResponse)
     service = ReviewService(db)
-    return service.get_reviews(skip, limit, only_visible=False)
+    result = service.get_reviews(skip, limit, only_visible=False, fields=selected_fields, after=parse_cursor(cursor), include_total=include_total)
+    return sparse_response(result, response) if selected_fields else result
 
 @router.get("/public", response_model=ReviewListResponse)
+@query_budget(3)
 def get_public_reviews(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor; takes precedence over skip"),
+    include_total: bool = Query(True, description="Set to false to skip counting the total number of rows"),
+    fields: Optional[str] = Query(None, description="Comma separated list of fields to return, e.g. \"id,title\"; only those columns are loaded"),
+    db: Session = Depends(get_read_db)
 ):
-    """Get only visible reviews (public endpoint, no authentication required)"""
+    """
+    Get only visible reviews (public endpoint, no authentication required).
+    Supports conditional requests via If-None-Match and
+    sparse fieldsets via `fields`.
+    """
+    selected_fields = parse_fields(fields, ReviewResponse)
+    after = parse_cursor(cursor)
     service = ReviewService(db)
-    return service.get_reviews(skip, limit, only_visible=True)
+    last_modified, count = service.get_version(only_visible=True)
+    etag = make_etag("reviews", last_modified, count, skip, limit, cursor, include_total, selected_fields)
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+    result = service.get_reviews(skip, limit, only_visible=True, fields=selected_fields, after=after, include_total=include_total)
+    return sparse_response(result, response) if selected_fields else result
 
 @router.get("/{review_id}", response_model=ReviewResponse)
 def get_review(
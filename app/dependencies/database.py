@@ -1,6 +1,7 @@
 from typing import Generator
+from fastapi import Request
 from sqlalchemy.orm import Session
-from app.config.database import SessionLocal
+from app.config.database import READ_PRIMARY_COOKIE, SessionLocal, get_read_session, read_primary_until
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -12,3 +13,15 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+def get_read_db(request: Request) -> Generator[Session, None, None]:
+    """
+    Read-only database session dependency for public endpoints.
+    Uses the read replica when one is configured, unless the client wrote public
+    content within the replica lag window (READ_PRIMARY_COOKIE) or this process did.
+    """
+    db = get_read_session(read_primary_until(request.cookies.get(READ_PRIMARY_COOKIE)))
+    try:
+        yield db
+    finally:
+        db.close()
@@ -0,0 +1,144 @@
+import asyncio
+import logging
+import httpx
+from datetime import datetime, timezone, timedelta
+from typing import Any, Dict, List, Optional
+from sqlalchemy.orm import Session
+from app.config.database import SessionLocal
+from app.config.settings import settings
+from app.models.email_outbox_model import EmailOutbox
+from app.repositories.email_outbox_repository import EmailOutboxRepository, ClaimedEmail
+from app.utils.db_utils import run_db
+from app.utils.mailgun_utils import MailgunEmail
+
+logger = logging.getLogger(__name__)
+
+# How long a claimed email is reserved for the worker sending it. If the process dies
+# before recording the outcome, the email becomes due again after the lease.
+DELIVERY_LEASE_SECONDS = 300
+
+def _is_permanent_error(error: Exception) -> bool:
+    """Client errors other than 408/429 won't succeed on retry"""
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+        return 400 <= status_code < 500 and status_code not in (408, 429)
+    return False
+
+class EmailOutboxWorker:
+    """
+    Delivers the emails queued in the `email_outbox` table in the background.
+
+    The worker wakes up every EMAIL_OUTBOX_POLL_SECONDS, or right away when
+    `notify()` is called after new emails were queued. Failed deliveries are
+    retried with exponential backoff until EMAIL_MAX_ATTEMPTS is reached.
+    `notify()` is thread-safe, so emails can be queued from the threadpool.
+    """
+
+    def __init__(self, sender: Optional[MailgunEmail] = None, poll_interval: float = settings.EMAIL_OUTBOX_POLL_SECONDS):
+        self.sender = sender
+        self.poll_interval = poll_interval
+        self._wake = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the delivery loop on the running event loop"""
+        if self._task is None or self._task.done():
+            self._loop = asyncio.get_running_loop()
+            self._task = self._loop.create_task(self._run())
+            logger.info("Email outbox worker started")
+
+    async def stop(self) -> None:
+        """Stop the delivery loop, emails still pending are delivered after the next start"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._loop = None
+            logger.info("Email outbox worker stopped")
+
+    def notify(self) -> None:
+        """Wake the worker up to deliver newly queued emails, from the event loop or any thread"""
+        if self._loop is None:
+            # Not running, pending emails are delivered after the next start
+            return
+        self._loop.call_soon_threadsafe(self._wake.set)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.deliver_due()
+            except Exception as e:
+                logger.error(f"Email outbox delivery failed: {str(e)}")
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    async def _send(self, email: ClaimedEmail) -> None:
+        sender = self.sender or MailgunEmail()
+        if email.kind == "confirmation":
+            await sender.send_confirmation_email(**email.payload)
+        elif email.kind == "notification":
+            await sender.send_notification_email(**email.payload)
+        else:
+            raise ValueError(f"Unknown email kind: {email.kind}")
+
+    async def deliver_due(self) -> Dict[str, int]:
+        """
+        Deliver the emails that are due, one batch at a time.
+        Each batch is claimed and committed before sending, so no row lock or
+        transaction is held while Mailgun is called, and every outcome is
+        recorded in its own short transaction. Database work runs in the threadpool.
+
+        Returns:
+            Dict[str, int]: Counts of sent, retried and failed emails
+        """
+        stats = {"sent": 0, "retried": 0, "failed": 0}
+        db = SessionLocal()
+        try:
+            repository = EmailOutboxRepository(db)
+            while True:
+                batch = await run_db(repository.claim_due, settings.EMAIL_OUTBOX_BATCH_SIZE, DELIVERY_LEASE_SECONDS)
+                if not batch:
+                    break
+                for email in batch:
+                    outcome = await self._deliver(email, stats)
+                    await run_db(repository.record_outcome, email.id, outcome)
+        finally:
+            db.close()
+
+        if any(stats.values()):
+            logger.info(f"Email outbox delivery: {stats}")
+        return stats
+
+    async def _deliver(self, email: ClaimedEmail, stats: Dict[str, int]) -> Dict[str, Any]:
+        """Send a claimed email and return the column values recording the outcome"""
+        try:
+            await self._send(email)
+        except Exception as e:
+            now = datetime.now(timezone.utc)
+            if _is_permanent_error(e) or email.attempts >= settings.EMAIL_MAX_ATTEMPTS:
+                stats["failed"] += 1
+                logger.error(f"Giving up on {email.kind} email {email.id} after {email.attempts} attempts: {str(e)}")
+                return {"status": "failed", "last_error": str(e)}
+            backoff = settings.EMAIL_RETRY_BACKOFF_SECONDS * 2 ** (email.attempts - 1)
+            stats["retried"] += 1
+            logger.warning(f"Delivery of {email.kind} email {email.id} failed, retrying in {backoff:.0f}s: {str(e)}")
+            return {"next_attempt_at": now + timedelta(seconds=backoff), "last_error": str(e)}
+
+        stats["sent"] += 1
+        return {"status": "sent", "sent_at": datetime.now(timezone.utc), "last_error": None}
+
+def queue_emails(db: Session, emails: List[Dict[str, Any]]) -> List[EmailOutbox]:
+    """Persist emails in the outbox and wake the worker to deliver them"""
+    entries = EmailOutboxRepository(db).enqueue(emails)
+    email_outbox_worker.notify()
+    return entries
+
+# Global worker instance, started and stopped by the application lifespan
+email_outbox_worker = EmailOutboxWorker()
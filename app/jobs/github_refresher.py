@@ -0,0 +1,129 @@
+import asyncio
+import time
+import logging
+import httpx
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from app.config.settings import settings
+from app.models.project_model import Project
+from app.utils.github_utils import fetch_github_data, GitHubRateLimiter, GitHubRateLimitError
+from app.utils.db_utils import run_db
+
+logger = logging.getLogger(__name__)
+
+class ProjectSnapshot(NamedTuple):
+    """The columns of a project the refresh needs, loaded up front so no ORM object is touched while fetching"""
+    id: uuid.UUID
+    url: str
+    github_validators: Optional[Dict[str, Any]]
+    additional_data: Optional[Dict[str, Any]]
+
+def load_expired_snapshots(db: Session, now: datetime) -> List[ProjectSnapshot]:
+    """Expired GitHub projects, with their (normally deferred) GitHub data, in one query"""
+    rows = db.execute(
+        select(Project.id, Project.url, Project.github_validators, Project.additional_data).where(
+            (Project.type == "github") &
+            (Project.expiry_date < now) &
+            (Project.url.is_not(None))
+        )
+    ).all()
+    return [ProjectSnapshot(*row) for row in rows]
+
+class GitHubBatchRefresher:
+    """
+    Refreshes the GitHub data of many projects concurrently.
+
+    Requests fan out over one shared pooled client with at most `concurrency`
+    projects in flight, all sharing a rate limiter fed by GitHub's
+    X-RateLimit-* headers. Once the quota is exhausted for longer than
+    GITHUB_MAX_BACKOFF_SECONDS the remaining projects are skipped until the
+    next run. Projects with stored validators are fetched conditionally and
+    only get a new expiry date when GitHub reports them not modified.
+    Results are written back by ID every `batch_size` projects, in the threadpool.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        client: httpx.AsyncClient,
+        concurrency: int = settings.GITHUB_REFRESH_CONCURRENCY,
+        batch_size: int = settings.GITHUB_REFRESH_BATCH_SIZE
+    ):
+        self.db = db
+        self.client = client
+        self.concurrency = max(1, concurrency)
+        self.batch_size = max(1, batch_size)
+        self.rate_limiter = GitHubRateLimiter()
+        self._rate_limited = False
+        self._pending: List[Dict[str, Any]] = []
+        self._write_lock = asyncio.Lock()
+
+    def _write(self, updates: List[Dict[str, Any]]) -> None:
+        """Bulk update the refreshed projects by primary key, grouped by the columns they change"""
+        unchanged = [values for values in updates if "additional_data" not in values]
+        changed = [values for values in updates if "additional_data" in values]
+        try:
+            for batch in (unchanged, changed):
+                if batch:
+                    self.db.execute(update(Project), batch)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        logger.info(f"Committed {len(updates)} refreshed GitHub projects")
+
+    async def _flush(self) -> None:
+        # One write at a time, the session isn't shared between threads
+        async with self._write_lock:
+            updates, self._pending = self._pending, []
+            if updates:
+                await run_db(self._write, updates)
+
+    async def refresh(self, projects: List[ProjectSnapshot], expiry_date: datetime) -> Dict[str, Any]:
+        """
+        Refresh the given projects and set their next expiry date.
+
+        Returns:
+            Dict[str, Any]: Run stats (total, refreshed, not_modified, skipped, failed, elapsed_seconds)
+        """
+        started = time.monotonic()
+        stats = {"total": len(projects), "refreshed": 0, "not_modified": 0, "skipped": 0, "failed": 0}
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def refresh_project(project: ProjectSnapshot) -> None:
+            async with semaphore:
+                if self._rate_limited:
+                    stats["skipped"] += 1
+                    return
+                try:
+                    result = await fetch_github_data(project.url, self.client, self.rate_limiter, project.github_validators)
+                except GitHubRateLimitError as e:
+                    logger.warning(f"Skipping project ID {project.id}: {str(e)}")
+                    self._rate_limited = True
+                    stats["skipped"] += 1
+                    return
+                except Exception as e:
+                    logger.error(f"Error refreshing project ID {project.id}: {str(e)}")
+                    stats["failed"] += 1
+                    return
+
+                values = {"id": project.id, "expiry_date": expiry_date}
+                if result.unchanged:
+                    # Leave the GitHub data columns untouched
+                    stats["not_modified"] += 1
+                else:
+                    values["additional_data"] = result.merge(project.additional_data) if result.not_modified else result.github_data
+                    values["github_validators"] = result.validators
+                    stats["refreshed"] += 1
+                self._pending.append(values)
+                if len(self._pending) >= self.batch_size:
+                    await self._flush()
+
+        await asyncio.gather(*(refresh_project(project) for project in projects))
+        await self._flush()
+
+        stats["elapsed_seconds"] = round(time.monotonic() - started, 2)
+        return stats
@@ -0,0 +1,47 @@
+import asyncio
+import logging
+import uuid
+from typing import Dict
+from app.config.database import SessionLocal
+from app.utils.db_utils import run_db
+
+logger = logging.getLogger(__name__)
+
+# Background refreshes currently running in this process, keyed by project ID.
+# Holding the task also keeps it from being garbage collected before it finishes.
+_in_flight: Dict[uuid.UUID, asyncio.Task] = {}
+
+async def _refresh_project(project_id: uuid.UUID):
+    """Refresh the GitHub data of a project with its own DB session"""
+    # Imported here to avoid a circular import with the project service
+    from app.services.project_service import ProjectService, is_github_data_expired
+
+    db = SessionLocal()
+    try:
+        service = ProjectService(db)
+        project = await run_db(service.repository.get_by_id, project_id)
+        # Another worker process may have refreshed it in the meantime
+        if not project or not is_github_data_expired(project):
+            return
+        await service.refresh_github_data(project_id)
+    except Exception as e:
+        logger.error(f"Background refresh of project {project_id} failed: {str(e)}")
+    finally:
+        db.close()
+
+def schedule_project_refresh(project_id: uuid.UUID) -> bool:
+    """
+    Queue a background refresh of a project's GitHub data (stale-while-revalidate).
+    Concurrent requests for the same project share a single refresh.
+
+    Returns:
+        bool: True if a refresh was queued, False if one is already in flight
+    """
+    if project_id in _in_flight:
+        return False
+
+    task = asyncio.get_running_loop().create_task(_refresh_project(project_id))
+    _in_flight[project_id] = task
+    task.add_done_callback(lambda _: _in_flight.pop(project_id, None))
+    logger.info(f"Queued background refresh for project {project_id}")
+    return True
@@ -1,12 +1,14 @@
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from sqlalchemy.orm import Session
-from sqlalchemy import select
 from datetime import datetime, timezone, timedelta
 import logging
-from app.models.project_model import Project
-from app.utils.github_utils import fetch_github_data
+from app.utils.github_utils import get_github_client
+from app.jobs.github_refresher import GitHubBatchRefresher, load_expired_snapshots
+from app.utils.db_utils import run_db
 from app.config.database import SessionLocal
+from app.utils.public_data_cache import public_data_cache
+from app.jobs.vector_indexer import vector_indexer
 import uuid
 
 logger = logging.getLogger(__name__)
@@ -17,7 +19,8 @@ scheduler = AsyncIOScheduler()
 async def refresh_expired_projects():
     """
     Cron job to check for expired GitHub projects and refresh their data.
-    Runs once per day at 3:00 AM.
+    Runs once per day at 3:00 AM. Projects are refreshed concurrently by
+    GitHubBatchRefresher and the run stats are returned and logged.
     """
     logger.info("Starting scheduled job to refresh expired GitHub projects")
     
@@ -27,43 +30,23 @@ async def refresh_expired_projects():
     # Create DB session
     db = SessionLocal()
     try:
-        # Query for expired GitHub projects
-        query = (
-            select(Project)
-            .where(
-                (Project.type == "github") & 
-                (Project.expiry_date < now) &
-                (Project.url.is_not(None))
-            )
-        )
-        
-        expired_projects = db.execute(query).scalars().all()
+        # Snapshot the expired GitHub projects, so the concurrent refresh never lazy loads on the event loop
+        expired_projects = await run_db(load_expired_snapshots, db, now)
         logger.info(f"Found {len(expired_projects)} expired GitHub projects to refresh")
         
-        # Refresh each expired project
-        for project in expired_projects:
-            try:
-                logger.info(f"Refreshing project ID: {project.id}, URL: {project.url}")
-                
-                # Fetch new GitHub data
-                _, github_full_data = await fetch_github_data(project.url)
-                
-                # Update the project with timezone-aware datetime
-                # Set expiry to tomorrow at 3 AM UTC
-                tomorrow = now.replace(hour=3, minute=0, second=0, microsecond=0)
-                tomorrow = tomorrow.replace(day=tomorrow.day + 1)
-                
-                project.additional_data = github_full_data
-                project.expiry_date = tomorrow
-                
-                logger.info(f"Successfully refreshed project ID: {project.id}")
-            except Exception as e:
-                logger.error(f"Error refreshing project ID {project.id}: {str(e)}")
-                # Continue with next project
+        # Set expiry to tomorrow at 3 AM UTC
+        tomorrow = now.replace(hour=3, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        
+        # Refresh concurrently over one pooled client, committing in batches
+        refresher = GitHubBatchRefresher(db, get_github_client())
+        stats = await refresher.refresh(expired_projects, tomorrow)
         
-        # Commit all changes
-        db.commit()
-        logger.info("Completed refreshing expired GitHub projects")
+        if stats["refreshed"]:
+            public_data_cache.invalidate()
+            # Only the projects whose content hash changed get re-embedded
+            vector_indexer.schedule("project")
+        logger.info(f"Completed refreshing expired GitHub projects: {stats}")
+        return stats
         
     except Exception as e:
         logger.error(f"Error in refresh_expired_projects job: {str(e)}")
@@ -0,0 +1,87 @@
+import asyncio
+import logging
+import threading
+import uuid
+from typing import Dict, Optional, Set
+from app.config.database import SessionLocal
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+class VectorIndexer:
+    """
+    Write-through indexing of the chatbot vector store.
+
+    Services call `schedule()` after a mutation. Changes are collected and,
+    once no new change arrived for `debounce_seconds`, only the touched
+    records are re-synced in a worker thread: changed documents are
+    re-embedded and deleted or hidden records lose their vectors.
+    `schedule()` is thread safe, so it can be called from sync route handlers.
+    """
+
+    def __init__(self, debounce_seconds: float = settings.VECTOR_INDEX_DEBOUNCE_SECONDS):
+        self.debounce_seconds = debounce_seconds
+        # Pending record IDs per source type, None meaning the whole source type
+        self._pending: Dict[str, Optional[Set[uuid.UUID]]] = {}
+        self._lock = threading.Lock()
+        # Only one sync runs at a time, so overlapping flushes can't insert the same vector twice
+        self._sync_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._timer: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Bind the indexer to the running event loop"""
+        self._loop = asyncio.get_running_loop()
+
+    async def stop(self) -> None:
+        """Stop the indexer, changes not flushed yet are picked up by the next sync"""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._loop = None
+
+    def schedule(self, source_type: str, source_id: Optional[uuid.UUID] = None) -> None:
+        """Queue a re-index of a record, or of every record of a source type if no ID is given"""
+        if self._loop is None:
+            logger.debug(f"Vector indexer not running, skipping re-index of {source_type} {source_id or ''}")
+            return
+        with self._lock:
+            if source_id is None:
+                self._pending[source_type] = None
+            elif source_type not in self._pending:
+                self._pending[source_type] = {source_id}
+            elif self._pending[source_type] is not None:
+                self._pending[source_type].add(source_id)
+        self._loop.call_soon_threadsafe(self._restart_timer)
+
+    def _restart_timer(self) -> None:
+        if self._timer is not None and not self._timer.done():
+            self._timer.cancel()
+        self._timer = asyncio.get_running_loop().create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.debounce_seconds)
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if pending:
+            await asyncio.to_thread(self._sync, pending)
+
+    def _sync(self, pending: Dict[str, Optional[Set[uuid.UUID]]]) -> None:
+        # Imported here to keep the LLM client libraries out of the service import chain
+        from app.services.vector_service import VectorService
+
+        with self._sync_lock:
+            db = SessionLocal()
+            try:
+                service = VectorService(db)
+                for source_type, ids in pending.items():
+                    try:
+                        service.sync_sources(source_type, ids)
+                    except Exception as e:
+                        logger.error(f"Re-indexing {source_type} vectors failed: {str(e)}")
+            except Exception as e:
+                logger.error(f"Vector indexer failed: {str(e)}")
+            finally:
+                db.close()
+
+# Global indexer instance, started and stopped by the application lifespan
+vector_indexer = VectorIndexer()
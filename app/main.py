@@ -2,17 +2,30 @@ from fastapi import FastAPI, Request, Response, status, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
+import asyncio
 import logging
+import math
 import time
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
 from app.config.settings import settings
-from app.config.database import engine, Base
-from app.controllers import project_controller, review_controller, user_controller, experience_controller, skill_controller, contact_controller, project_category_controller, chatbot_controller
+from app.config.database import READ_PRIMARY_COOKIE, RequestWrites, current_request_writes, engine, replica_engine, Base
+from app.controllers import project_controller, review_controller, user_controller, experience_controller, skill_controller, contact_controller, project_category_controller, chatbot_controller, asset_controller
 from app.jobs.scheduler import init_scheduler, shutdown_scheduler
 from app.dependencies.database import get_db
+from app.dependencies.auth import get_current_user
+from app.models.user_model import User
+from app.utils.db_pool import get_pool_status
+from app.utils.query_inspector import check_queries
+from app.utils.metrics import (
+    RequestQueryStats, current_query_stats, route_template, observe_request, register_pool_collector, render_metrics
+)
+from app.jobs.email_outbox import email_outbox_worker
+from app.jobs.vector_indexer import vector_indexer
+from app.utils.http_client import http_clients
+from app.utils.llm_factory import llm_clients
 
 # Configure logging
 logging.basicConfig(
@@ -28,12 +41,31 @@ async def lifespan(app: FastAPI):
     logger.info("Application starting up...")
     Base.metadata.create_all(bind=engine)
     scheduler = init_scheduler()
+    email_outbox_worker.start()
+    vector_indexer.start()
+    # Build the LLM clients in the background so startup isn't held up by the provider.
+    # The lifespan holds the task, so it can't be garbage collected before it finishes.
+    warm_up_task = None
+    if settings.LLM_WARM_UP:
+        warm_up_task = asyncio.get_running_loop().create_task(asyncio.to_thread(llm_clients.warm_up))
     
     yield
     
-    # Shutdown: Gracefully stop the scheduler
+    # Shutdown: Gracefully stop the scheduler and background workers and close pooled outbound connections
     logger.info("Application shutting down...")
     shutdown_scheduler()
+    await email_outbox_worker.stop()
+    await vector_indexer.stop()
+    await http_clients.aclose()
+    if warm_up_task is not None and not warm_up_task.done():
+        warm_up_task.cancel()
+        try:
+            await warm_up_task
+        except asyncio.CancelledError:
+            pass
+
+# Pool gauges are read from the engines whenever /metrics is scraped
+register_pool_collector({"primary": engine, "replica": replica_engine} if replica_engine is not None else {"primary": engine})
 
 # Create FastAPI app
 app = FastAPI(
@@ -52,13 +84,62 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Request timing middleware
+# Request metrics middleware: latency, sizes and database queries per route template
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    stats = RequestQueryStats()
+    token = current_query_stats.set(stats)
+    start_time = time.perf_counter()
+    status_code = 500
+    response = None
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+    finally:
+        current_query_stats.reset(token)
+        route = route_template(request)
+        if route != "/metrics":
+            request_size = request.headers.get("content-length")
+            response_size = response.headers.get("content-length") if response is not None else None
+            observe_request(
+                request.method,
+                route,
+                status_code,
+                time.perf_counter() - start_time,
+                int(request_size) if request_size and request_size.isdigit() else None,
+                int(response_size) if response_size and response_size.isdigit() else None,
+                stats
+            )
+    
+    # Development and tests: flag likely N+1 queries and enforce the route's query budget
+    if settings.QUERY_INSPECTOR_ENABLED:
+        endpoint = request.scope.get("endpoint")
+        check_queries(f"{request.method} {route}", stats, getattr(endpoint, "query_budget", None))
+        response.headers["X-Query-Count"] = str(stats.count)
+    return response
+
+# Read-your-writes with a read replica: a client that committed public content gets a cookie
+# pinning its reads to the primary for DB_REPLICA_LAG_SECONDS, whichever worker serves them
 @app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
+async def pin_reads_after_write(request: Request, call_next):
+    if replica_engine is None:
+        return await call_next(request)
+    writes = RequestWrites()
+    token = current_request_writes.set(writes)
+    try:
+        response = await call_next(request)
+    finally:
+        current_request_writes.reset(token)
+    if writes.committed:
+        # The admin dashboard calls the API cross-site with credentials
+        response.set_cookie(
+            READ_PRIMARY_COOKIE,
+            f"{time.time() + settings.DB_REPLICA_LAG_SECONDS:.3f}",
+            max_age=math.ceil(settings.DB_REPLICA_LAG_SECONDS),
+            httponly=True,
+            secure=not settings.DEBUG,
+            samesite="lax" if settings.DEBUG else "none",
+        )
     return response
 
 # Global exception handler
@@ -110,6 +191,11 @@ app.include_router(
     prefix=settings.API_PREFIX
 )
 
+app.include_router(
+    asset_controller.router,
+    prefix=settings.API_PREFIX
+)
+
 @app.get("/")
 def root():
     return {"message": "Welcome to the Portfolio Website API"}
@@ -142,6 +228,24 @@ async def health_check(
         response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
         return None
 
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus metrics: request latencies and sizes, database queries, pool gauges, outbound calls and chat turns"""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+@app.get("/healthz/db-pool")
+def database_pool_status(current_user: User = Depends(get_current_user)):
+    """
+    Report the database connection pools of the primary and, when configured,
+    the read replica: preset, size, idle and in-use connections, checkout wait
+    times and checkout timeouts.
+    """
+    pools = {"primary": get_pool_status(engine, settings.DB_POOL_PRESET)}
+    if replica_engine is not None:
+        pools["replica"] = get_pool_status(replica_engine, settings.DB_POOL_PRESET)
+    return pools
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
@@ -1,2 +1,2 @@
 # Import models to ensure they're discovered by SQLAlchemy
-from . import project_model, review_model, user_model, experience_model, skill_model, project_category_model, vector_store, chat_model
+from . import project_model, review_model, user_model, experience_model, skill_model, project_category_model, vector_store, chat_model, asset_model, email_outbox_model
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, String, Integer, LargeBinary
+from sqlalchemy.orm import deferred
+from app.models.base_model import BaseModel
+
+class Asset(BaseModel):
+    __tablename__ = "assets"
+    
+    # SHA-256 hex digest of the content, used as the public content address
+    hash = Column(String(64), unique=True, nullable=False, index=True)
+    content_type = Column(String(100), nullable=False)
+    size = Column(Integer, nullable=False)
+    
+    # Raw bytes, only loaded when the asset is actually served
+    data = deferred(Column(LargeBinary, nullable=False))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, ForeignKey, TIMESTAMP
+from sqlalchemy import Column, String, Text, ForeignKey, TIMESTAMP, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from app.models.base_model import BaseModel
@@ -11,6 +11,11 @@ class ChatSession(BaseModel):
 
     messages = relationship("ChatMessage", back_populates="session", cascade="all, delete-orphan")
 
+    # Keyset pagination index for the admin session list
+    __table_args__ = (
+        Index("ix_chat_sessions_created_at_id", "created_at", "id"),
+    )
+
 class ChatMessage(BaseModel):
     __tablename__ = "chat_messages"
 
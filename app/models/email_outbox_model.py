@@ -0,0 +1,18 @@
+from sqlalchemy import Column, String, Text, JSON, Integer, DateTime, Index
+from app.models.base_model import BaseModel
+
+class EmailOutbox(BaseModel):
+    __tablename__ = "email_outbox"
+    
+    kind = Column(String(50), nullable=False)  # "confirmation" or "notification"
+    payload = Column(JSON, nullable=False)  # Keyword arguments of the MailgunEmail send method
+    status = Column(String(20), nullable=False, default="pending")  # "pending", "sent" or "failed"
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime(timezone=True), nullable=False)
+    last_error = Column(Text, nullable=True)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Lookup of the pending emails that are due for delivery
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Date, Boolean
+from sqlalchemy import Column, String, Text, Date, Boolean, Index
 from sqlalchemy.dialects.postgresql import UUID
 from app.models.base_model import BaseModel
 import uuid
@@ -13,3 +13,9 @@ class Experience(BaseModel):
     end_date = Column(Date, nullable=True)  # End date (nullable for current positions)
     description = Column(Text, nullable=True)  # Description
     is_visible = Column(Boolean, default=True)  # Flag to control visibility
+
+    # Keyset pagination indexes over (created_at, id)
+    __table_args__ = (
+        Index("ix_experiences_created_at_id", "created_at", "id"),
+        Index("ix_experiences_is_visible_created_at_id", "is_visible", "created_at", "id"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean
+from sqlalchemy import Column, String, Boolean, Index
 from app.models.base_model import BaseModel
 
 
@@ -7,3 +7,9 @@ class ProjectCategory(BaseModel):
 
     name = Column(String(100), nullable=False, index=True)
     is_visible = Column(Boolean, default=True, nullable=False, server_default="true")
+
+    # Keyset pagination indexes over (created_at, id)
+    __table_args__ = (
+        Index("ix_project_categories_created_at_id", "created_at", "id"),
+        Index("ix_project_categories_is_visible_created_at_id", "is_visible", "created_at", "id"),
+    )
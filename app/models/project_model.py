@@ -1,5 +1,6 @@
-from sqlalchemy import Column, String, Text, JSON, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, String, Text, JSON, DateTime, Boolean, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import deferred
 from app.models.base_model import BaseModel
 import uuid
 
@@ -9,10 +10,20 @@ class Project(BaseModel):
     title = Column(String(100), nullable=False, index=True)
     description = Column(Text, nullable=True)
     type = Column(String(50), nullable=False)  # "github" or "custom"
-    image = Column(Text, nullable=True)  # Base64 image data
+    image = Column(Text, nullable=True)  # Asset URL of the original image
+    image_variants = Column(JSON, nullable=True)  # Resized WebP variants as [{"width": ..., "url": ...}]
     tags = Column(JSON, nullable=True)  # Store tags as a JSON array
     url = Column(String(255), nullable=True)
-    additional_data = Column(JSON, nullable=True)  # Store complete GitHub API response
+    # Complete GitHub API response including the README, only loaded when explicitly needed
+    additional_data = deferred(Column(JSON, nullable=True))
+    # ETag/Last-Modified of the fetched GitHub resources as {"repo": {"etag": ..., "last_modified": ...}, ...}
+    github_validators = Column(JSON, nullable=True)
     expiry_date = Column(DateTime, nullable=True)  # Expiry date for non-custom projects
     is_visible = Column(Boolean, default=True)  # Flag to control visibility
     project_category_id = Column(UUID(as_uuid=True), ForeignKey("project_categories.id"), nullable=True)
+
+    # Keyset pagination indexes over (created_at, id)
+    __table_args__ = (
+        Index("ix_projects_created_at_id", "created_at", "id"),
+        Index("ix_projects_is_visible_created_at_id", "is_visible", "created_at", "id"),
+    )
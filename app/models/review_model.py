@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Boolean, Integer, CheckConstraint
+from sqlalchemy import Column, String, Text, Boolean, Integer, CheckConstraint, Index
 from sqlalchemy.dialects.postgresql import UUID
 from app.models.base_model import BaseModel
 import uuid
@@ -14,4 +14,7 @@ class Review(BaseModel):
     
     __table_args__ = (
         CheckConstraint('rating >= 1 AND rating <= 5', name='check_rating_range'),
+        # Keyset pagination indexes over (created_at, id)
+        Index("ix_reviews_created_at_id", "created_at", "id"),
+        Index("ix_reviews_is_visible_created_at_id", "is_visible", "created_at", "id"),
     )
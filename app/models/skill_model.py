@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Boolean, JSON, ForeignKey
+from sqlalchemy import Column, String, Integer, Boolean, JSON, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.models.base_model import BaseModel
@@ -23,3 +23,9 @@ class SkillGroup(BaseModel):
     
     # Relationship with skills
     skills = relationship("Skill", backref="skill_group", lazy="joined", cascade="all, delete-orphan")
+
+    # Keyset pagination indexes over (created_at, id)
+    __table_args__ = (
+        Index("ix_skill_groups_created_at_id", "created_at", "id"),
+        Index("ix_skill_groups_is_visible_created_at_id", "is_visible", "created_at", "id"),
+    )
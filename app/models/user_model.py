@@ -19,6 +19,7 @@ class User(BaseModel):
     location = Column(String(100), nullable=True)
     availability = Column(String(50), nullable=True)
     avatar = Column(Text, nullable=True)
+    avatar_variants = Column(JSON, nullable=True)  # Resized WebP variants as [{"width": ..., "url": ...}]
     social_links = Column(JSON, nullable=True)
     about = Column(JSON, nullable=True)
     featured_skill_ids = Column(JSON, nullable=True, default=list)
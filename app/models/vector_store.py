@@ -1,9 +1,16 @@
-from sqlalchemy import Column, String, Text, JSON, Integer
+from sqlalchemy import Column, String, Text, JSON, Integer, Index
 from sqlalchemy.dialects.postgresql import UUID
 from pgvector.sqlalchemy import Vector
 from app.models.base_model import BaseModel
 import uuid
 
+# pgvector operator class of each supported distance metric, the ANN index must use the one searched with
+VECTOR_OPERATOR_CLASSES = {
+    "l2": "vector_l2_ops",
+    "cosine": "vector_cosine_ops",
+    "inner_product": "vector_ip_ops",
+}
+
 class VectorEmbedding(BaseModel):
     __tablename__ = "vector_embeddings"
     
@@ -22,6 +29,28 @@ class VectorEmbedding(BaseModel):
     
     # ID of the original record (if applicable)
     source_id = Column(UUID(as_uuid=True), nullable=True)
+    
+    # SHA-256 of the embedded content (and embedding model), used to skip unchanged documents on sync
+    content_hash = Column(String(64), nullable=True)
+
+    # Lookup of the vector of a source record during incremental syncs
+    __table_args__ = (
+        Index("ix_vector_embeddings_source_type_source_id", "source_type", "source_id"),
+    )
 
     def __repr__(self):
         return f"<VectorEmbedding(id={self.id}, source={self.source_type})>"
+
+class QueryEmbedding(BaseModel):
+    __tablename__ = "query_embedding_cache"
+    
+    # SHA-256 of the embedding model, dimensions and normalized query text
+    key_hash = Column(String(64), unique=True, nullable=False, index=True)
+    
+    # Normalized query text, kept for debugging and cache inspection
+    query_text = Column(Text, nullable=False)
+    
+    embedding = Column(Vector(768), nullable=False)
+
+    def __repr__(self):
+        return f"<QueryEmbedding(id={self.id}, query={self.query_text[:30]!r})>"
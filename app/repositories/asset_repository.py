@@ -0,0 +1,41 @@
+from sqlalchemy.orm import Session, undefer
+from sqlalchemy.dialects.postgresql import insert
+from app.models.asset_model import Asset
+from app.repositories.base_repository import BaseRepository
+from typing import Optional
+from sqlalchemy.exc import SQLAlchemyError
+import logging
+import uuid
+
+logger = logging.getLogger(__name__)
+
+class AssetRepository(BaseRepository):
+    model = Asset
+
+    def __init__(self, db: Session):
+        super().__init__(db)
+
+    @BaseRepository.retry_decorator
+    def create_if_missing(self, asset_hash: str, content_type: str, data: bytes) -> None:
+        """Store an asset unless one with the same content hash already exists"""
+        with self.transaction():
+            statement = insert(Asset).values(
+                id=uuid.uuid4(),
+                hash=asset_hash,
+                content_type=content_type,
+                size=len(data),
+                data=data
+            ).on_conflict_do_nothing(index_elements=[Asset.hash])
+            self.db.execute(statement)
+
+    @BaseRepository.retry_decorator
+    def get_by_hash(self, asset_hash: str, with_data: bool = True) -> Optional[Asset]:
+        """Get an asset by its content hash with retry capability"""
+        try:
+            query = self.db.query(Asset).filter(Asset.hash == asset_hash)
+            if with_data:
+                query = query.options(undefer(Asset.data))
+            return query.first()
+        except SQLAlchemyError as e:
+            logger.error(f"Error retrieving asset {asset_hash}: {str(e)}")
+            raise
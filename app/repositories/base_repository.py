@@ -1,12 +1,29 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, Query, load_only
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import func, tuple_
 from contextlib import contextmanager
 from app.utils.db_utils import get_retry_decorator
+from app.utils.field_selection import load_only_columns
+from app.utils.pagination import CursorPosition, encode_cursor
+from typing import Optional, Tuple, Sequence, List, Any, NamedTuple
+from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+class Page(NamedTuple):
+    """
+    A page of rows, the cursor of the following page (None on the last page)
+    and the total number of matching rows (None when it wasn't requested)
+    """
+    items: List[Any]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
 class BaseRepository:
+    # SQLAlchemy model managed by the repository, set by subclasses
+    model = None
+
     def __init__(self, db: Session):
         self.db = db
 
@@ -36,3 +53,84 @@ class BaseRepository:
             self.db.rollback()
             logger.error(f"Error during commit: {str(e)}")
             raise
+
+    def apply_fields(self, query: Query, fields: Optional[Sequence[str]] = None) -> Query:
+        """Only load the columns backing the selected response fields (sparse fieldsets)"""
+        columns = load_only_columns(self.model, fields)
+        # created_at is part of the pagination cursor, so it is always loaded
+        return query.options(load_only(self.model.created_at, *columns)) if columns else query
+
+    def paginate(self, query: Query, skip: int = 0, limit: int = 100, after: Optional[CursorPosition] = None, descending: bool = False, with_total: bool = False) -> Page:
+        """
+        Return a page of `query` in a stable (created_at, id) order.
+
+        With a cursor position (`after`) the page starts right after that row using
+        a keyset condition served by the (created_at, id) indexes, so deep pages cost
+        the same as the first one; otherwise `skip` is used as an offset. One extra
+        row is fetched to know whether a next page exists.
+
+        With `with_total` the total number of matching rows is selected in the same
+        statement instead of a separate count() round-trip.
+        """
+        created_at, row_id = self.model.created_at, self.model.id
+        count_query = query.with_entities(func.count(row_id)).order_by(None)
+
+        if with_total:
+            if after:
+                # count(*) OVER() would only see the rows after the cursor, so count the
+                # unpaginated query in an (uncorrelated, evaluated once) scalar subquery
+                total_column = count_query.scalar_subquery()
+            else:
+                # The window is evaluated before OFFSET/LIMIT, so it sees every matching row
+                total_column = func.count().over()
+            query = query.add_columns(total_column.label("total"))
+
+        if descending:
+            query = query.order_by(created_at.desc(), row_id.desc())
+        else:
+            query = query.order_by(created_at, row_id)
+
+        if after:
+            position = tuple_(created_at, row_id)
+            cursor = tuple_(*after)
+            query = query.filter(position < cursor if descending else position > cursor)
+        elif skip:
+            query = query.offset(skip)
+
+        rows = query.limit(limit + 1).all()
+
+        total = None
+        if with_total:
+            if rows:
+                total = rows[0].total
+                rows = [row[0] for row in rows]
+            elif skip or after:
+                # Past the last page there is no row to read the total from
+                total = count_query.scalar()
+            else:
+                total = 0
+
+        if len(rows) <= limit:
+            return Page(rows, None, total)
+
+        rows = rows[:limit]
+        return Page(rows, encode_cursor(rows[-1].created_at, rows[-1].id), total)
+
+    @retry_decorator
+    def get_version(self, only_visible: bool = False) -> Tuple[Optional[datetime], int]:
+        """
+        Get the latest updated_at and the row count of the repository's model.
+        Together they change on every insert, update and delete, so they are
+        used to build ETags without loading the rows. The latest updated_at alone
+        doesn't move (or moves back) when a row is hidden or deleted, so it must
+        not be sent as the Last-Modified of a list.
+        """
+        try:
+            query = self.db.query(func.max(self.model.updated_at), func.count(self.model.id))
+            if only_visible:
+                query = query.filter(self.model.is_visible == True)
+            last_modified, count = query.one()
+            return last_modified, count
+        except SQLAlchemyError as e:
+            logger.error(f"Error retrieving version of {self.model.__tablename__}: {str(e)}")
+            raise
@@ -1,9 +1,13 @@
 from sqlalchemy.orm import Session
 from app.models.chat_model import ChatSession, ChatMessage
-from app.repositories.base_repository import BaseRepository
+from app.repositories.base_repository import BaseRepository, Page
+from app.utils.pagination import CursorPosition
+from typing import Optional
 import uuid
 
 class ChatRepository(BaseRepository):
+    model = ChatSession
+
     def get_session(self, session_id: str):
         return self.db.query(ChatSession).filter(ChatSession.id == session_id).first()
 
@@ -41,27 +45,32 @@ class ChatRepository(BaseRepository):
                     return existing
             raise e
 
-    def get_all_sessions(self, limit: int = 50, offset: int = 0):
+    def get_all_sessions(self, limit: int = 50, offset: int = 0, after: Optional[CursorPosition] = None) -> Page:
         """
-        Fetch all chat sessions with their latest message time and message count.
+        Fetch a page of chat sessions, newest first, with their latest message time and message count.
+        Sessions are paginated by (created_at, id) so deep pages stay cheap, and the
+        message stats are only aggregated for the sessions on the page.
         """
-        from sqlalchemy import func, desc
+        from sqlalchemy import func
         
-        # Subquery to get the last message time and count for each session
-        subquery = self.db.query(
-            ChatMessage.session_id,
-            func.count(ChatMessage.id).label('message_count'),
-            func.max(ChatMessage.created_at).label('last_message_at')
-        ).group_by(ChatMessage.session_id).subquery()
+        page = self.paginate(self.db.query(ChatSession), offset, limit, after, descending=True)
+        session_ids = [session.id for session in page.items]
+        if not session_ids:
+            return page
 
-        # Join ChatSession with the subquery
-        query = self.db.query(ChatSession, subquery.c.message_count, subquery.c.last_message_at)\
-            .outerjoin(subquery, ChatSession.id == subquery.c.session_id)\
-            .order_by(desc(subquery.c.last_message_at))\
-            .offset(offset)\
-            .limit(limit)
-            
-        return query.all()
+        stats = {
+            session_id: (message_count, last_message_at)
+            for session_id, message_count, last_message_at in self.db.query(
+                ChatMessage.session_id,
+                func.count(ChatMessage.id),
+                func.max(ChatMessage.created_at)
+            ).filter(ChatMessage.session_id.in_(session_ids)).group_by(ChatMessage.session_id)
+        }
+
+        return Page(
+            [(session, *stats.get(session.id, (None, None))) for session in page.items],
+            page.next_cursor
+        )
 
     def get_session_messages(self, session_id: str):
         """
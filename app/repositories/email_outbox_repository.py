@@ -0,0 +1,66 @@
+from sqlalchemy.orm import Session
+from app.models.email_outbox_model import EmailOutbox
+from app.repositories.base_repository import BaseRepository
+from typing import Dict, Any, List, NamedTuple
+from datetime import datetime, timezone, timedelta
+import logging
+import uuid
+
+logger = logging.getLogger(__name__)
+
+class ClaimedEmail(NamedTuple):
+    """An email claimed for delivery, detached from the session that claimed it"""
+    id: uuid.UUID
+    kind: str
+    payload: Dict[str, Any]
+    attempts: int
+
+class EmailOutboxRepository(BaseRepository):
+    model = EmailOutbox
+
+    def __init__(self, db: Session):
+        super().__init__(db)
+
+    @BaseRepository.retry_decorator
+    def enqueue(self, emails: List[Dict[str, Any]]) -> List[EmailOutbox]:
+        """Persist emails ({"kind": ..., "payload": ...}) as pending, due immediately, in one transaction"""
+        now = datetime.now(timezone.utc)
+        with self.transaction():
+            entries = [
+                EmailOutbox(kind=email["kind"], payload=email["payload"], status="pending", attempts=0, next_attempt_at=now)
+                for email in emails
+            ]
+            self.db.add_all(entries)
+        return entries
+
+    def claim_due(self, limit: int, lease_seconds: float) -> List[ClaimedEmail]:
+        """
+        Claim a batch of pending emails that are due for delivery, in one short transaction.
+        Rows locked by another worker are skipped. Claimed emails count the attempt and
+        are leased: they only become due again if no outcome is recorded within `lease_seconds`.
+        """
+        now = datetime.now(timezone.utc)
+        with self.transaction():
+            emails = (
+                self.db.query(EmailOutbox)
+                .filter(
+                    EmailOutbox.status == "pending",
+                    EmailOutbox.next_attempt_at <= now
+                )
+                .order_by(EmailOutbox.next_attempt_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+                .all()
+            )
+            claimed = []
+            for email in emails:
+                email.attempts += 1
+                email.next_attempt_at = now + timedelta(seconds=lease_seconds)
+                claimed.append(ClaimedEmail(email.id, email.kind, email.payload, email.attempts))
+        return claimed
+
+    @BaseRepository.retry_decorator
+    def record_outcome(self, email_id: uuid.UUID, values: Dict[str, Any]) -> None:
+        """Store the outcome of a delivery attempt (status, next attempt, error) in its own transaction"""
+        with self.transaction():
+            self.db.query(EmailOutbox).filter(EmailOutbox.id == email_id).update(values, synchronize_session=False)
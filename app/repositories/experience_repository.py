@@ -1,7 +1,8 @@
 from sqlalchemy.orm import Session
 from app.models.experience_model import Experience
-from app.repositories.base_repository import BaseRepository
-from typing import List, Optional, Dict, Any
+from app.repositories.base_repository import BaseRepository, Page
+from app.utils.pagination import CursorPosition
+from typing import List, Optional, Dict, Any, Sequence
 from sqlalchemy.exc import SQLAlchemyError
 import logging
 import uuid
@@ -9,6 +10,8 @@ import uuid
 logger = logging.getLogger(__name__)
 
 class ExperienceRepository(BaseRepository):
+    model = Experience
+
     def __init__(self, db: Session):
         super().__init__(db)
 
@@ -21,31 +24,33 @@ class ExperienceRepository(BaseRepository):
         return experience
 
     @BaseRepository.retry_decorator
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[Experience]:
+    def get_all(self, skip: int = 0, limit: int = 100, fields: Optional[Sequence[str]] = None, after: Optional[CursorPosition] = None, with_total: bool = False) -> Page:
         """Get all experiences with retry capability"""
         try:
-            return self.db.query(Experience).offset(skip).limit(limit).all()
+            query = self.apply_fields(self.db.query(Experience), fields)
+            return self.paginate(query, skip, limit, after, with_total=with_total)
         except SQLAlchemyError as e:
             logger.error(f"Error retrieving experiences: {str(e)}")
             raise
 
     @BaseRepository.retry_decorator
-    def get_visible(self, skip: int = 0, limit: int = 100) -> List[Experience]:
+    def get_visible(self, skip: int = 0, limit: int = 100, fields: Optional[Sequence[str]] = None, after: Optional[CursorPosition] = None, with_total: bool = False) -> Page:
         """Get only visible experiences with retry capability"""
         try:
-            return self.db.query(Experience).filter(Experience.is_visible == True).offset(skip).limit(limit).all()
+            query = self.apply_fields(self.db.query(Experience), fields)
+            return self.paginate(query.filter(Experience.is_visible == True), skip, limit, after, with_total=with_total)
         except SQLAlchemyError as e:
             logger.error(f"Error retrieving visible experiences: {str(e)}")
             raise
             
     @BaseRepository.retry_decorator
-    def get_by_type(self, type_: str, skip: int = 0, limit: int = 100, only_visible: bool = False) -> List[Experience]:
+    def get_by_type(self, type_: str, skip: int = 0, limit: int = 100, only_visible: bool = False, fields: Optional[Sequence[str]] = None, after: Optional[CursorPosition] = None, with_total: bool = False) -> Page:
         """Get experiences filtered by type with retry capability"""
         try:
-            query = self.db.query(Experience).filter(Experience.type == type_)
+            query = self.apply_fields(self.db.query(Experience), fields).filter(Experience.type == type_)
             if only_visible:
                 query = query.filter(Experience.is_visible == True)
-            return query.offset(skip).limit(limit).all()
+            return self.paginate(query, skip, limit, after, with_total=with_total)
         except SQLAlchemyError as e:
             logger.error(f"Error retrieving {type_} experiences: {str(e)}")
             raise
@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from app.models.project_category_model import ProjectCategory
-from app.repositories.base_repository import BaseRepository
+from app.repositories.base_repository import BaseRepository, Page
+from app.utils.pagination import CursorPosition
 from typing import List, Optional, Dict, Any
 from sqlalchemy.exc import SQLAlchemyError
 import logging
@@ -9,6 +10,8 @@ import uuid
 logger = logging.getLogger(__name__)
 
 class ProjectCategoryRepository(BaseRepository):
+    model = ProjectCategory
+
     def __init__(self, db: Session):
         super().__init__(db)
 
@@ -21,19 +24,19 @@ class ProjectCategoryRepository(BaseRepository):
         return category
 
     @BaseRepository.retry_decorator
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[ProjectCategory]:
+    def get_all(self, skip: int = 0, limit: int = 100, after: Optional[CursorPosition] = None, with_total: bool = False) -> Page:
         """Get all categories with retry capability"""
         try:
-            return self.db.query(ProjectCategory).offset(skip).limit(limit).all()
+            return self.paginate(self.db.query(ProjectCategory), skip, limit, after, with_total=with_total)
         except SQLAlchemyError as e:
             logger.error(f"Error retrieving project categories: {str(e)}")
             raise
 
     @BaseRepository.retry_decorator
-    def get_visible(self, skip: int = 0, limit: int = 100) -> List[ProjectCategory]:
+    def get_visible(self, skip: int = 0, limit: int = 100, after: Optional[CursorPosition] = None, with_total: bool = False) -> Page:
         """Get only visible categories with retry capability"""
         try:
-            return self.db.query(ProjectCategory).filter(ProjectCategory.is_visible == True).offset(skip).limit(limit).all()
+            return self.paginate(self.db.query(ProjectCategory).filter(ProjectCategory.is_visible == True), skip, limit, after, with_total=with_total)
         except SQLAlchemyError as e:
             logger.error(f"Error retrieving visible project categories: {str(e)}")
             raise
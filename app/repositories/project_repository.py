@@ -1,7 +1,9 @@
 from sqlalchemy.orm import Session
 from app.models.project_model import Project
-from app.repositories.base_repository import BaseRepository
-from typing import List, Optional, Dict, Any
+from app.repositories.base_repository import BaseRepository, Page
+from app.utils.pagination import CursorPosition
+from typing import List, Optional, Dict, Any, Sequence, Tuple
+from datetime import datetime
 from sqlalchemy.exc import SQLAlchemyError
 import logging
 import uuid
@@ -9,6 +11,8 @@ import uuid
 logger = logging.getLogger(__name__)
 
 class ProjectRepository(BaseRepository):
+    model = Project
+
     def __init__(self, db: Session):
         super().__init__(db)
 
@@ -21,19 +25,21 @@ class ProjectRepository(BaseRepository):
         return project
 
     @BaseRepository.retry_decorator
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[Project]:
+    def get_all(self, skip: int = 0, limit: int = 100, fields: Optional[Sequence[str]] = None, after: Optional[CursorPosition] = None, with_total: bool = False) -> Page:
         """Get all projects with retry capability"""
         try:
-            return self.db.query(Project).offset(skip).limit(limit).all()
+            query = self.apply_fields(self.db.query(Project), fields)
+            return self.paginate(query, skip, limit, after, with_total=with_total)
         except SQLAlchemyError as e:
             logger.error(f"Error retrieving projects: {str(e)}")
             raise
 
     @BaseRepository.retry_decorator
-    def get_visible(self, skip: int = 0, limit: int = 100) -> List[Project]:
+    def get_visible(self, skip: int = 0, limit: int = 100, fields: Optional[Sequence[str]] = None, after: Optional[CursorPosition] = None, with_total: bool = False) -> Page:
         """Get only visible projects with retry capability"""
         try:
-            return self.db.query(Project).filter(Project.is_visible == True).offset(skip).limit(limit).all()
+            query = self.apply_fields(self.db.query(Project), fields)
+            return self.paginate(query.filter(Project.is_visible == True), skip, limit, after, with_total=with_total)
         except SQLAlchemyError as e:
             logger.error(f"Error retrieving visible projects: {str(e)}")
             raise
@@ -59,6 +65,24 @@ class ProjectRepository(BaseRepository):
             logger.error(f"Error retrieving visible project {project_id}: {str(e)}")
             raise
 
+    @BaseRepository.retry_decorator
+    def get_visible_additional_data(self, project_id: uuid.UUID) -> Optional[Tuple[datetime, Optional[Dict[str, Any]]]]:
+        """
+        Get only the updated_at and additional_data columns of a visible project.
+
+        Returns:
+            Optional[Tuple[datetime, Optional[Dict[str, Any]]]]: (updated_at, additional_data), or None if not found
+        """
+        try:
+            row = self.db.query(Project.updated_at, Project.additional_data).filter(
+                Project.id == project_id,
+                Project.is_visible == True
+            ).first()
+            return (row.updated_at, row.additional_data) if row else None
+        except SQLAlchemyError as e:
+            logger.error(f"Error retrieving additional data of project {project_id}: {str(e)}")
+            raise
+
     @BaseRepository.retry_decorator
     def update(self, project_id: uuid.UUID, project_data: Dict[str, Any]) -> Optional[Project]:
         """Update a project with retry capability"""
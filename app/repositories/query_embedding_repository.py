@@ -0,0 +1,45 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.sql import func
+from app.models.vector_store import QueryEmbedding
+from app.repositories.base_repository import BaseRepository
+from typing import List, Optional, Tuple
+from datetime import datetime
+from sqlalchemy.exc import SQLAlchemyError
+import logging
+import uuid
+
+logger = logging.getLogger(__name__)
+
+class QueryEmbeddingRepository(BaseRepository):
+    model = QueryEmbedding
+
+    def __init__(self, db: Session):
+        super().__init__(db)
+
+    def get(self, key_hash: str) -> Optional[Tuple[List[float], datetime]]:
+        """Get a cached query embedding and when it was computed"""
+        try:
+            row = self.db.query(QueryEmbedding.embedding, QueryEmbedding.updated_at).filter(
+                QueryEmbedding.key_hash == key_hash
+            ).first()
+            return (list(row.embedding), row.updated_at) if row else None
+        except SQLAlchemyError as e:
+            logger.error(f"Error retrieving cached query embedding: {str(e)}")
+            raise
+
+    @BaseRepository.retry_decorator
+    def upsert(self, key_hash: str, query_text: str, embedding: List[float]) -> None:
+        """Store a query embedding, replacing an expired one with the same key"""
+        with self.transaction():
+            statement = insert(QueryEmbedding).values(
+                id=uuid.uuid4(),
+                key_hash=key_hash,
+                query_text=query_text,
+                embedding=embedding
+            )
+            statement = statement.on_conflict_do_update(
+                index_elements=[QueryEmbedding.key_hash],
+                set_={"embedding": statement.excluded.embedding, "updated_at": func.now()}
+            )
+            self.db.execute(statement)
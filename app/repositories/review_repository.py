@@ -1,7 +1,8 @@
 from sqlalchemy.orm import Session
 from app.models.review_model import Review
-from app.repositories.base_repository import BaseRepository
-from typing import List, Optional, Dict, Any
+from app.repositories.base_repository import BaseRepository, Page
+from app.utils.pagination import CursorPosition
+from typing import List, Optional, Dict, Any, Sequence
 from sqlalchemy.exc import SQLAlchemyError
 import logging
 import uuid
@@ -9,6 +10,8 @@ import uuid
 logger = logging.getLogger(__name__)
 
 class ReviewRepository(BaseRepository):
+    model = Review
+
     def __init__(self, db: Session):
         super().__init__(db)
 
@@ -21,19 +24,21 @@ class ReviewRepository(BaseRepository):
         return review
 
     @BaseRepository.retry_decorator
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[Review]:
+    def get_all(self, skip: int = 0, limit: int = 100, fields: Optional[Sequence[str]] = None, after: Optional[CursorPosition] = None, with_total: bool = False) -> Page:
         """Get all reviews with retry capability"""
         try:
-            return self.db.query(Review).offset(skip).limit(limit).all()
+            query = self.apply_fields(self.db.query(Review), fields)
+            return self.paginate(query, skip, limit, after, with_total=with_total)
         except SQLAlchemyError as e:
             logger.error(f"Error retrieving reviews: {str(e)}")
             raise
 
     @BaseRepository.retry_decorator
-    def get_visible(self, skip: int = 0, limit: int = 100) -> List[Review]:
+    def get_visible(self, skip: int = 0, limit: int = 100, fields: Optional[Sequence[str]] = None, after: Optional[CursorPosition] = None, with_total: bool = False) -> Page:
         """Get only visible reviews with retry capability"""
         try:
-            return self.db.query(Review).filter(Review.is_visible == True).offset(skip).limit(limit).all()
+            query = self.apply_fields(self.db.query(Review), fields)
+            return self.paginate(query.filter(Review.is_visible == True), skip, limit, after, with_total=with_total)
         except SQLAlchemyError as e:
             logger.error(f"Error retrieving visible reviews: {str(e)}")
             raise
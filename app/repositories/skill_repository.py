@@ -1,14 +1,19 @@
 from sqlalchemy.orm import Session
-from app.models.skill_model import SkillGroup
-from app.repositories.base_repository import BaseRepository
-from typing import List, Optional, Dict, Any
+from sqlalchemy import func, distinct
+from app.models.skill_model import SkillGroup, Skill
+from app.repositories.base_repository import BaseRepository, Page
+from app.utils.pagination import CursorPosition
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.exc import SQLAlchemyError
+from datetime import datetime
 import logging
 import uuid
 
 logger = logging.getLogger(__name__)
 
 class SkillGroupRepository(BaseRepository):
+    model = SkillGroup
+
     def __init__(self, db: Session):
         super().__init__(db)
 
@@ -21,19 +26,19 @@ class SkillGroupRepository(BaseRepository):
         return skill_group
 
     @BaseRepository.retry_decorator
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[SkillGroup]:
+    def get_all(self, skip: int = 0, limit: int = 100, after: Optional[CursorPosition] = None, with_total: bool = False) -> Page:
         """Get all skill groups with retry capability"""
         try:
-            return self.db.query(SkillGroup).offset(skip).limit(limit).all()
+            return self.paginate(self.db.query(SkillGroup), skip, limit, after, with_total=with_total)
         except SQLAlchemyError as e:
             logger.error(f"Error retrieving skill groups: {str(e)}")
             raise
 
     @BaseRepository.retry_decorator
-    def get_visible(self, skip: int = 0, limit: int = 100) -> List[SkillGroup]:
+    def get_visible(self, skip: int = 0, limit: int = 100, after: Optional[CursorPosition] = None, with_total: bool = False) -> Page:
         """Get only visible skill groups with retry capability"""
         try:
-            return self.db.query(SkillGroup).filter(SkillGroup.is_visible == True).offset(skip).limit(limit).all()
+            return self.paginate(self.db.query(SkillGroup).filter(SkillGroup.is_visible == True), skip, limit, after, with_total=with_total)
         except SQLAlchemyError as e:
             logger.error(f"Error retrieving visible skill groups: {str(e)}")
             raise
@@ -96,3 +101,26 @@ class SkillGroupRepository(BaseRepository):
         except SQLAlchemyError as e:
             logger.error(f"Error counting visible skill groups: {str(e)}")
             raise
+
+    @BaseRepository.retry_decorator
+    def get_version(self, only_visible: bool = False) -> Tuple[Optional[datetime], int]:
+        """
+        Get the latest updated_at and row count across skill groups and their skills.
+        Skills are replaced wholesale on update without touching the group row,
+        so they have to be part of the version.
+        """
+        try:
+            query = self.db.query(
+                func.max(SkillGroup.updated_at),
+                func.max(Skill.updated_at),
+                func.count(distinct(SkillGroup.id)),
+                func.count(Skill.id)
+            ).outerjoin(Skill, Skill.skill_group_id == SkillGroup.id)
+            if only_visible:
+                query = query.filter(SkillGroup.is_visible == True)
+            groups_modified, skills_modified, group_count, skill_count = query.one()
+            last_modified = max(filter(None, [groups_modified, skills_modified]), default=None)
+            return last_modified, group_count + skill_count
+        except SQLAlchemyError as e:
+            logger.error(f"Error retrieving skill groups version: {str(e)}")
+            raise
@@ -0,0 +1,6 @@
+from pydantic import BaseModel, Field
+
+# Schema for a resized image variant, used to build srcset attributes
+class ImageVariant(BaseModel):
+    width: int = Field(..., description="Width of the variant in pixels")
+    url: str = Field(..., description="URL of the WebP variant asset")
@@ -78,4 +78,5 @@ class ExperienceResponse(BaseModel):
 # Schema for experience list response
 class ExperienceListResponse(BaseModel):
     experiences: List[ExperienceResponse]
-    total: int
+    total: Optional[int] = Field(None, description="Total number of matching rows, None when include_total=false")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, None on the last page")
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 import uuid
 
@@ -27,4 +27,5 @@ class ProjectCategoryResponse(ProjectCategoryBase):
 
 class ProjectCategoryListResponse(BaseModel):
     categories: List[ProjectCategoryResponse]
-    total: int
+    total: Optional[int] = Field(None, description="Total number of matching rows, None when include_total=false")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, None on the last page")
@@ -3,12 +3,14 @@ from typing import Optional, List, Any, Dict
 from datetime import datetime
 import uuid
 
+from app.schemas.asset_schema import ImageVariant
+
 # Base schema for shared attributes
 class ProjectBase(BaseModel):
     title: str = Field(..., min_length=1, max_length=100)
     description: Optional[str] = None
     type: str = Field(...) # "github" or "custom"
-    image: Optional[str] = Field(None, description="Base64 encoded image string")
+    image: Optional[str] = Field(None, description="Base64 encoded image string, stored as an asset")
     tags: List[str] = Field(default_factory=list)
     url: Optional[str] = None
     is_visible: bool = True  # Default to visible
@@ -31,7 +33,7 @@ class ProjectUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=1, max_length=100)
     description: Optional[str] = None
     type: Optional[str] = None
-    image: Optional[str] = Field(None, description="Base64 encoded image string")
+    image: Optional[str] = Field(None, description="Base64 encoded image string, stored as an asset")
     tags: Optional[List[str]] = None
     url: Optional[str] = None
     is_visible: Optional[bool] = None
@@ -49,17 +51,17 @@ class ProjectUpdate(BaseModel):
 class ProjectVisibilityUpdate(BaseModel):
     is_visible: bool
 
-# Schema for project response with additional_data included
+# Schema for project response, without the (large) GitHub additional_data
 class ProjectResponse(BaseModel):
     id: uuid.UUID
     title: str
     description: Optional[str] = None
     type: str
-    image: Optional[str] = Field(None, description="Base64 encoded image string")
+    image: Optional[str] = Field(None, description="URL of the image asset")
+    image_variants: Optional[List[ImageVariant]] = Field(None, description="Resized WebP variants of the image, for srcset")
     tags: List[str] = []
     url: Optional[str] = None
     is_visible: bool
-    additional_data: Optional[Dict[str, Any]] = None  # Include GitHub API response
     created_at: datetime
     updated_at: datetime
     expiry_date: Optional[datetime] = None
@@ -68,7 +70,26 @@ class ProjectResponse(BaseModel):
     class Config:
         from_attributes = True
 
+# Schema for single project responses with additional_data included
+class ProjectWithDataResponse(ProjectResponse):
+    additional_data: Optional[Dict[str, Any]] = None  # Include GitHub API response
+
+# Schema for the lazily loaded project details (README and repository stats)
+class ProjectDetailsResponse(BaseModel):
+    id: uuid.UUID
+    updated_at: datetime
+    readme: Optional[str] = Field(None, description="README markdown with links made absolute")
+    languages: Dict[str, int] = Field(default_factory=dict, description="Bytes of code per language")
+    html_url: Optional[str] = None
+    homepage: Optional[str] = None
+    topics: List[str] = Field(default_factory=list)
+    stargazers_count: Optional[int] = None
+    forks_count: Optional[int] = None
+    open_issues_count: Optional[int] = None
+    pushed_at: Optional[datetime] = None
+
 # Schema for project list response
 class ProjectListResponse(BaseModel):
     projects: List[ProjectResponse]
-    total: int
+    total: Optional[int] = Field(None, description="Total number of matching rows, None when include_total=false")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, None on the last page")
@@ -31,4 +31,5 @@ class ReviewResponse(ReviewBase):
 # Schema for review list response
 class ReviewListResponse(BaseModel):
     reviews: List[ReviewResponse]
-    total: int
+    total: Optional[int] = Field(None, description="Total number of matching rows, None when include_total=false")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, None on the last page")
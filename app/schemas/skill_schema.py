@@ -42,4 +42,5 @@ class SkillGroupResponse(SkillGroupBase):
 # Schema for skill group list response
 class SkillGroupListResponse(BaseModel):
     skill_groups: List[SkillGroupResponse]
-    total: int
+    total: Optional[int] = Field(None, description="Total number of matching rows, None when include_total=false")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, None on the last page")
@@ -3,6 +3,8 @@ from typing import Optional, List
 from datetime import datetime
 import uuid
 
+from app.schemas.asset_schema import ImageVariant
+
 # Social link schema
 class SocialLink(BaseModel):
     platform: str
@@ -15,7 +17,7 @@ class SocialLink(BaseModel):
 class About(BaseModel):
     description: Optional[str] = None
     shortdescription: Optional[str] = None
-    image: Optional[str] = Field(None, description="Base64 encoded image string")
+    image: Optional[str] = Field(None, description="Base64 encoded image string on update, asset URL in responses")
 
 # Base schema for shared required attributes
 class UserBase(BaseModel):
@@ -36,7 +38,7 @@ class UserUpdate(BaseModel):
     phone: Optional[str] = None
     location: Optional[str] = None
     availability: Optional[str] = None
-    avatar: Optional[str] = Field(None, description="Base64 encoded image string")
+    avatar: Optional[str] = Field(None, description="Base64 encoded image string, stored as an asset")
     social_links: Optional[List[SocialLink]] = None
     about: Optional[About] = None
     featured_skill_ids: Optional[List[uuid.UUID]] = Field(None, description="List of skill UUIDs to feature on profile")
@@ -52,7 +54,8 @@ class UserResponse(BaseModel):
     phone: Optional[str] = None
     location: Optional[str] = None
     availability: Optional[str] = None
-    avatar: Optional[str] = Field(None, description="Base64 encoded image string")
+    avatar: Optional[str] = Field(None, description="URL of the avatar asset")
+    avatar_variants: Optional[List[ImageVariant]] = Field(None, description="Resized WebP variants of the avatar, for srcset")
     social_links: Optional[List[SocialLink]] = None
     about: Optional[About] = None
     featured_skill_ids: Optional[List[uuid.UUID]] = None
@@ -72,7 +75,7 @@ class UserProfile(BaseModel):
     phone: Optional[str] = None
     location: Optional[str] = None
     availability: Optional[str] = None
-    avatar: Optional[str] = Field(None, description="Base64 encoded image string")
+    avatar: Optional[str] = Field(None, description="URL of the avatar asset")
     social_links: Optional[List[SocialLink]] = None
     about: Optional[About] = None
     featured_skill_ids: Optional[List[uuid.UUID]] = None
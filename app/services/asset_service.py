@@ -0,0 +1,153 @@
+from app.repositories.asset_repository import AssetRepository
+from app.models.asset_model import Asset
+from app.config.settings import settings
+from app.utils.image_utils import generate_image_variants
+from sqlalchemy.orm import Session
+from typing import Optional, Tuple, Dict, Any, List
+import filetype
+import hashlib
+import base64
+import binascii
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# data:[<mediatype>][;param=value]*;base64,<data>
+DATA_URL_PATTERN = re.compile(r"^data:(?P<content_type>[\w.+-]+/[\w.+-]+)?(?:;[\w-]+=[^;,]*)*;base64,(?P<data>.*)$", re.DOTALL)
+
+# Raw base64 values shorter than this are treated as plain strings, not uploads
+MIN_RAW_BASE64_LENGTH = 64
+
+ASSET_URL_PATTERN = re.compile(r"/assets/(?P<hash>[0-9a-f]{64})$")
+
+def asset_url(asset_hash: str) -> str:
+    """Build the public URL an asset is served from"""
+    return f"{settings.ASSET_BASE_URL}{settings.API_PREFIX}/assets/{asset_hash}"
+
+def asset_hash_from_url(url: Any) -> Optional[str]:
+    """Extract the content hash from an asset URL, or None if it isn't one"""
+    if not isinstance(url, str):
+        return None
+    match = ASSET_URL_PATTERN.search(url)
+    return match.group("hash") if match else None
+
+def decode_base64_payload(value: Any) -> Optional[Tuple[bytes, str]]:
+    """
+    Decode a base64 upload, either as a data URL or as a raw base64 string.
+
+    Returns:
+        Tuple of (raw bytes, content type), or None if the value is not a base64 payload
+        (for example a regular URL or an asset URL that was already stored)
+    """
+    if not isinstance(value, str) or not value:
+        return None
+
+    match = DATA_URL_PATTERN.match(value)
+    if match:
+        content_type = match.group("content_type")
+        encoded = match.group("data")
+    elif value.startswith(("http://", "https://", "/")) or len(value) < MIN_RAW_BASE64_LENGTH:
+        return None
+    else:
+        content_type = None
+        encoded = value
+
+    try:
+        data = base64.b64decode("".join(encoded.split()), validate=True)
+    except (binascii.Error, ValueError):
+        return None
+
+    if not data:
+        return None
+
+    if not content_type:
+        content_type = filetype.guess_mime(data) or "application/octet-stream"
+
+    return data, content_type
+
+class AssetService:
+    def __init__(self, db: Session):
+        self.repository = AssetRepository(db)
+
+    def store(self, data: bytes, content_type: str) -> str:
+        """
+        Store raw bytes in the content-addressed asset store.
+        Identical content is only stored once.
+
+        Returns:
+            str: The public URL of the asset
+        """
+        asset_hash = hashlib.sha256(data).hexdigest()
+        self.repository.create_if_missing(asset_hash, content_type, data)
+        logger.info(f"Stored asset {asset_hash} ({content_type}, {len(data)} bytes)")
+        return asset_url(asset_hash)
+
+    def externalize(self, value: Optional[str]) -> Optional[str]:
+        """
+        Move a base64 payload into the asset store and return its URL.
+        Values that are not base64 payloads are returned unchanged.
+        """
+        decoded = decode_base64_payload(value)
+        if not decoded:
+            return value
+        data, content_type = decoded
+        return self.store(data, content_type)
+
+    def store_image_variants(self, data: bytes) -> List[Dict[str, Any]]:
+        """
+        Generate the resized WebP variants of an image and store them as assets.
+
+        Returns:
+            List[Dict[str, Any]]: srcset-style variant references ({"width", "url"}), empty if the image can't be processed
+        """
+        variants = generate_image_variants(data, settings.IMAGE_VARIANT_WIDTHS, settings.IMAGE_VARIANT_QUALITY)
+        return [{"width": width, "url": self.store(variant, "image/webp")} for width, variant in variants]
+
+    def externalize_image(self, value: Optional[str]) -> Tuple[Optional[str], Optional[List[Dict[str, Any]]]]:
+        """
+        Move a base64 image into the asset store along with its resized variants.
+
+        Returns:
+            Tuple of (asset URL, variants). Values that are not base64 payloads are
+            returned unchanged with None variants.
+        """
+        decoded = decode_base64_payload(value)
+        if not decoded:
+            return value, None
+        data, content_type = decoded
+        return self.store(data, content_type), self.store_image_variants(data)
+
+    def image_variants_for_url(self, url: Optional[str]) -> Optional[List[Dict[str, Any]]]:
+        """Generate variants for an image that is already in the asset store"""
+        asset_hash = asset_hash_from_url(url)
+        if not asset_hash:
+            return None
+        asset = self.get_asset(asset_hash)
+        if not asset or not asset.content_type.startswith("image/"):
+            return None
+        return self.store_image_variants(asset.data)
+
+    def externalize_user_data(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Move base64 payloads of a user profile update (avatar, about image and
+        document-type social links) into the asset store. Uploaded avatars also
+        get their resized variants in `avatar_variants`.
+        """
+        if user_data.get("avatar"):
+            user_data["avatar"], avatar_variants = self.externalize_image(user_data["avatar"])
+            if avatar_variants is not None:
+                user_data["avatar_variants"] = avatar_variants
+
+        if user_data.get("about") and user_data["about"].get("image"):
+            user_data["about"]["image"] = self.externalize(user_data["about"]["image"])
+
+        for link in user_data.get("social_links") or []:
+            if link.get("platform") == "document" and link.get("url"):
+                link["url"] = self.externalize(link["url"])
+
+        return user_data
+
+    def get_asset(self, asset_hash: str) -> Optional[Asset]:
+        """Get an asset including its content"""
+        return self.repository.get_by_hash(asset_hash)
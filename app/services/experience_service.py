@@ -3,8 +3,14 @@ from app.schemas.experience_schema import (
     ExperienceCreate, ExperienceUpdate, ExperienceResponse,
     ExperienceListResponse, ExperienceVisibilityUpdate
 )
+from app.utils.public_data_cache import public_data_cache
+from app.jobs.vector_indexer import vector_indexer
+from app.utils.field_selection import partial_model, partial_list_model
+from app.utils.pagination import CursorPosition
+from app.repositories.base_repository import Page
 from sqlalchemy.orm import Session
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime
 import logging
 import uuid
 
@@ -22,35 +28,45 @@ class ExperienceService:
         experience_dict = experience_data.model_dump()
         
         experience = self.repository.create(experience_dict)
+        public_data_cache.invalidate()
+        vector_indexer.schedule("experience", experience.id)
         return ExperienceResponse.model_validate(experience)
 
-    def get_experiences(self, skip: int = 0, limit: int = 100, only_visible: bool = False) -> ExperienceListResponse:
-        """Get all experiences, optionally filtering by visibility"""
-        logger.info(f"Retrieving all experiences (skip={skip}, limit={limit}, only_visible={only_visible})")
+    def get_version(self, only_visible: bool = False) -> Tuple[Optional[datetime], int]:
+        """Get the experience list version (latest updated_at, row count) used for HTTP cache validators"""
+        return self.repository.get_version(only_visible)
+
+    def _build_list_response(self, page: Page, fields: Optional[Tuple[str, ...]] = None) -> ExperienceListResponse:
+        """Build the list response, using a partial response model when only some fields were selected"""
+        item_model = partial_model(ExperienceResponse, fields) if fields else ExperienceResponse
+        list_model = partial_list_model(ExperienceListResponse, "experiences", item_model) if fields else ExperienceListResponse
+        return list_model(
+            experiences=[item_model.model_validate(e) for e in page.items],
+            total=page.total,
+            next_cursor=page.next_cursor
+        )
+
+    def get_experiences(self, skip: int = 0, limit: int = 100, only_visible: bool = False, fields: Optional[Tuple[str, ...]] = None, after: Optional[CursorPosition] = None, include_total: bool = True) -> ExperienceListResponse:
+        """
+        Get all experiences, optionally filtering by visibility, restricting the returned fields and starting after a cursor position.
+        The total is fetched in the same query as the page, or skipped when `include_total` is False.
+        """
+        logger.info(f"Retrieving all experiences (skip={skip}, limit={limit}, only_visible={only_visible}, fields={fields}, after={after}, include_total={include_total})")
         
         if only_visible:
-            experiences = self.repository.get_visible(skip, limit)
-            total = self.repository.count_visible()
+            page = self.repository.get_visible(skip, limit, fields, after, with_total=include_total)
         else:
-            experiences = self.repository.get_all(skip, limit)
-            total = self.repository.count()
+            page = self.repository.get_all(skip, limit, fields, after, with_total=include_total)
             
-        return ExperienceListResponse(
-            experiences=[ExperienceResponse.model_validate(e) for e in experiences],
-            total=total
-        )
+        return self._build_list_response(page, fields)
     
-    def get_experiences_by_type(self, type_: str, skip: int = 0, limit: int = 100, only_visible: bool = False) -> ExperienceListResponse:
-        """Get experiences filtered by type, optionally filtering by visibility"""
-        logger.info(f"Retrieving {type_} entries (skip={skip}, limit={limit}, only_visible={only_visible})")
+    def get_experiences_by_type(self, type_: str, skip: int = 0, limit: int = 100, only_visible: bool = False, fields: Optional[Tuple[str, ...]] = None, after: Optional[CursorPosition] = None, include_total: bool = True) -> ExperienceListResponse:
+        """Get experiences filtered by type, with the same options as get_experiences"""
+        logger.info(f"Retrieving {type_} entries (skip={skip}, limit={limit}, only_visible={only_visible}, fields={fields}, after={after}, include_total={include_total})")
         
-        experiences = self.repository.get_by_type(type_, skip, limit, only_visible)
-        total = self.repository.count_by_type(type_, only_visible)
+        page = self.repository.get_by_type(type_, skip, limit, only_visible, fields, after, with_total=include_total)
             
-        return ExperienceListResponse(
-            experiences=[ExperienceResponse.model_validate(e) for e in experiences],
-            total=total
-        )
+        return self._build_list_response(page, fields)
 
     def get_experience_by_id(self, experience_id: uuid.UUID, only_visible: bool = False) -> Optional[ExperienceResponse]:
         """Get an experience by ID, optionally filtering by visibility"""
@@ -80,6 +96,8 @@ class ExperienceService:
         
         updated_experience = self.repository.update(experience_id, update_dict)
         if updated_experience:
+            public_data_cache.invalidate()
+            vector_indexer.schedule("experience", experience_id)
             return ExperienceResponse.model_validate(updated_experience)
         return None
 
@@ -98,6 +116,8 @@ class ExperienceService:
         updated_experience = self.repository.update(experience_id, update_data)
         
         if updated_experience:
+            public_data_cache.invalidate()
+            vector_indexer.schedule("experience", experience_id)
             logger.info(f"Updated visibility for experience ID {experience_id} to {visibility_data.is_visible}")
             return ExperienceResponse.model_validate(updated_experience)
         
@@ -106,4 +126,8 @@ class ExperienceService:
     def delete_experience(self, experience_id: uuid.UUID) -> bool:
         """Delete an experience"""
         logger.info(f"Deleting experience with ID: {experience_id}")
-        return self.repository.delete(experience_id)
+        deleted = self.repository.delete(experience_id)
+        if deleted:
+            public_data_cache.invalidate()
+            vector_indexer.schedule("experience", experience_id)
+        return deleted
@@ -1,7 +1,10 @@
 from app.repositories.project_category_repository import ProjectCategoryRepository
 from app.schemas.project_category_schema import ProjectCategoryResponse, ProjectCategoryListResponse, ProjectCategoryCreate, ProjectCategoryUpdate
+from app.utils.public_data_cache import public_data_cache
+from app.utils.pagination import CursorPosition
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Optional, Tuple
+from datetime import datetime
 import logging
 import uuid
 
@@ -16,17 +19,20 @@ class ProjectCategoryService:
             return None
         return ProjectCategoryResponse.model_validate(category)
 
-    def get_categories(self, skip: int = 0, limit: int = 100, only_visible: bool = False) -> ProjectCategoryListResponse:
-        logger.info(f"Retrieving project categories (skip={skip}, limit={limit}, only_visible={only_visible})")
+    def get_version(self, only_visible: bool = False) -> Tuple[Optional[datetime], int]:
+        """Get the project category list version (latest updated_at, row count) used for HTTP cache validators"""
+        return self.repository.get_version(only_visible)
+
+    def get_categories(self, skip: int = 0, limit: int = 100, only_visible: bool = False, after: Optional[CursorPosition] = None, include_total: bool = True) -> ProjectCategoryListResponse:
+        logger.info(f"Retrieving project categories (skip={skip}, limit={limit}, only_visible={only_visible}, after={after}, include_total={include_total})")
         if only_visible:
-            categories = self.repository.get_visible(skip, limit)
-            total = self.repository.count_visible()
+            page = self.repository.get_visible(skip, limit, after, with_total=include_total)
         else:
-            categories = self.repository.get_all(skip, limit)
-            total = self.repository.count()
+            page = self.repository.get_all(skip, limit, after, with_total=include_total)
         return ProjectCategoryListResponse(
-            categories=[self._to_response(c) for c in categories],
-            total=total
+            categories=[self._to_response(c) for c in page.items],
+            total=page.total,
+            next_cursor=page.next_cursor
         )
 
     def get_category_by_id(self, category_id: uuid.UUID, only_visible: bool = False) -> Optional[ProjectCategoryResponse]:
@@ -42,6 +48,7 @@ class ProjectCategoryService:
         logger.info(f"Creating project category: {category_data.name}")
         category_dict = category_data.model_dump()
         category = self.repository.create(category_dict)
+        public_data_cache.invalidate()
         return self._to_response(category)
 
     def update_category(self, category_id: uuid.UUID, category_data: ProjectCategoryUpdate) -> Optional[ProjectCategoryResponse]:
@@ -53,5 +60,6 @@ class ProjectCategoryService:
         update_dict = category_data.model_dump(exclude_unset=True)
         updated = self.repository.update(category_id, update_dict)
         if updated:
+            public_data_cache.invalidate()
             return self._to_response(updated)
         return None
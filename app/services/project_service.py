@@ -1,55 +1,90 @@
 from app.repositories.project_repository import ProjectRepository
-from app.schemas.project_schema import ProjectCreate, ProjectUpdate, ProjectResponse, ProjectListResponse, ProjectVisibilityUpdate
+from app.services.asset_service import AssetService
+from app.schemas.project_schema import (
+    ProjectCreate, ProjectUpdate, ProjectResponse, ProjectWithDataResponse,
+    ProjectListResponse, ProjectVisibilityUpdate, ProjectDetailsResponse
+)
 from app.utils.github_utils import fetch_github_data
+from app.utils.public_data_cache import public_data_cache
+from app.jobs.vector_indexer import vector_indexer
+from app.utils.field_selection import partial_model, partial_list_model
+from app.utils.pagination import CursorPosition
+from app.jobs.project_refresh import schedule_project_refresh
+from app.utils.db_utils import run_db
 from sqlalchemy.orm import Session
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timezone, timedelta
 import logging
 import uuid
 
 logger = logging.getLogger(__name__)
 
+def is_github_data_expired(project) -> bool:
+    """Check if this is a GitHub project whose cached GitHub data is past its expiry date"""
+    return bool(
+        project.type == "github"
+        and project.expiry_date
+        and project.expiry_date.replace(tzinfo=timezone.utc) < datetime.now(timezone.utc)
+    )
+
 class ProjectService:
+    """
+    Project use cases. The async methods await GitHub and run their database
+    work (and image processing) in the threadpool through `run_db`, so they
+    never block the event loop.
+    """
+
     def __init__(self, db: Session):
         self.repository = ProjectRepository(db)
+        self.asset_service = AssetService(db)
 
-    async def create_project(self, project_data: ProjectCreate) -> ProjectResponse:
+    async def create_project(self, project_data: ProjectCreate) -> ProjectWithDataResponse:
         """Create a new project, with special handling for GitHub projects"""
         logger.info(f"Creating project: {project_data.title}")
         
         # Convert to dict before passing to repository to avoid pydantic validation errors
         project_dict = project_data.model_dump()
         
+        # Store uploaded base64 images and their resized variants in the asset store
+        project_dict["image"], project_dict["image_variants"] = await run_db(self.asset_service.externalize_image, project_dict.get("image"))
+        
         # If it's a GitHub project, enrich data from GitHub API
         if project_data.type == "github" and project_data.url:
             try:
                 # Fetch GitHub data
-                basic_data, github_full_data = await fetch_github_data(project_data.url)
+                result = await fetch_github_data(project_data.url)
                 
                 # Only update fields that are not explicitly provided by the user
                 if not project_data.title or project_data.title == "":
-                    project_dict["title"] = basic_data["title"]
+                    project_dict["title"] = result.basic_data["title"]
                 
                 if not project_data.description or project_data.description == "":
-                    project_dict["description"] = basic_data["description"]
+                    project_dict["description"] = result.basic_data["description"]
                 
                 # Set expiry date for 1 day from now (using timezone-aware datetime)
                 project_dict["expiry_date"] = datetime.now(timezone.utc) + timedelta(days=1)
                 
-                # Store the complete GitHub response
-                project_dict["additional_data"] = github_full_data
+                # Store the complete GitHub response and its validators for conditional refreshes
+                project_dict["additional_data"] = result.github_data
+                project_dict["github_validators"] = result.validators
                 
             except Exception as e:
                 logger.error(f"Error fetching GitHub data: {str(e)}")
                 # Continue with the data provided by the user
         
         # Create the project
-        project = self.repository.create(project_dict)
+        def create() -> ProjectWithDataResponse:
+            project = self.repository.create(project_dict)
+            return ProjectWithDataResponse.model_validate(project)
+        
+        created_project = await run_db(create)
+        public_data_cache.invalidate()
+        vector_indexer.schedule("project", created_project.id)
         
         # Return the created project
-        return ProjectResponse.model_validate(project)
+        return created_project
 
-    async def refresh_github_data(self, project_id: uuid.UUID) -> Optional[ProjectResponse]:
+    async def refresh_github_data(self, project_id: uuid.UUID) -> Optional[ProjectWithDataResponse]:
         """
         Refresh GitHub data for a project.
         
@@ -62,7 +97,7 @@ class ProjectService:
         logger.info(f"Refreshing GitHub data for project ID: {project_id}")
         
         # Get the project
-        project = self.repository.get_by_id(project_id)
+        project = await run_db(self.repository.get_by_id, project_id)
         if not project:
             logger.warning(f"Project with ID {project_id} not found")
             return None
@@ -73,93 +108,128 @@ class ProjectService:
             return None
             
         try:
-            # Fetch fresh GitHub data
-            _, github_full_data = await fetch_github_data(project.url)
+            # Fetch fresh GitHub data, conditionally if validators were stored by an earlier fetch
+            result = await fetch_github_data(project.url, validators=project.github_validators)
             
-            # Update project data with timezone-aware datetime
-            update_data = {
-                "additional_data": github_full_data,
-                "expiry_date": datetime.now(timezone.utc) + timedelta(days=1)
-            }
+            def update() -> ProjectWithDataResponse:
+                # Update project data with timezone-aware datetime
+                update_data = {
+                    "expiry_date": datetime.now(timezone.utc) + timedelta(days=1)
+                }
+                
+                # Only rewrite the GitHub data if something changed since the last fetch
+                if not result.unchanged:
+                    update_data["additional_data"] = result.merge(project.additional_data) if result.not_modified else result.github_data
+                    update_data["github_validators"] = result.validators
+                else:
+                    logger.info(f"GitHub data of project {project_id} not modified, extending expiry date")
+                
+                # Update the project
+                updated_project = self.repository.update(project_id, update_data)
+                return ProjectWithDataResponse.model_validate(updated_project)
             
-            # Update the project
-            updated_project = self.repository.update(project_id, update_data)
-            return ProjectResponse.model_validate(updated_project)
+            refreshed_project = await run_db(update)
+            if not result.unchanged:
+                public_data_cache.invalidate()
+                vector_indexer.schedule("project", project_id)
+            return refreshed_project
             
         except Exception as e:
             logger.error(f"Error refreshing GitHub data for project {project_id}: {str(e)}")
             return None
 
-    async def get_projects(self, skip: int = 0, limit: int = 100, only_visible: bool = False) -> ProjectListResponse:
-        """Get projects with optional filtering by visibility and automatic refresh for GitHub projects"""
-        logger.info(f"Retrieving projects (skip={skip}, limit={limit}, only_visible={only_visible})")
-        
-        # Get projects based on visibility filter
-        if only_visible:
-            projects = self.repository.get_visible(skip, limit)
-            total = self.repository.count_visible()
-        else:
-            projects = self.repository.get_all(skip, limit)
-            total = self.repository.count()
-        
-        # Check for expired GitHub projects and refresh them
-        now = datetime.now(timezone.utc)
-        processed_projects = []
-        
-        for project in projects:
-            # Check if this is a GitHub project with an expiry date in the past
-            if (project.type == "github" and project.expiry_date and project.expiry_date.replace(tzinfo=timezone.utc) < now):
-                try:
-                    # Try to refresh the project data
-                    updated_project = await self.refresh_github_data(project.id)
-                    if updated_project:
-                        # Use the updated project
-                        processed_projects.append(updated_project)
-                    else:
-                        # If refresh failed, use the original project
-                        processed_projects.append(ProjectResponse.model_validate(project))
-                except Exception as e:
-                    logger.error(f"Error refreshing expired project {project.id}: {str(e)}")
-                    # Use the original project if refresh fails
-                    processed_projects.append(ProjectResponse.model_validate(project))
+    def get_version(self, only_visible: bool = False) -> Tuple[Optional[datetime], int]:
+        """Get the project list version (latest updated_at, row count) used for HTTP cache validators"""
+        return self.repository.get_version(only_visible)
+
+    async def get_projects(self, skip: int = 0, limit: int = 100, only_visible: bool = False, fields: Optional[Tuple[str, ...]] = None, after: Optional[CursorPosition] = None, include_total: bool = True) -> ProjectListResponse:
+        """
+        Get projects with optional filtering by visibility and background refresh of expired GitHub projects.
+        When `fields` is given only those columns are loaded and a partial response model is returned.
+        When `after` is given the page starts right after that cursor position.
+        The total is fetched in the same query as the page, or skipped when `include_total` is False.
+        """
+        logger.info(f"Retrieving projects (skip={skip}, limit={limit}, only_visible={only_visible}, fields={fields}, after={after}, include_total={include_total})")
+        
+        item_model = partial_model(ProjectResponse, fields) if fields else ProjectResponse
+        # The expiry check below needs the type and expiry date even if they weren't selected
+        load_fields = fields + ("type", "expiry_date") if fields else None
+        
+        def load():
+            # Get projects based on visibility filter
+            if only_visible:
+                page = self.repository.get_visible(skip, limit, load_fields, after, with_total=include_total)
             else:
-                # For non-expired or non-GitHub projects, just use the project as is
-                processed_projects.append(ProjectResponse.model_validate(project))
+                page = self.repository.get_all(skip, limit, load_fields, after, with_total=include_total)
+            expired_ids = [project.id for project in page.items if is_github_data_expired(project)]
+            return page, [item_model.model_validate(project) for project in page.items], expired_ids
+        
+        page, processed_projects, expired_ids = await run_db(load)
         
-        return ProjectListResponse(
+        # Serve expired GitHub projects as they are and refresh them in the
+        # background (stale-while-revalidate), so visitors never wait on GitHub
+        for project_id in expired_ids:
+            schedule_project_refresh(project_id)
+        
+        list_model = partial_list_model(ProjectListResponse, "projects", item_model) if fields else ProjectListResponse
+        return list_model(
             projects=processed_projects,
-            total=total
+            total=page.total,
+            next_cursor=page.next_cursor
         )
 
-    async def get_project(self, project_id: uuid.UUID, only_visible: bool = False) -> Optional[ProjectResponse]:
-        """Get a project by ID with automatic refresh if expired"""
+    async def get_project(self, project_id: uuid.UUID, only_visible: bool = False) -> Optional[ProjectWithDataResponse]:
+        """Get a project by ID with a background refresh if expired"""
         logger.info(f"Retrieving project with ID: {project_id}, only_visible={only_visible}")
         
-        # Get the project based on visibility filter
-        if only_visible:
-            project = self.repository.get_visible_by_id(project_id)
-        else:
-            project = self.repository.get_by_id(project_id)
-            
+        def load():
+            # Get the project based on visibility filter
+            if only_visible:
+                project = self.repository.get_visible_by_id(project_id)
+            else:
+                project = self.repository.get_by_id(project_id)
+            if not project:
+                return None, False
+            return ProjectWithDataResponse.model_validate(project), is_github_data_expired(project)
+        
+        project, expired = await run_db(load)
         if not project:
             return None
             
-        # Check if this is a GitHub project with an expiry date in the past
-        now = datetime.now(timezone.utc)
-        if (project.type == "github" and project.expiry_date and project.expiry_date.replace(tzinfo=timezone.utc) < now):
-            try:
-                # Try to refresh the project data
-                updated_project = await self.refresh_github_data(project.id)
-                if updated_project:
-                    return updated_project
-            except Exception as e:
-                logger.error(f"Error refreshing expired project {project.id}: {str(e)}")
-                # Continue with the original project if refresh fails
+        # Serve expired GitHub data as it is and refresh it in the background
+        if expired:
+            schedule_project_refresh(project.id)
+        
+        return project
+
+    def get_public_project_details(self, project_id: uuid.UUID) -> Optional[ProjectDetailsResponse]:
+        """
+        Get the README, language breakdown and repository stats of a visible project.
+        Only the additional_data column is loaded, so the project lists can leave it deferred.
+        """
+        logger.info(f"Retrieving details for project ID: {project_id}")
         
-        # Return the project (either original or couldn't be refreshed)
-        return ProjectResponse.model_validate(project)
+        result = self.repository.get_visible_additional_data(project_id)
+        if not result:
+            return None
+        
+        updated_at, additional_data = result
+        additional_data = additional_data or {}
+        return ProjectDetailsResponse(
+            id=project_id,
+            updated_at=updated_at,
+            readme=additional_data.get("readme_file"),
+            languages=additional_data.get("languages") or {},
+            html_url=additional_data.get("html_url"),
+            homepage=additional_data.get("homepage") or None,
+            topics=additional_data.get("topics") or [],
+            stargazers_count=additional_data.get("stargazers_count"),
+            forks_count=additional_data.get("forks_count"),
+            open_issues_count=additional_data.get("open_issues_count"),
+            pushed_at=additional_data.get("pushed_at")
+        )
 
-    async def update_project(self, project_id: uuid.UUID, project_data: ProjectUpdate) -> Optional[ProjectResponse]:
+    async def update_project(self, project_id: uuid.UUID, project_data: ProjectUpdate) -> Optional[ProjectWithDataResponse]:
         """Update a project"""
         logger.info(f"Updating project with ID: {project_id}")
         
@@ -167,16 +237,24 @@ class ProjectService:
         project_dict = project_data.model_dump(exclude_unset=True)
         
         # Get current project
-        project = self.repository.get_by_id(project_id)
+        project = await run_db(self.repository.get_by_id, project_id)
         if not project:
             return None
+        
+        # Store uploaded base64 images and their resized variants in the asset store
+        if "image" in project_dict:
+            project_dict["image"], image_variants = await run_db(self.asset_service.externalize_image, project_dict["image"])
+            # Drop stale variants when the image is replaced by a plain URL or removed
+            if image_variants is not None or project_dict["image"] != project.image:
+                project_dict["image_variants"] = image_variants
             
         # If project type is being changed to "github" and URL is provided, fetch GitHub data
         if "type" in project_dict and project_dict["type"] == "github" and "url" in project_dict:
             try:
                 # Fetch GitHub data
-                _, github_full_data = await fetch_github_data(project_dict["url"])
-                project_dict["additional_data"] = github_full_data
+                result = await fetch_github_data(project_dict["url"])
+                project_dict["additional_data"] = result.github_data
+                project_dict["github_validators"] = result.validators
                 project_dict["expiry_date"] = datetime.now(timezone.utc) + timedelta(days=1)
             except Exception as e:
                 logger.error(f"Error fetching GitHub data: {str(e)}")
@@ -186,12 +264,20 @@ class ProjectService:
         if "type" in project_dict and project_dict["type"] == "custom":
             project_dict["expiry_date"] = None
         
+        # Validators only describe the stored GitHub data, drop them when that data or the URL is replaced
+        if ("additional_data" in project_dict or "url" in project_dict) and "github_validators" not in project_dict:
+            project_dict["github_validators"] = None
+        
         # Update the project
-        updated_project = self.repository.update(project_id, project_dict)
+        def update() -> Optional[ProjectWithDataResponse]:
+            updated_project = self.repository.update(project_id, project_dict)
+            return ProjectWithDataResponse.model_validate(updated_project) if updated_project else None
         
+        updated_project = await run_db(update)
         if updated_project:
-            return ProjectResponse.model_validate(updated_project)
-        return None
+            public_data_cache.invalidate()
+            vector_indexer.schedule("project", project_id)
+        return updated_project
         
     def update_project_visibility(self, project_id: uuid.UUID, visibility_data: ProjectVisibilityUpdate) -> Optional[ProjectResponse]:
         """Update a project's visibility"""
@@ -208,6 +294,8 @@ class ProjectService:
         updated_project = self.repository.update(project_id, update_data)
         
         if updated_project:
+            public_data_cache.invalidate()
+            vector_indexer.schedule("project", project_id)
             logger.info(f"Updated visibility for project ID {project_id} to {visibility_data.is_visible}")
             return ProjectResponse.model_validate(updated_project)
         
@@ -216,4 +304,8 @@ class ProjectService:
     def delete_project(self, project_id: uuid.UUID) -> bool:
         """Delete a project"""
         logger.info(f"Deleting project with ID: {project_id}")
-        return self.repository.delete(project_id)
+        deleted = self.repository.delete(project_id)
+        if deleted:
+            public_data_cache.invalidate()
+            vector_indexer.schedule("project", project_id)
+        return deleted
@@ -0,0 +1,240 @@
+from sqlalchemy.orm import Session, undefer
+from app.models.user_model import User
+from app.models.skill_model import Skill, SkillGroup
+from app.models.experience_model import Experience
+from app.models.project_model import Project
+from app.models.project_category_model import ProjectCategory
+from app.models.review_model import Review
+from typing import Dict, Any, Optional
+from datetime import datetime
+from dateutil.relativedelta import relativedelta
+import logging
+import uuid
+
+logger = logging.getLogger(__name__)
+
+def calculate_total_experience(experiences):
+    """
+    Calculate the total years of experience from a list of experience objects.
+    Rounds down to the floor value and adds a "+" if there's a fractional part.
+
+    Args:
+        experiences (list): List of experience objects with start_date and end_date
+
+    Returns:
+        str: Total years of experience as a floor value with "+" if there's a fraction
+    """
+    # Filter for objects with type "experience"
+    experience_objects = [exp for exp in experiences if exp.type == "experience"]
+
+    # Initialize total experience in years
+    total_experience_years = 0
+
+    for exp in experience_objects:
+        # Get start and end dates
+        start_date = datetime.strptime(exp.start_date.strftime("%Y-%m-%d"), "%Y-%m-%d")
+
+        # Use end_date if available, otherwise use today's date
+        if exp.end_date:
+            end_date = datetime.strptime(exp.end_date.strftime("%Y-%m-%d"), "%Y-%m-%d")
+        else:
+            end_date = datetime.now()
+
+        # Calculate the difference
+        diff = relativedelta(end_date, start_date)
+
+        # Convert to years (including partial years)
+        years = diff.years + (diff.months / 12) + (diff.days / 365.25)
+
+        # Add to total
+        total_experience_years += years
+
+    # Get the floor value
+    floor_years = round(total_experience_years)
+
+    if floor_years < 2:
+        return floor_years
+
+    # Check if there's any fractional part
+    if total_experience_years > floor_years:
+        # Return floor value with "+"
+        return f"{floor_years}+"
+    else:
+        # Return just the floor value as string
+        return str(floor_years)
+
+class PublicDataService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def build_public_data(self, user_id: uuid.UUID) -> Optional[Dict[str, Any]]:
+        """
+        Build the combined public portfolio payload for a specific user.
+
+        Args:
+            user_id (uuid.UUID): The ID of the user to build the payload for
+
+        Returns:
+            Optional[Dict[str, Any]]: Formatted portfolio data, or None if the user does not exist
+        """
+        logger.info(f"Building public data snapshot for user {user_id}")
+
+        # Get the user by ID
+        user = self.db.query(User).filter(User.id == user_id).first()
+
+        if not user:
+            return None
+
+        # Get all public skill groups and their skills
+        skill_groups = self.db.query(SkillGroup).filter(SkillGroup.is_visible == True).all()
+
+        # Get all public experiences (work and education)
+        experiences = self.db.query(Experience).filter(Experience.is_visible == True).all()
+
+        # Get all public project categories
+        project_categories = self.db.query(ProjectCategory).filter(ProjectCategory.is_visible == True).all()
+
+        # Get all public projects (additional_data is deferred by default, load it in the same query)
+        projects = self.db.query(Project).options(undefer(Project.additional_data)).filter(Project.is_visible == True).all()
+
+        # Get all public reviews
+        reviews = self.db.query(Review).filter(Review.is_visible == True).all()
+
+        # Calculate total experience
+        total_experience = calculate_total_experience(experiences)
+
+        # Images are stored as asset URLs (rows written before the asset store may still hold base64)
+        avatar_url = user.avatar
+        about_image_url = user.about.get('image') if user.about else None
+
+        # Format experiences for timelineData
+        timeline_data = []
+
+        for exp in experiences:
+            item = {
+                "id": str(exp.id),
+                "type": exp.type,
+                "title": exp.title,
+                "company": exp.organization,
+                "period": f"{exp.start_date.strftime('%b %Y')} - {'Present' if not exp.end_date else exp.end_date.strftime('%b %Y')}",
+                "year": exp.start_date.year,
+                "description": exp.description
+            }
+
+            if exp.type == "education":
+                # For education, rename fields to match expected format
+                item["institution"] = item.pop("company")
+                item["degree"] = item.pop("title")
+
+            timeline_data.append(item)
+
+        # Format skill groups
+        formatted_skill_groups = []
+        for group in skill_groups:
+            # Check if skills is a JSON array or a relationship
+            if hasattr(group, 'skills') and isinstance(group.skills, list):
+                # It's JSON data
+                skills_data = group.skills
+            else:
+                # It's a relationship
+                skills_data = [
+                    {
+                        "id": str(skill.id),
+                        "name": skill.name,
+                        "proficiency": skill.proficiency,
+                        "color": skill.color,
+                        "icon": skill.icon
+                    }
+                    for skill in group.skills if hasattr(skill, 'is_visible') and skill.is_visible
+                ]
+
+            formatted_group = {
+                "name": group.name,
+                "skills": skills_data
+            }
+            formatted_skill_groups.append(formatted_group)
+
+        # Format projects - images are asset URLs
+        formatted_projects = []
+        for project in projects:
+            project_data = {
+                "id": str(project.id),
+                "type": project.type,
+                "title": project.title,
+                "description": project.description,
+                "image": project.image,
+                "image_variants": project.image_variants if project.image_variants else [],
+                "tags": project.tags if project.tags else [],
+                "url": project.url,
+                "additional_data": project.additional_data,
+                "created_at": project.created_at,
+                "project_category_id": str(project.project_category_id)
+            }
+            formatted_projects.append(project_data)
+
+        # Social links - Use the user's social links directly
+        social_links = user.social_links if user.social_links else []
+
+        # Get the user's featured skills if any
+        featured_skill_ids = user.featured_skill_ids if user.featured_skill_ids else []
+
+        # Get the full featured skill details if featured_skill_ids exist
+        featured_skills = []
+        if featured_skill_ids:
+            featured_skills_data = self.db.query(Skill).filter(Skill.id.in_(featured_skill_ids)).all()
+            featured_skills = [
+                {
+                    "id": str(skill.id),
+                    "name": skill.name,
+                    "proficiency": skill.proficiency,
+                    "color": skill.color,
+                    "icon": skill.icon
+                }
+                for skill in featured_skills_data
+            ]
+
+        # Build the final response according to the required format
+        return {
+            "name": user.name,
+            "surname": user.surname,
+            "title": user.title,
+            "email": user.email,
+            "phone": user.phone,
+            "location": f"Based in {user.location}" if user.location else "",
+            "availability": user.availability,
+            "avatar": avatar_url,
+            "avatarVariants": user.avatar_variants if user.avatar_variants else [],
+            "heroStats": {
+                "experience": total_experience
+            },
+            "socialLinks": social_links,
+            "featuredSkills": featured_skills,
+            "about": {
+                "title": "More about",
+                "highlight": "Myself",
+                "subtitle": "About",
+                "description": user.about.get("description") if user.about else "",
+                "shortdescription": user.about.get("shortdescription") if user.about else "",
+                "image": about_image_url
+            },
+            "projectsSection": {
+                "subtitle": "Projects",
+                "title": "My",
+                "highlight": "Projects"
+            },
+            "skillsSection": {
+                "subtitle": "Skills",
+                "title": "My",
+                "highlight": "Skills"
+            },
+            "timelineSection": {
+                "subtitle": "Experience & Education",
+                "title": "My",
+                "highlight": "Experience & Education"
+            },
+            "skillGroups": formatted_skill_groups,
+            "timelineData": timeline_data,
+            "projectCategories": project_categories,
+            "projects": formatted_projects,
+            "reviews": reviews
+        }
@@ -1,7 +1,12 @@
 from app.repositories.review_repository import ReviewRepository
 from app.schemas.review_schema import ReviewCreate, ReviewResponse, ReviewListResponse, ReviewVisibilityUpdate
+from app.utils.public_data_cache import public_data_cache
+from app.jobs.vector_indexer import vector_indexer
+from app.utils.field_selection import partial_model, partial_list_model
+from app.utils.pagination import CursorPosition
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from datetime import datetime
 import logging
 import uuid
 
@@ -19,22 +24,32 @@ class ReviewService:
         review_dict = review_data.model_dump()
         
         review = self.repository.create(review_dict)
+        public_data_cache.invalidate()
+        vector_indexer.schedule("review", review.id)
         return ReviewResponse.model_validate(review)
 
-    def get_reviews(self, skip: int = 0, limit: int = 100, only_visible: bool = False) -> ReviewListResponse:
-        """Get reviews, optionally filtering by visibility"""
-        logger.info(f"Retrieving reviews (skip={skip}, limit={limit}, only_visible={only_visible})")
+    def get_version(self, only_visible: bool = False) -> Tuple[Optional[datetime], int]:
+        """Get the review list version (latest updated_at, row count) used for HTTP cache validators"""
+        return self.repository.get_version(only_visible)
+
+    def get_reviews(self, skip: int = 0, limit: int = 100, only_visible: bool = False, fields: Optional[Tuple[str, ...]] = None, after: Optional[CursorPosition] = None, include_total: bool = True) -> ReviewListResponse:
+        """
+        Get reviews, optionally filtering by visibility, restricting the returned fields and starting after a cursor position.
+        The total is fetched in the same query as the page, or skipped when `include_total` is False.
+        """
+        logger.info(f"Retrieving reviews (skip={skip}, limit={limit}, only_visible={only_visible}, fields={fields}, after={after}, include_total={include_total})")
         
         if only_visible:
-            reviews = self.repository.get_visible(skip, limit)
-            total = self.repository.count_visible()
+            page = self.repository.get_visible(skip, limit, fields, after, with_total=include_total)
         else:
-            reviews = self.repository.get_all(skip, limit)
-            total = self.repository.count()
-            
-        return ReviewListResponse(
-            reviews=[ReviewResponse.model_validate(r) for r in reviews],
-            total=total
+            page = self.repository.get_all(skip, limit, fields, after, with_total=include_total)
+        
+        item_model = partial_model(ReviewResponse, fields) if fields else ReviewResponse
+        list_model = partial_list_model(ReviewListResponse, "reviews", item_model) if fields else ReviewListResponse
+        return list_model(
+            reviews=[item_model.model_validate(r) for r in page.items],
+            total=page.total,
+            next_cursor=page.next_cursor
         )
         
     def get_review_by_id(self, review_id: uuid.UUID) -> Optional[ReviewResponse]:
@@ -68,6 +83,8 @@ class ReviewService:
         updated_review = self.repository.update(review_id, update_data)
         
         if updated_review:
+            public_data_cache.invalidate()
+            vector_indexer.schedule("review", review_id)
             logger.info(f"Updated visibility for review ID {review_id} to {visibility_data.is_visible}")
             return ReviewResponse.model_validate(updated_review)
         
@@ -76,4 +93,8 @@ class ReviewService:
     def delete_review(self, review_id: uuid.UUID) -> bool:
         """Delete a review"""
         logger.info(f"Deleting review with ID: {review_id}")
-        return self.repository.delete(review_id)
+        deleted = self.repository.delete(review_id)
+        if deleted:
+            public_data_cache.invalidate()
+            vector_indexer.schedule("review", review_id)
+        return deleted
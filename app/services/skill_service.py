@@ -4,9 +4,13 @@ from app.schemas.skill_schema import (
     SkillGroupListResponse, SkillGroupVisibilityUpdate
 )
 from app.repositories.skill_repository import SkillGroupRepository
+from app.utils.public_data_cache import public_data_cache
+from app.jobs.vector_indexer import vector_indexer
+from app.utils.pagination import CursorPosition
 from app.models.skill_model import Skill
 from sqlalchemy.orm import Session
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime
 import logging
 import uuid
 
@@ -73,23 +77,31 @@ class SkillGroupService:
         
         # Refresh to get the updated skill group with skills
         self.repository.db.refresh(skill_group)
+        public_data_cache.invalidate()
+        vector_indexer.schedule("skill")
         
         return self._convert_to_response_model(skill_group)
 
-    def get_skill_groups(self, skip: int = 0, limit: int = 100, only_visible: bool = False) -> SkillGroupListResponse:
-        """Get all skill groups, optionally filtering by visibility"""
-        logger.info(f"Retrieving skill groups (skip={skip}, limit={limit}, only_visible={only_visible})")
+    def get_version(self, only_visible: bool = False) -> Tuple[Optional[datetime], int]:
+        """Get the skill group list version (latest updated_at, row count) used for HTTP cache validators"""
+        return self.repository.get_version(only_visible)
+
+    def get_skill_groups(self, skip: int = 0, limit: int = 100, only_visible: bool = False, after: Optional[CursorPosition] = None, include_total: bool = True) -> SkillGroupListResponse:
+        """
+        Get all skill groups, optionally filtering by visibility and starting after a cursor position.
+        The total is fetched in the same query as the page, or skipped when `include_total` is False.
+        """
+        logger.info(f"Retrieving skill groups (skip={skip}, limit={limit}, only_visible={only_visible}, after={after}, include_total={include_total})")
         
         if only_visible:
-            skill_groups = self.repository.get_visible(skip, limit)
-            total = self.repository.count_visible()
+            page = self.repository.get_visible(skip, limit, after, with_total=include_total)
         else:
-            skill_groups = self.repository.get_all(skip, limit)
-            total = self.repository.count()
+            page = self.repository.get_all(skip, limit, after, with_total=include_total)
             
         return SkillGroupListResponse(
-            skill_groups=[self._convert_to_response_model(sg) for sg in skill_groups],
-            total=total
+            skill_groups=[self._convert_to_response_model(sg) for sg in page.items],
+            total=page.total,
+            next_cursor=page.next_cursor
         )
         
     def get_skill_group_by_id(self, skill_group_id: uuid.UUID, only_visible: bool = False) -> Optional[SkillGroupResponse]:
@@ -149,6 +161,8 @@ class SkillGroupService:
         # Commit changes
         self.repository.db.commit()
         self.repository.db.refresh(skill_group)
+        public_data_cache.invalidate()
+        vector_indexer.schedule("skill")
         
         return self._convert_to_response_model(skill_group)
 
@@ -167,6 +181,8 @@ class SkillGroupService:
         updated_skill_group = self.repository.update(skill_group_id, update_data)
         
         if updated_skill_group:
+            public_data_cache.invalidate()
+            vector_indexer.schedule("skill")
             logger.info(f"Updated visibility for skill group ID {skill_group_id} to {visibility_data.is_visible}")
             return self._convert_to_response_model(updated_skill_group)
         
@@ -175,4 +191,8 @@ class SkillGroupService:
     def delete_skill_group(self, skill_group_id: uuid.UUID) -> bool:
         """Delete a skill group"""
         logger.info(f"Deleting skill group with ID: {skill_group_id}")
-        return self.repository.delete(skill_group_id)
+        deleted = self.repository.delete(skill_group_id)
+        if deleted:
+            public_data_cache.invalidate()
+            vector_indexer.schedule("skill")
+        return deleted
@@ -2,6 +2,9 @@ from sqlalchemy.orm import Session
 from app.models.user_model import User
 from app.models.skill_model import Skill
 from app.schemas.user_schema import UserUpdate
+from app.services.asset_service import AssetService
+from app.utils.public_data_cache import public_data_cache
+from app.jobs.vector_indexer import vector_indexer
 from typing import List, Optional
 import logging
 import uuid
@@ -66,6 +69,13 @@ class UserService:
             # Update with only valid IDs
             update_data["featured_skill_ids"] = valid_skill_ids
         
+        # Store uploaded images and documents in the asset store and keep only their URLs
+        update_data = AssetService(self.db).externalize_user_data(update_data)
+        
+        # Drop stale avatar variants when the avatar is replaced by a plain URL or removed
+        if "avatar" in update_data and "avatar_variants" not in update_data and update_data["avatar"] != user.avatar:
+            update_data["avatar_variants"] = None
+        
         # Update user fields
         for key, value in update_data.items():
             setattr(user, key, value)
@@ -73,5 +83,7 @@ class UserService:
         # Save changes
         self.db.commit()
         self.db.refresh(user)
+        public_data_cache.invalidate()
+        vector_indexer.schedule("user", user.id)
         
         return user
@@ -1,27 +1,65 @@
-from typing import List, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import text
+from typing import List, Dict, Any, NamedTuple, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from sqlalchemy.orm import Session, undefer
+from sqlalchemy import text, insert, update, func
 
-from app.models.vector_store import VectorEmbedding
+from app.models.vector_store import VectorEmbedding, VECTOR_OPERATOR_CLASSES
 from app.models.project_model import Project
 from app.models.skill_model import Skill
 from app.models.experience_model import Experience
 from app.models.review_model import Review
 from app.models.user_model import User
-from app.utils.llm_factory import LLMFactory
+from app.utils.llm_factory import llm_clients
+from app.utils.embedding_cache import query_embedding_cache
+from app.utils.metrics import observe_outbound
+from app.utils.answer_cache import answer_cache
+from app.config.settings import settings
+import hashlib
+import logging
+import time
+import uuid
 import os
 
+logger = logging.getLogger(__name__)
+
+# Dimensions of the stored embeddings, must match VectorEmbedding.embedding
+EMBEDDING_DIMENSIONS = 768
+
+class VectorDocument(NamedTuple):
+    """A text chunk to embed, with the record it was built from"""
+    content: str
+    source_type: str
+    source_id: Optional[Any]
+
 class VectorService:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, read_db: Optional[Session] = None):
         self.db = db
-        # Initialize Embeddings Model via Factory
-        self.embeddings_model = LLMFactory.create_embeddings_model("gemini")
+        # Searches may run on a read replica session, writes always go through `db`
+        self.read_db = read_db or db
+        # Shared Embeddings Model, built once per process
+        self.embeddings_model = llm_clients.get_embeddings_model("gemini")
 
     def generate_embedding(self, text_content: str) -> List[float]:
         """Generate embedding vector for a given text."""
-        return self.embeddings_model.embed_query(text_content, output_dimensionality=768)
+        with observe_outbound("gemini", "embed_query"):
+            return self.embeddings_model.embed_query(text_content, output_dimensionality=EMBEDDING_DIMENSIONS)
 
-    def search(self, query_text: str, limit: int = 5, filters: List[str] = None) -> List[VectorEmbedding]:
+    def get_query_embedding(self, query_text: str) -> List[float]:
+        """Embedding of a search query, served from the shared query embedding cache when possible."""
+        return query_embedding_cache.get_or_compute(
+            self.db, settings.GEMINI_EMBEDDING_MODEL, EMBEDDING_DIMENSIONS, query_text, self.generate_embedding
+        )
+
+    def search(
+        self,
+        query_text: str,
+        limit: int = 5,
+        filters: List[str] = None,
+        metric: Optional[str] = None,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None
+    ) -> List[VectorEmbedding]:
         """
         Search for relevant documents using vector similarity.
         
@@ -29,41 +67,62 @@ class VectorService:
             query_text: The search query.
             limit: Maximum number of results.
             filters: Optional list of source_types to include (e.g. ['project', 'skill']).
+            metric: Distance metric ("l2", "cosine" or "inner_product"), defaults to VECTOR_DISTANCE_METRIC.
+                Only the metric the ANN index was built for is served by the index.
+            ef_search: HNSW candidate list size for this query, raised to at least `limit`.
+            probes: Number of IVFFlat lists scanned for this query.
         """
-        query_vector = self.generate_embedding(query_text)
+        metric = metric or settings.VECTOR_DISTANCE_METRIC
+        if metric not in VECTOR_OPERATOR_CLASSES:
+            raise ValueError(f"Unknown distance metric: {metric}")
+        
+        query_vector = self.get_query_embedding(query_text)
+        
+        # Per-query ANN tuning, scoped to the current transaction. HNSW never returns
+        # more than ef_search rows, so it has to be at least the requested limit.
+        self.read_db.execute(
+            text("SELECT set_config('hnsw.ef_search', :ef_search, true), set_config('ivfflat.probes', :probes, true)"),
+            {
+                "ef_search": str(max(ef_search or settings.VECTOR_HNSW_EF_SEARCH, limit)),
+                "probes": str(probes or settings.VECTOR_IVFFLAT_PROBES)
+            }
+        )
         
         # Start building the query
-        query = self.db.query(VectorEmbedding)
+        query = self.read_db.query(VectorEmbedding)
         
         # Apply filters if provided
         if filters:
             query = query.filter(VectorEmbedding.source_type.in_(filters))
         
-        # pgvector L2 distance operator is <->
-        results = query.order_by(
-            VectorEmbedding.embedding.l2_distance(query_vector)
-        ).limit(limit).all()
+        # pgvector distance operators: <-> (L2), <=> (cosine) and <#> (negative inner product)
+        if metric == "cosine":
+            distance = VectorEmbedding.embedding.cosine_distance(query_vector)
+        elif metric == "inner_product":
+            distance = VectorEmbedding.embedding.max_inner_product(query_vector)
+        else:
+            distance = VectorEmbedding.embedding.l2_distance(query_vector)
+        
+        results = query.order_by(distance).limit(limit).all()
         
         return results
 
+    def get_index_version(self) -> Tuple[Optional[datetime], int]:
+        """Version of the vector store (latest updated_at, row count), changes whenever a vector is added, updated or deleted"""
+        return self.read_db.query(func.max(VectorEmbedding.updated_at), func.count(VectorEmbedding.id)).one()
+
     def clear_all_vectors(self):
         """Delete all existing vectors to ensure a clean sync."""
         self.db.query(VectorEmbedding).delete()
         self.db.commit()
+        answer_cache.invalidate()
 
-    def sync_all_data(self):
-        """
-        Universal Context Sync:
-        Fetches all data from Projects, Skills, Experience, Reviews, and Users.
-        Serializes them into text.
-        Generates embeddings and stores them.
-        """
-        self.clear_all_vectors()
-        total_count = 0
-
-        # 1. Projects
-        projects = self.db.query(Project).filter(Project.is_visible == True).all()
-        for p in projects:
+    def _collect_projects(self, ids: Optional[Set[uuid.UUID]] = None) -> List[VectorDocument]:
+        query = self.db.query(Project).options(undefer(Project.additional_data)).filter(Project.is_visible == True)
+        if ids:
+            query = query.filter(Project.id.in_(ids))
+        documents = []
+        for p in query.all():
             # Create a rich text representation
             content = f"Project: {p.title}. Type: {p.type}. Description: {p.description or ''}. Tags: {', '.join(p.tags or [])}."
             if p.additional_data:
@@ -71,51 +130,183 @@ class VectorService:
                  readme_summary = str(p.additional_data)[:500] 
                  content += f" Details: {readme_summary}"
             
-            self._save_vector(content, "project", p.id)
-            total_count += 1
-
-        # 2. Skills
-        skills = self.db.query(Skill).join(Skill.skill_group).filter(Skill.is_visible == True).all()
-        for s in skills:
-            content = f"Skill: {s.name}. Proficiency: {s.proficiency}/5. Group: {s.skill_group.name}."
-            self._save_vector(content, "skill", s.id)
-            total_count += 1
-            
-        # 3. Experience & Education
-        experiences = self.db.query(Experience).filter(Experience.is_visible == True).all()
-        for e in experiences:
+            documents.append(VectorDocument(content, "project", p.id))
+        return documents
+
+    def _collect_skills(self, ids: Optional[Set[uuid.UUID]] = None) -> List[VectorDocument]:
+        query = self.db.query(Skill).join(Skill.skill_group).filter(Skill.is_visible == True)
+        if ids:
+            query = query.filter(Skill.id.in_(ids))
+        return [
+            VectorDocument(f"Skill: {s.name}. Proficiency: {s.proficiency}/5. Group: {s.skill_group.name}.", "skill", s.id)
+            for s in query.all()
+        ]
+
+    def _collect_experiences(self, ids: Optional[Set[uuid.UUID]] = None) -> List[VectorDocument]:
+        query = self.db.query(Experience).filter(Experience.is_visible == True)
+        if ids:
+            query = query.filter(Experience.id.in_(ids))
+        documents = []
+        for e in query.all():
             type_str = "Education" if e.type == "education" else "Work Experience"
             content = f"{type_str}: {e.title} at {e.organization}. {e.start_date} to {e.end_date or 'Present'}. {e.description or ''}"
-            self._save_vector(content, "experience", e.id)
-            total_count += 1
-
-        # 4. Reviews
-        reviews = self.db.query(Review).filter(Review.is_visible == True).all()
-        for r in reviews:
-            content = f"Review from {r.name} ({r.where_known_from or 'Client'}): '{r.content}'. Rating: {r.rating}/5."
-            self._save_vector(content, "review", r.id)
-            total_count += 1
-
-        # 5. User Profile (Basic Info)
-        users = self.db.query(User).all() # Assuming usually just one user
-        for u in users:
+            documents.append(VectorDocument(content, "experience", e.id))
+        return documents
+
+    def _collect_reviews(self, ids: Optional[Set[uuid.UUID]] = None) -> List[VectorDocument]:
+        query = self.db.query(Review).filter(Review.is_visible == True)
+        if ids:
+            query = query.filter(Review.id.in_(ids))
+        return [
+            VectorDocument(f"Review from {r.name} ({r.where_known_from or 'Client'}): '{r.content}'. Rating: {r.rating}/5.", "review", r.id)
+            for r in query.all()
+        ]
+
+    def _collect_users(self, ids: Optional[Set[uuid.UUID]] = None) -> List[VectorDocument]:
+        query = self.db.query(User) # Assuming usually just one user
+        if ids:
+            query = query.filter(User.id.in_(ids))
+        documents = []
+        for u in query.all():
             content = f"About Me (Daryl Fernandes): {u.title or 'Developer'}. Location: {u.location}. Bio: {u.about or ''}. Contact: {u.email}."
             if u.social_links:
                 content += f" Socials: {u.social_links}."
-            self._save_vector(content, "user", u.id)
-            total_count += 1
-            
-        return {"status": "success", "vectors_synced": total_count}
-
-    def _save_vector(self, content: str, source_type: str, source_id: Any):
-        """Helper to compute embedding and save record."""
-        vector = self.generate_embedding(content)
-        embedding_record = VectorEmbedding(
-            content=content,
-            embedding=vector,
-            source_type=source_type,
-            source_id=source_id,
-            metadata_json={"source": source_type}
-        )
-        self.db.add(embedding_record)
-        self.db.commit()
+            documents.append(VectorDocument(content, "user", u.id))
+        return documents
+
+    def collect_documents(self, source_type: Optional[str] = None, ids: Optional[Set[uuid.UUID]] = None) -> List[VectorDocument]:
+        """
+        Universal Context:
+        Fetches the visible Projects, Skills, Experience, Reviews, and Users
+        and serializes each record into a text document.
+        Optionally limited to one source type, and to some records of that type.
+        """
+        collectors = {
+            "project": self._collect_projects,
+            "skill": self._collect_skills,
+            "experience": self._collect_experiences,
+            "review": self._collect_reviews,
+            "user": self._collect_users,
+        }
+        if source_type:
+            return collectors[source_type](ids)
+        return [document for collect in collectors.values() for document in collect()]
+
+    def embed_documents(self, contents: List[str]) -> List[List[float]]:
+        """
+        Embed many texts with batched `embed_documents` calls, running at most
+        VECTOR_EMBED_CONCURRENCY batches at a time. Vectors are returned in input order.
+        """
+        batch_size = max(1, settings.VECTOR_EMBED_BATCH_SIZE)
+        batches = [contents[i:i + batch_size] for i in range(0, len(contents), batch_size)]
+        if not batches:
+            return []
+
+        def embed_batch(batch: List[str]) -> List[List[float]]:
+            with observe_outbound("gemini", "embed_documents"):
+                return self.embeddings_model.embed_documents(batch, batch_size=len(batch), output_dimensionality=EMBEDDING_DIMENSIONS)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(settings.VECTOR_EMBED_CONCURRENCY, len(batches)))) as executor:
+            results = list(executor.map(embed_batch, batches))
+        return [vector for batch_vectors in results for vector in batch_vectors]
+
+    @staticmethod
+    def content_hash(content: str) -> str:
+        """Hash of a document, covering the embedding model so a model change re-embeds everything"""
+        key = f"{settings.GEMINI_EMBEDDING_MODEL}:{EMBEDDING_DIMENSIONS}\n{content}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _stored_vectors(self):
+        """Query the stored vectors' sources and hashes, without the embeddings themselves"""
+        return self.db.query(VectorEmbedding.id, VectorEmbedding.source_type, VectorEmbedding.source_id, VectorEmbedding.content_hash)
+
+    def sync_all_data(self):
+        """
+        Incrementally sync the whole vector store with the portfolio data.
+        This is the repair path, day to day the write-through hooks keep it in sync.
+        """
+        started = time.monotonic()
+        result = self._sync(self.collect_documents(), self._stored_vectors())
+        logger.info(f"Synced {result['vectors_synced']} vectors in {time.monotonic() - started:.2f}s: {result}")
+        return result
+
+    def sync_sources(self, source_type: str, ids: Optional[Set[uuid.UUID]] = None) -> Dict[str, Any]:
+        """
+        Incrementally sync the vectors of one source type, or only of some records of that type.
+        Records that were deleted or hidden have their vectors dropped.
+        """
+        existing = self._stored_vectors().filter(VectorEmbedding.source_type == source_type)
+        if ids:
+            existing = existing.filter(VectorEmbedding.source_id.in_(ids))
+        result = self._sync(self.collect_documents(source_type, ids), existing)
+        logger.info(f"Synced {source_type} vectors{f' of {len(ids)} records' if ids else ''}: {result}")
+        return result
+
+    def _sync(self, documents: List[VectorDocument], existing_query) -> Dict[str, Any]:
+        """
+        Bring the vectors selected by `existing_query` in line with `documents`.
+
+        Every document is hashed and compared with the hash stored for its
+        (source_type, source_id). Only new or changed documents are embedded
+        (in concurrent batches), vectors without a document are deleted, and
+        all inserts, updates and deletes are applied in a single transaction,
+        so the chatbot never searches a partially synced index.
+        """
+        existing = {}
+        duplicate_ids = []
+        for row in existing_query:
+            key = (row.source_type, row.source_id)
+            if key in existing:
+                duplicate_ids.append(row.id)
+            else:
+                existing[key] = row
+
+        changed = []
+        for document in documents:
+            document_hash = self.content_hash(document.content)
+            stored = existing.pop((document.source_type, document.source_id), None)
+            if stored is None or stored.content_hash != document_hash:
+                changed.append((document, document_hash, stored.id if stored else None))
+
+        # Whatever is left in `existing` belongs to records that no longer exist or are hidden
+        stale_ids = [row.id for row in existing.values()] + duplicate_ids
+
+        vectors = self.embed_documents([document.content for document, _, _ in changed])
+
+        inserts, updates = [], []
+        for (document, document_hash, vector_id), vector in zip(changed, vectors):
+            values = {
+                "content": document.content,
+                "embedding": vector,
+                "content_hash": document_hash,
+                "metadata_json": {"source": document.source_type}
+            }
+            if vector_id:
+                updates.append({"id": vector_id, **values})
+            else:
+                inserts.append({"source_type": document.source_type, "source_id": document.source_id, **values})
+
+        try:
+            if stale_ids:
+                self.db.query(VectorEmbedding).filter(VectorEmbedding.id.in_(stale_ids)).delete(synchronize_session=False)
+            if updates:
+                self.db.execute(update(VectorEmbedding), updates)
+            if inserts:
+                self.db.execute(insert(VectorEmbedding), inserts)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        # Answers generated from the previous vectors may be outdated
+        if stale_ids or updates or inserts:
+            answer_cache.invalidate()
+
+        return {
+            "status": "success",
+            "vectors_synced": len(documents),
+            "added": len(inserts),
+            "updated": len(updates),
+            "deleted": len(stale_ids),
+            "unchanged": len(documents) - len(changed)
+        }
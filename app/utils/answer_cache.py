@@ -0,0 +1,92 @@
+import threading
+import time
+import logging
+import numpy as np
+from typing import Any, List, Optional
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+class CachedAnswer:
+    """A chatbot answer with the unit-length embedding of the question it answered."""
+
+    def __init__(self, question_vector: np.ndarray, answer: str, index_version: Any):
+        self.question_vector = question_vector
+        self.answer = answer
+        self.index_version = index_version
+        self.stored_at = time.time()
+
+class SemanticAnswerCache:
+    """
+    In-memory cache of chatbot answers looked up by question similarity.
+
+    A new question reuses a cached answer when the cosine similarity of the
+    question embeddings reaches `threshold` and the vector index version is
+    still the one the answer was generated from. `invalidate()` drops every
+    answer, it is called whenever the vector store changes.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int, threshold: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.threshold = threshold
+        self._entries: List[CachedAnswer] = []
+        self._matrix: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl_seconds > 0
+
+    @staticmethod
+    def _unit(vector: List[float]) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
+
+    def _rebuild_matrix(self) -> None:
+        self._matrix = np.vstack([entry.question_vector for entry in self._entries]) if self._entries else None
+
+    def lookup(self, question_vector: List[float], index_version: Any) -> Optional[str]:
+        """Return the answer of the most similar cached question, or None if none is similar enough"""
+        if not self.enabled:
+            return None
+        query = self._unit(question_vector)
+        with self._lock:
+            if self._matrix is None:
+                return None
+            similarities = self._matrix @ query
+            best = int(np.argmax(similarities))
+            entry = self._entries[best]
+            if similarities[best] < self.threshold:
+                return None
+            if entry.index_version != index_version or time.time() - entry.stored_at >= self.ttl_seconds:
+                # Answered from an older index, or too old: drop it so a fresh answer replaces it
+                del self._entries[best]
+                self._rebuild_matrix()
+                return None
+            logger.info(f"Semantic answer cache hit (similarity {similarities[best]:.3f})")
+            return entry.answer
+
+    def store(self, question_vector: List[float], answer: str, index_version: Any) -> None:
+        """Cache an answer, evicting the oldest one when full"""
+        if not self.enabled or not answer:
+            return
+        with self._lock:
+            self._entries.append(CachedAnswer(self._unit(question_vector), answer, index_version))
+            if len(self._entries) > self.max_size:
+                self._entries = self._entries[-self.max_size:]
+            self._rebuild_matrix()
+
+    def invalidate(self) -> None:
+        """Drop every cached answer after the vector store changed"""
+        with self._lock:
+            self._entries.clear()
+            self._matrix = None
+
+# Global cache instance shared by all chat connections
+answer_cache = SemanticAnswerCache(
+    max_size=settings.CHAT_ANSWER_CACHE_SIZE,
+    ttl_seconds=settings.CHAT_ANSWER_CACHE_TTL,
+    threshold=settings.CHAT_ANSWER_CACHE_THRESHOLD
+)
@@ -0,0 +1,181 @@
+import threading
+import time
+import logging
+from typing import Any, Dict, Optional
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import NullPool, QueuePool
+
+logger = logging.getLogger(__name__)
+
+# Engine pool options of each DB_POOL_PRESET, individual DB_POOL_* settings override them
+POOL_PRESETS: Dict[str, Dict[str, Any]] = {
+    # Long-running server (uvicorn/gunicorn): a bounded pool per process. Connections are
+    # recycled before typical idle timeouts instead of being pinged on every checkout.
+    "default": {"pooled": True, "pool_size": 10, "max_overflow": 20, "pool_timeout": 10, "pool_recycle": 300, "pool_pre_ping": False},
+    # Serverless (Vercel): a function instance may be frozen at any time, so no connection is kept open
+    "serverless": {"pooled": False, "pool_pre_ping": False},
+    # External transaction pooler (PgBouncer, Supabase/Neon pooled endpoints): it does the pooling,
+    # and it rejects the `options` startup parameter used to set the statement timeout
+    "pgbouncer": {"pooled": False, "pool_pre_ping": False, "statement_timeout": False},
+}
+
+class PoolMetrics:
+    """
+    Thread-safe counters and gauges of one engine's connection pool.
+
+    `in_use` is the number of connections currently checked out, the checkout
+    wait is the time a session waited for a connection (including opening a new
+    one), and `timeouts` counts checkouts that gave up after `pool_timeout`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.in_use = 0
+        self.max_in_use = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connections_opened = 0
+        self.invalidations = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.wait_seconds_last = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            self.wait_seconds_last = seconds
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def on_checkout(self, *args) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.max_in_use = max(self.max_in_use, self.in_use)
+
+    def on_checkin(self, *args) -> None:
+        with self._lock:
+            self.in_use = max(self.in_use - 1, 0)
+
+    def on_connect(self, *args) -> None:
+        with self._lock:
+            self.connections_opened += 1
+
+    def on_invalidate(self, *args) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "in_use": self.in_use,
+                "max_in_use": self.max_in_use,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "connections_opened": self.connections_opened,
+                "invalidations": self.invalidations,
+                "checkout_wait_seconds": {
+                    "last": round(self.wait_seconds_last, 6),
+                    "max": round(self.wait_seconds_max, 6),
+                    "avg": round(self.wait_seconds_total / self.checkouts, 6) if self.checkouts else 0.0,
+                    "total": round(self.wait_seconds_total, 6),
+                },
+            }
+
+class _TimedCheckoutMixin:
+    """Times every connection checkout and logs the pool state when one times out"""
+
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            logger.warning(f"Database pool checkout timed out after {time.perf_counter() - started:.2f}s ({self.status()}, in use: {self.metrics.in_use})")
+            raise
+        self.metrics.record_wait(time.perf_counter() - started)
+        return connection
+
+class InstrumentedQueuePool(_TimedCheckoutMixin, QueuePool):
+    pass
+
+class InstrumentedNullPool(_TimedCheckoutMixin, NullPool):
+    pass
+
+def _instrumented_pool_class(base, metrics: PoolMetrics):
+    """Subclass an instrumented pool bound to one engine's metrics, so they survive pool recreation"""
+    return type(base.__name__, (base,), {"metrics": metrics})
+
+def _override(value: Optional[str], cast):
+    return cast(value) if value not in (None, "") else None
+
+def build_engine_options(settings, metrics: PoolMetrics) -> Dict[str, Any]:
+    """Build the `create_engine` keyword arguments of the configured pool preset and overrides"""
+    preset_name = settings.DB_POOL_PRESET
+    if preset_name not in POOL_PRESETS:
+        logger.warning(f"Unknown DB_POOL_PRESET '{preset_name}', using 'default'")
+        preset_name = "default"
+    preset = dict(POOL_PRESETS[preset_name])
+
+    overrides = {
+        "pool_size": _override(settings.DB_POOL_SIZE, int),
+        "max_overflow": _override(settings.DB_MAX_OVERFLOW, int),
+        "pool_timeout": _override(settings.DB_POOL_TIMEOUT, float),
+        "pool_recycle": _override(settings.DB_POOL_RECYCLE, int),
+        "pool_pre_ping": _override(settings.DB_POOL_PRE_PING, lambda value: value.lower() == "true"),
+    }
+    preset.update({key: value for key, value in overrides.items() if value is not None})
+
+    connect_args: Dict[str, Any] = {"connect_timeout": settings.DB_CONNECT_TIMEOUT}
+    if settings.DB_STATEMENT_TIMEOUT_MS > 0 and preset.pop("statement_timeout", True):
+        connect_args["options"] = f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+
+    options: Dict[str, Any] = {
+        "pool_pre_ping": preset["pool_pre_ping"],
+        "connect_args": connect_args,
+    }
+    if preset["pooled"]:
+        options.update(
+            poolclass=_instrumented_pool_class(InstrumentedQueuePool, metrics),
+            pool_size=preset["pool_size"],
+            max_overflow=preset["max_overflow"],
+            pool_timeout=preset["pool_timeout"],
+            pool_recycle=preset["pool_recycle"],
+            pool_use_lifo=True,
+        )
+    else:
+        options["poolclass"] = _instrumented_pool_class(InstrumentedNullPool, metrics)
+    return options
+
+def create_pooled_engine(url: str, settings) -> Engine:
+    """Create an engine with the configured pool, feeding its own `PoolMetrics`"""
+    metrics = PoolMetrics()
+    engine = create_engine(url, **build_engine_options(settings, metrics))
+    event.listen(engine, "checkout", metrics.on_checkout)
+    event.listen(engine, "checkin", metrics.on_checkin)
+    event.listen(engine, "connect", metrics.on_connect)
+    event.listen(engine, "invalidate", metrics.on_invalidate)
+    return engine
+
+def get_pool_status(engine: Engine, preset: str) -> Dict[str, Any]:
+    """Report the pool configuration, its current size and the collected metrics"""
+    pool = engine.pool
+    status: Dict[str, Any] = {"preset": preset, "pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            max_overflow=pool._max_overflow,
+            idle=pool.checkedin(),
+            overflow=pool.overflow(),
+            timeout_seconds=pool.timeout(),
+        )
+    metrics = getattr(pool, "metrics", None)
+    if metrics:
+        status.update(metrics.snapshot())
+    return status
@@ -1,10 +1,23 @@
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from starlette.concurrency import run_in_threadpool
+from typing import Any, Callable, TypeVar
 from sqlalchemy.exc import SQLAlchemyError, OperationalError, IntegrityError
 from app.config.settings import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+async def run_db(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run blocking database work from an async route handler or service in the
+    threadpool, the same way FastAPI runs sync route handlers, so the event
+    loop keeps serving other requests and chat streams meanwhile.
+    Calls sharing a Session must be awaited one after the other.
+    """
+    return await run_in_threadpool(func, *args, **kwargs)
+
 def get_retry_decorator():
     """
     Creates a retry decorator with the configured settings.
@@ -0,0 +1,108 @@
+import hashlib
+import threading
+import time
+import logging
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Callable, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from app.config.settings import settings
+from app.repositories.query_embedding_repository import QueryEmbeddingRepository
+
+logger = logging.getLogger(__name__)
+
+def normalize_query(text: str) -> str:
+    """Normalize a query so trivially different phrasings share a cache entry"""
+    return " ".join(text.lower().split())
+
+class QueryEmbeddingCache:
+    """
+    Bounded LRU cache of chatbot query embeddings with a TTL.
+
+    Entries are keyed by the embedding model and the normalized query text and
+    shared by every WebSocket connection in the process. With `persist` enabled
+    misses fall back to the `query_embedding_cache` table before calling the
+    embedding API, so popular questions stay cached across restarts and workers.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int, persist: bool = False):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.persist = persist
+        self._entries: "OrderedDict[str, Tuple[List[float], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model: str, dimensions: int, text: str) -> Tuple[str, str]:
+        """Return the normalized text and the cache key of a query"""
+        normalized = normalize_query(text)
+        key = hashlib.sha256(f"{model}:{dimensions}\n{normalized}".encode("utf-8")).hexdigest()
+        return normalized, key
+
+    def _get_memory(self, key: str) -> Optional[List[float]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            embedding, stored_at = entry
+            if time.time() - stored_at >= self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return embedding
+
+    def _put_memory(self, key: str, embedding: List[float], stored_at: Optional[float] = None) -> None:
+        with self._lock:
+            self._entries[key] = (embedding, stored_at or time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(self, db: Optional[Session], model: str, dimensions: int, text: str, compute: Callable[[str], List[float]]) -> List[float]:
+        """
+        Return the embedding of a query, calling `compute` only on a cache miss.
+        Failures of the persistent cache are logged and never fail the query.
+        """
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return compute(text)
+
+        normalized, key = self.make_key(model, dimensions, text)
+        embedding = self._get_memory(key)
+        if embedding is not None:
+            return embedding
+
+        repository = QueryEmbeddingRepository(db) if self.persist and db is not None else None
+        if repository:
+            try:
+                stored = repository.get(key)
+                if stored:
+                    embedding, computed_at = stored
+                    age = (datetime.now(timezone.utc) - computed_at).total_seconds()
+                    if age < self.ttl_seconds:
+                        self._put_memory(key, embedding, time.time() - age)
+                        return embedding
+            except Exception as e:
+                logger.warning(f"Query embedding cache lookup failed: {str(e)}")
+                db.rollback()
+
+        embedding = compute(normalized)
+        self._put_memory(key, embedding)
+
+        if repository:
+            try:
+                repository.upsert(key, normalized, embedding)
+            except Exception as e:
+                logger.warning(f"Storing query embedding failed: {str(e)}")
+        return embedding
+
+    def clear(self) -> None:
+        """Drop the in-memory entries"""
+        with self._lock:
+            self._entries.clear()
+
+# Global cache instance shared by all chat connections
+query_embedding_cache = QueryEmbeddingCache(
+    max_size=settings.QUERY_EMBEDDING_CACHE_SIZE,
+    ttl_seconds=settings.QUERY_EMBEDDING_CACHE_TTL,
+    persist=settings.QUERY_EMBEDDING_CACHE_PERSIST
+)
@@ -0,0 +1,74 @@
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type
+from fastapi import HTTPException, Response, status
+from pydantic import BaseModel, ConfigDict, create_model
+import orjson
+
+# Fields that are always returned so clients can address the items they list
+ALWAYS_INCLUDED_FIELDS = ("id",)
+
+def parse_fields(fields: Optional[str], model: Type[BaseModel]) -> Optional[Tuple[str, ...]]:
+    """
+    Parse a comma separated `fields` query parameter against a response model.
+
+    Returns:
+        Optional[Tuple[str, ...]]: The selected field names in response model order,
+        or None when no selection was requested
+    Raises:
+        HTTPException: 400 if a field does not exist on the response model
+    """
+    if not fields:
+        return None
+
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = sorted(requested - set(model.model_fields))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}. Allowed fields: {', '.join(model.model_fields)}"
+        )
+
+    requested.update(ALWAYS_INCLUDED_FIELDS)
+    return tuple(name for name in model.model_fields if name in requested)
+
+@lru_cache(maxsize=256)
+def partial_model(model: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """Build (and cache) a response model that only contains the selected fields of `model`"""
+    field_definitions: Dict[str, Any] = {
+        name: (model.model_fields[name].annotation, model.model_fields[name])
+        for name in fields
+    }
+    return create_model(
+        f"{model.__name__}Partial",
+        __config__=ConfigDict(from_attributes=True),
+        **field_definitions
+    )
+
+@lru_cache(maxsize=256)
+def partial_list_model(list_model: Type[BaseModel], items_field: str, item_model: Type[BaseModel]) -> Type[BaseModel]:
+    """Build (and cache) a list response model whose `items_field` holds `item_model` items"""
+    field_definitions: Dict[str, Any] = {
+        name: ((List[item_model], ...) if name == items_field else (field.annotation, field))
+        for name, field in list_model.model_fields.items()
+    }
+    return create_model(f"{list_model.__name__}Partial", **field_definitions)
+
+def load_only_columns(orm_model: Any, fields: Optional[Tuple[str, ...]]) -> List[Any]:
+    """Map selected response fields to the ORM column attributes that back them"""
+    if not fields:
+        return []
+    column_names = orm_model.__table__.columns.keys()
+    return [getattr(orm_model, name) for name in fields if name in column_names]
+
+def sparse_response(content: BaseModel, response: Response) -> Response:
+    """
+    Serialize a sparse fieldset result. The dynamic model can't be declared as the
+    route's response_model, so the body is encoded here and the headers already set
+    on the injected response (e.g. ETag) are carried over.
+    """
+    headers = {key: value for key, value in response.headers.items() if key != "content-length"}
+    return Response(
+        content=orjson.dumps(content.model_dump(mode="json")),
+        media_type="application/json",
+        headers=headers
+    )
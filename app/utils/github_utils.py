@@ -1,12 +1,144 @@
 import re
+import time
+import base64
+import asyncio
 import httpx
 from fastapi import HTTPException
+from app.config.settings import settings
+from app.utils.http_client import http_clients
 import os
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Tuple, Optional, NamedTuple, FrozenSet
 import logging
 
 logger = logging.getLogger(__name__)
 
+class GitHubRateLimitError(Exception):
+    """Raised when the GitHub rate limit is exhausted for longer than we are willing to wait"""
+
+    def __init__(self, reset_at: float):
+        self.reset_at = reset_at
+        super().__init__(f"GitHub rate limit exhausted until {time.strftime('%H:%M:%S', time.gmtime(reset_at))} UTC")
+
+# Resources fetched per repository, each with its own ETag/Last-Modified validators
+GITHUB_RESOURCES = ("repo", "readme", "languages")
+
+class GitHubFetchResult(NamedTuple):
+    """
+    Outcome of a (conditional) GitHub fetch.
+
+    `github_data` only holds the resources that changed, `not_modified` names
+    the ones GitHub answered with 304 and `validators` holds the ETag and
+    Last-Modified values to send on the next refresh.
+    """
+    basic_data: Dict[str, Any]
+    github_data: Dict[str, Any]
+    validators: Dict[str, Dict[str, str]]
+    not_modified: FrozenSet[str]
+
+    @property
+    def unchanged(self) -> bool:
+        """True if none of the resources changed since the validators were stored"""
+        return self.not_modified.issuperset(GITHUB_RESOURCES)
+
+    def merge(self, previous_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Combine the changed resources with the previously stored additional_data"""
+        previous_data = previous_data or {}
+        merged = dict(previous_data) if "repo" in self.not_modified else {}
+        merged.update(self.github_data)
+        if "readme" in self.not_modified:
+            merged["readme_file"] = previous_data.get("readme_file")
+        if "languages" in self.not_modified:
+            merged["languages"] = previous_data.get("languages") or {}
+        return merged
+
+class GitHubRateLimiter:
+    """
+    Tracks GitHub's X-RateLimit-Remaining / X-RateLimit-Reset headers across
+    concurrent requests and holds new requests back once the quota is used up.
+    """
+
+    def __init__(self, max_wait: float = settings.GITHUB_MAX_BACKOFF_SECONDS):
+        self.max_wait = max_wait
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+
+    def update(self, response: httpx.Response) -> None:
+        """Record the quota reported by a GitHub API response"""
+        remaining = response.headers.get("x-ratelimit-remaining")
+        reset = response.headers.get("x-ratelimit-reset")
+        if remaining is not None and reset is not None:
+            self.remaining = int(remaining)
+            self.reset_at = float(reset)
+
+    def delay(self) -> float:
+        """Seconds to wait before the next request, 0 while there is quota left"""
+        if self.remaining is None or self.remaining > 0 or self.reset_at is None:
+            return 0.0
+        return max(0.0, self.reset_at - time.time())
+
+    async def wait(self) -> None:
+        """
+        Wait for the quota to reset if it is used up.
+
+        Raises:
+            GitHubRateLimitError: If the reset is further away than `max_wait`
+        """
+        delay = self.delay()
+        if delay > self.max_wait:
+            raise GitHubRateLimitError(self.reset_at)
+        if delay > 0:
+            logger.warning(f"GitHub rate limit reached, waiting {delay:.1f}s for the reset")
+            await asyncio.sleep(delay)
+
+def get_github_client() -> httpx.AsyncClient:
+    """Get the shared, pooled client used for all GitHub requests"""
+    return http_clients.get(
+        "github",
+        limits=httpx.Limits(
+            max_connections=max(settings.HTTP_MAX_CONNECTIONS, settings.GITHUB_REFRESH_CONCURRENCY * 2),
+            max_keepalive_connections=max(settings.HTTP_MAX_KEEPALIVE_CONNECTIONS, settings.GITHUB_REFRESH_CONCURRENCY),
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS
+        )
+    )
+
+def _rate_limit_backoff(response: httpx.Response, attempt: int) -> Optional[float]:
+    """Return how long to back off before retrying a rate limited response, or None if it wasn't rate limited"""
+    if response.status_code not in (403, 429):
+        return None
+    retry_after = response.headers.get("retry-after")
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    if response.headers.get("x-ratelimit-remaining") == "0" and response.headers.get("x-ratelimit-reset"):
+        return max(0.0, float(response.headers["x-ratelimit-reset"]) - time.time())
+    # Secondary rate limits are reported as 429, or 403 with an explanatory message
+    if response.status_code == 429 or "rate limit" in response.text.lower():
+        return float(2 ** attempt)
+    return None
+
+async def github_get(client: httpx.AsyncClient, url: str, headers: Optional[Dict[str, str]] = None, rate_limiter: Optional[GitHubRateLimiter] = None, **kwargs) -> httpx.Response:
+    """
+    GET a GitHub resource, honouring the rate limit headers and backing off on 403/429.
+
+    Raises:
+        GitHubRateLimitError: If the required backoff exceeds GITHUB_MAX_BACKOFF_SECONDS
+    """
+    for attempt in range(settings.GITHUB_MAX_RETRIES + 1):
+        if rate_limiter:
+            await rate_limiter.wait()
+        response = await client.get(url, headers=headers, **kwargs)
+        if rate_limiter:
+            rate_limiter.update(response)
+
+        backoff = _rate_limit_backoff(response, attempt)
+        if backoff is None or attempt == settings.GITHUB_MAX_RETRIES:
+            return response
+        if backoff > settings.GITHUB_MAX_BACKOFF_SECONDS:
+            raise GitHubRateLimitError(time.time() + backoff)
+
+        logger.warning(f"GitHub rate limited {url} ({response.status_code}), retrying in {backoff:.1f}s")
+        await asyncio.sleep(backoff)
+    return response
+
 def is_absolute_url(url: str) -> bool:
     """Check if a URL is absolute (starts with http:// or https://)"""
     return url.startswith(('http://', 'https://'))
@@ -101,18 +233,49 @@ def convert_relative_links(markdown_content: str, github_url: str, branch: str =
     
     return markdown_content
 
-async def fetch_github_data(github_url: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+def _conditional_headers(validators: Optional[Dict[str, Dict[str, str]]], resource: str) -> Dict[str, str]:
+    """Build If-None-Match / If-Modified-Since headers from the stored validators of a resource"""
+    stored = (validators or {}).get(resource) or {}
+    headers = {}
+    if stored.get("etag"):
+        headers["If-None-Match"] = stored["etag"]
+    if stored.get("last_modified"):
+        headers["If-Modified-Since"] = stored["last_modified"]
+    return headers
+
+def _response_validators(response: httpx.Response) -> Dict[str, str]:
+    """Extract the ETag / Last-Modified validators of a response"""
+    validators = {}
+    if response.headers.get("etag"):
+        validators["etag"] = response.headers["etag"]
+    if response.headers.get("last-modified"):
+        validators["last_modified"] = response.headers["last-modified"]
+    return validators
+
+async def fetch_github_data(
+    github_url: str,
+    client: Optional[httpx.AsyncClient] = None,
+    rate_limiter: Optional[GitHubRateLimiter] = None,
+    validators: Optional[Dict[str, Dict[str, str]]] = None
+) -> GitHubFetchResult:
     """
     Extracts username and repository name from a GitHub URL and fetches 
     repository data from the GitHub API.
     
+    When `validators` from an earlier fetch are given, conditional requests are
+    sent and resources GitHub answers with 304 Not Modified are left out of the
+    result (see GitHubFetchResult.merge). Conditional 304s don't count against
+    the GitHub rate limit.
+    
     Args:
         github_url: The GitHub repository URL
+        client: HTTP client to use, defaults to the shared GitHub client
+        rate_limiter: Rate limit tracker shared by concurrent fetches
+        validators: ETag/Last-Modified values stored from the previous fetch
         
     Returns:
-        Tuple containing:
-        - Dictionary with basic project data
-        - Complete GitHub API response to store in additional_data
+        GitHubFetchResult with the basic project data, the changed parts of the
+        GitHub data to store in additional_data and the new validators
     """
     # Extract username and repo name from GitHub URL
     pattern = r"https?://github\.com/([^/]+)/([^/]+)(?:/.*)?$"
@@ -141,56 +304,100 @@ async def fetch_github_data(github_url: str) -> Tuple[Dict[str, Any], Dict[str,
     
     logger.info(f"Fetching GitHub data for: {github_url}")
     
-    # Make request to GitHub API
-    async with httpx.AsyncClient() as client:
-        response = await client.get(api_url, headers=headers)
-        
-        if response.status_code != 200:
-            logger.error(f"GitHub API error: {response.status_code} - {response.text}")
-            raise HTTPException(
-                status_code=response.status_code, 
-                detail=f"GitHub API returned {response.status_code}: {response.text}"
-            )
-        
+    return await _fetch_repository(client or get_github_client(), github_url, username, repo_name, api_url, headers, rate_limiter, validators)
+
+async def _fetch_repository(
+    client: httpx.AsyncClient,
+    github_url: str,
+    username: str,
+    repo_name: str,
+    api_url: str,
+    headers: Dict[str, str],
+    rate_limiter: Optional[GitHubRateLimiter],
+    validators: Optional[Dict[str, Dict[str, str]]]
+) -> GitHubFetchResult:
+    """Fetch the repository JSON, README and languages of a repository with the given client"""
+    validators = validators or {}
+    new_validators: Dict[str, Dict[str, str]] = {}
+    not_modified = set()
+    
+    response = await github_get(client, api_url, {**headers, **_conditional_headers(validators, "repo")}, rate_limiter)
+    
+    if response.status_code == 304:
+        github_data = {}
+        not_modified.add("repo")
+        new_validators["repo"] = validators["repo"]
+    elif response.status_code != 200:
+        logger.error(f"GitHub API error: {response.status_code} - {response.text}")
+        raise HTTPException(
+            status_code=response.status_code, 
+            detail=f"GitHub API returned {response.status_code}: {response.text}"
+        )
+    else:
         # Complete GitHub API response
         github_data = response.json()
-        
-        # Fetch README.md file
-        raw_github_url = f"https://raw.githubusercontent.com/{username}/{repo_name}/main/"
-        readme_url = f"{raw_github_url}README.md"
-        try:
-            readme_response = await client.get(readme_url, follow_redirects=True)
-            if readme_response.status_code == 200:
-                github_data['readme_file'] = convert_relative_links(readme_response.text, raw_github_url)
-            else:
-                github_data['readme_file'] = None
-                logger.info(f"README not found at main branch, status: {readme_response.status_code}")
-        except Exception as e:
+        new_validators["repo"] = _response_validators(response)
+    
+    # Fetch the README through the API, which follows the default branch and returns an ETag
+    readme_validators = validators.get("readme") or {}
+    try:
+        readme_response = await github_get(client, f"{api_url}/readme", {**headers, **_conditional_headers(validators, "readme")}, rate_limiter)
+        if readme_response.status_code == 304:
+            not_modified.add("readme")
+            new_validators["readme"] = validators["readme"]
+        elif readme_response.status_code == 200:
+            readme = readme_response.json()
+            content = base64.b64decode(readme.get("content") or "").decode("utf-8", errors="replace")
+            # Relative links resolve against the folder of the README on its branch
+            raw_base_url = (readme.get("download_url") or "").rsplit("/", 1)[0] + "/"
+            github_data['readme_file'] = convert_relative_links(content, raw_base_url)
+            new_validators["readme"] = _response_validators(readme_response)
+        elif readme_response.status_code == 404 and readme_validators.get("missing"):
+            # Still no README, same as last time
+            not_modified.add("readme")
+            new_validators["readme"] = readme_validators
+        else:
             github_data['readme_file'] = None
-            logger.error(f"Error fetching README: {str(e)}")
-        
-        # Fetch languages data
-        languages_url = github_data.get('languages_url')
-        if languages_url:
-            try:
-                languages_response = await client.get(languages_url, headers=headers)
-                if languages_response.status_code == 200:
-                    github_data['languages'] = languages_response.json()
-                else:
-                    github_data['languages'] = {}
-                    logger.info(f"Languages data not available, status: {languages_response.status_code}")
-            except Exception as e:
-                github_data['languages'] = {}
-                logger.error(f"Error fetching languages data: {str(e)}")
+            if readme_response.status_code == 404:
+                # Remember the repository has no README so the next 404 counts as not modified
+                new_validators["readme"] = {"missing": "true"}
+            logger.info(f"README not available, status: {readme_response.status_code}")
+    except GitHubRateLimitError:
+        raise
+    except Exception as e:
+        github_data['readme_file'] = None
+        logger.error(f"Error fetching README: {str(e)}")
+    
+    # Fetch languages data, its URL is fixed so it can be fetched even if the repository JSON was not modified
+    languages_url = github_data.get('languages_url') or f"{api_url}/languages"
+    try:
+        languages_response = await github_get(client, languages_url, {**headers, **_conditional_headers(validators, "languages")}, rate_limiter)
+        if languages_response.status_code == 304:
+            not_modified.add("languages")
+            new_validators["languages"] = validators["languages"]
+        elif languages_response.status_code == 200:
+            github_data['languages'] = languages_response.json()
+            new_validators["languages"] = _response_validators(languages_response)
         else:
             github_data['languages'] = {}
-        
-        # Extract relevant information for project fields
-        basic_data = {
-            "title": github_data.get("name", ""),
-            "description": github_data.get("description", ""),
-            "url": github_url,  # Use the original URL provided by the user
-            # Other fields (type, image, tags) should be provided by the user
-        }
-        
-        return basic_data, github_data
+            logger.info(f"Languages data not available, status: {languages_response.status_code}")
+    except GitHubRateLimitError:
+        raise
+    except Exception as e:
+        github_data['languages'] = {}
+        logger.error(f"Error fetching languages data: {str(e)}")
+    
+    # Extract relevant information for project fields
+    basic_data = {
+        "title": github_data.get("name", ""),
+        "description": github_data.get("description", ""),
+        "url": github_url,  # Use the original URL provided by the user
+        # Other fields (type, image, tags) should be provided by the user
+    }
+    
+    return GitHubFetchResult(
+        basic_data=basic_data,
+        github_data=github_data,
+        validators={resource: value for resource, value in new_validators.items() if value},
+        not_modified=frozenset(not_modified)
+    )
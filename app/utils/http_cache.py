@@ -0,0 +1,76 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+from fastapi import Request, Response, status
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a strong ETag from the given parts.
+    Parts are typically a resource name, its version marker and the query parameters.
+    """
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+def make_content_etag(body: bytes) -> str:
+    """Build a strong ETag from an already encoded response body"""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+def format_http_date(value: datetime) -> str:
+    """Format a datetime as an HTTP date (RFC 7231)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison function, so ignore W/ prefixes
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag.removeprefix("W/") in candidates
+
+def _not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    # HTTP dates have a one second resolution
+    return last_modified.replace(microsecond=0) <= since
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """
+    Evaluate the conditional request headers against the current validators.
+    If-None-Match takes precedence over If-Modified-Since, as required by RFC 7232.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        return _not_modified_since(if_modified_since, last_modified)
+
+    return False
+
+def set_cache_headers(response: Response, etag: str, last_modified: Optional[datetime] = None) -> None:
+    """Attach the validators to a response so clients and CDNs can revalidate it"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    if last_modified:
+        response.headers["Last-Modified"] = format_http_date(last_modified)
+
+def conditional_response(request: Request, response: Response, etag: str, last_modified: Optional[datetime] = None) -> Optional[Response]:
+    """
+    Set the validator headers on `response` and return an empty 304 response
+    if the client's cached copy is still current, or None if the full body
+    should be sent.
+    """
+    set_cache_headers(response, etag, last_modified)
+    if not is_not_modified(request, etag, last_modified):
+        return None
+
+    not_modified = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_cache_headers(not_modified, etag, last_modified)
+    return not_modified
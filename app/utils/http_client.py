@@ -0,0 +1,63 @@
+import asyncio
+import logging
+import httpx
+from typing import Dict, Optional
+from app.config.settings import settings
+from app.utils.metrics import InstrumentedTransport
+
+logger = logging.getLogger(__name__)
+
+def _http2_available() -> bool:
+    """HTTP/2 support in httpx needs the optional h2 package"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+class HTTPClientRegistry:
+    """
+    Process-wide registry of pooled `httpx.AsyncClient`s for outbound calls.
+
+    Each integration (e.g. "github", "mailgun") gets its own named client, and
+    so its own connection pool, created on first use and kept alive until the
+    application shuts down. Reusing the client keeps TCP/TLS connections open
+    between calls instead of paying for DNS, TCP and TLS setup on every call.
+    """
+
+    def __init__(self):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._http2 = _http2_available()
+
+    def get(self, name: str, limits: Optional[httpx.Limits] = None, timeout: Optional[httpx.Timeout] = None) -> httpx.AsyncClient:
+        """
+        Get the shared client of an integration, creating it on first use.
+        `limits` and `timeout` override the configured defaults when the client is created.
+        """
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            # The pool lives in the transport, wrapped to record the latency of every call to the integration
+            transport = httpx.AsyncHTTPTransport(
+                http2=self._http2,
+                limits=limits or httpx.Limits(
+                    max_connections=settings.HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS
+                )
+            )
+            client = httpx.AsyncClient(
+                transport=InstrumentedTransport(name, transport),
+                timeout=timeout or httpx.Timeout(settings.HTTP_TIMEOUT_SECONDS, connect=settings.HTTP_CONNECT_TIMEOUT_SECONDS)
+            )
+            self._clients[name] = client
+            logger.info(f"Created HTTP client '{name}' (http2={self._http2})")
+        return client
+
+    async def aclose(self) -> None:
+        """Close all clients and their pooled connections"""
+        clients, self._clients = list(self._clients.values()), {}
+        await asyncio.gather(*(client.aclose() for client in clients), return_exceptions=True)
+        logger.info(f"Closed {len(clients)} HTTP clients")
+
+# Global registry instance, closed by the application lifespan
+http_clients = HTTPClientRegistry()
@@ -0,0 +1,51 @@
+import io
+import logging
+from typing import List, Tuple
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+def generate_image_variants(data: bytes, widths: List[int], quality: int = 80) -> List[Tuple[int, bytes]]:
+    """
+    Generate resized WebP variants of an image.
+
+    One variant is produced per requested width that is smaller than the
+    original image, plus one at the original width if it is narrower than the
+    largest requested width. Animated images, vector images and anything
+    Pillow can't decode produce no variants.
+
+    Args:
+        data (bytes): The original image bytes
+        widths (List[int]): Target widths in pixels
+        quality (int): WebP quality (0-100)
+
+    Returns:
+        List[Tuple[int, bytes]]: (width, WebP bytes) pairs ordered by width
+    """
+    try:
+        image = Image.open(io.BytesIO(data))
+        if getattr(image, "is_animated", False):
+            return []
+        image = ImageOps.exif_transpose(image)
+        image.load()
+    except Exception as e:
+        logger.info(f"Skipping image variants, could not decode image: {str(e)}")
+        return []
+
+    # WebP supports RGB and RGBA only
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "A" in image.getbands() or "transparency" in image.info else "RGB")
+
+    target_widths = sorted({width for width in widths if width < image.width})
+    if widths and image.width <= max(widths):
+        target_widths.append(image.width)
+
+    variants = []
+    for width in target_widths:
+        height = max(1, round(image.height * width / image.width))
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        buffer = io.BytesIO()
+        resized.save(buffer, format="WEBP", quality=quality, method=4)
+        variants.append((width, buffer.getvalue()))
+
+    return variants
@@ -1,9 +1,14 @@
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 from langchain_core.language_models import BaseChatModel
 from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
-from app.config.settings import Settings
+from app.config.settings import settings
+import threading
+import logging
+import time
 import os
 
+logger = logging.getLogger(__name__)
+
 class LLMFactory:
     """
     Factory to create Chat Model instances (Gemini, OpenAI, Claude).
@@ -12,8 +17,6 @@ class LLMFactory:
     
     @staticmethod
     def create_chat_model(provider: str = "gemini", temperature: float = 0.7) -> BaseChatModel:
-        settings = Settings()
-        
         if provider == "gemini":
             api_key = settings.GEMINI_API_KEY
             if not api_key:
@@ -36,8 +39,6 @@ class LLMFactory:
 
     @staticmethod
     def create_embeddings_model(provider: str = "gemini"):
-        settings = Settings()
-        
         if provider == "gemini":
             api_key = settings.GEMINI_API_KEY
             if not api_key:
@@ -50,3 +51,95 @@ class LLMFactory:
             )
         else:
             raise NotImplementedError(f"Embeddings provider {provider} not supported user")
+
+class LLMClientRegistry:
+    """
+    Process-wide registry of LLM and embeddings clients.
+
+    Each provider/model/temperature combination is built once through
+    LLMFactory and reused by every chat connection and VectorService, so
+    new chats don't pay for client construction. `warm_up()` builds the
+    default clients at startup and `health()` reports build and call latency.
+    """
+
+    def __init__(self):
+        self._clients: Dict[Tuple[Any, ...], Any] = {}
+        self._metadata: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+        self._warm_ups: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key: Tuple[Any, ...], build: Callable[[], Any]) -> Any:
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        with self._lock:
+            # Another thread may have built it while we waited
+            client = self._clients.get(key)
+            if client is None:
+                started = time.monotonic()
+                client = build()
+                self._clients[key] = client
+                self._metadata[key] = {
+                    "kind": key[0],
+                    "provider": key[1],
+                    "model": key[2],
+                    "temperature": key[3] if len(key) > 3 else None,
+                    "built_at": time.time(),
+                    "build_seconds": round(time.monotonic() - started, 3),
+                }
+                logger.info(f"Built {key[0]} client {key[1]}/{key[2]}")
+        return client
+
+    def get_chat_model(self, provider: str = "gemini", temperature: float = 0.7) -> BaseChatModel:
+        """Shared chat model of a provider and temperature"""
+        key = ("chat", provider, settings.GEMINI_MODEL if provider == "gemini" else None, temperature)
+        return self._get(key, lambda: LLMFactory.create_chat_model(provider, temperature))
+
+    def get_embeddings_model(self, provider: str = "gemini"):
+        """Shared embeddings model of a provider"""
+        key = ("embeddings", provider, settings.GEMINI_EMBEDDING_MODEL if provider == "gemini" else None)
+        return self._get(key, lambda: LLMFactory.create_embeddings_model(provider))
+
+    def warm_up(self, provider: str = "gemini") -> None:
+        """
+        Build the default chat and embeddings clients and make one small embedding
+        call, so the first chat message doesn't pay for client and connection setup.
+        Errors are recorded in the health report instead of raised.
+        """
+        for kind in ("chat", "embeddings"):
+            started = time.monotonic()
+            error = None
+            try:
+                if kind == "chat":
+                    self.get_chat_model(provider)
+                else:
+                    self.get_embeddings_model(provider).embed_query("warm up")
+            except Exception as e:
+                error = str(e)
+                logger.warning(f"Warm-up of the {provider} {kind} client failed: {error}")
+            with self._lock:
+                self._warm_ups[(kind, provider)] = {
+                    "kind": kind,
+                    "provider": provider,
+                    "at": time.time(),
+                    "seconds": round(time.monotonic() - started, 3),
+                    "error": error,
+                }
+
+    def health(self) -> Dict[str, Any]:
+        """Build metadata of every client and the outcome of the last warm-up"""
+        with self._lock:
+            return {
+                "clients": list(self._metadata.values()),
+                "warm_up": list(self._warm_ups.values()),
+            }
+
+    def clear(self) -> None:
+        """Drop every client, they are rebuilt on next use"""
+        with self._lock:
+            self._clients.clear()
+            self._metadata.clear()
+            self._warm_ups.clear()
+
+# Global registry instance, warmed up by the application lifespan
+llm_clients = LLMClientRegistry()
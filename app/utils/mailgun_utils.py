@@ -1,12 +1,16 @@
 import os
 import json
-import requests
-from typing import List, Dict, Optional
+import httpx
+from typing import Any, List, Dict, Optional
+from urllib.parse import parse_qs
 
 from ..config.settings import settings
+from .http_client import http_clients
 
 class MailgunEmail:
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        # Shared pooled client by default, tests can pass one backed by LocalMailgunTransport
+        self.client = client
         self.base_url = settings.MAILGUN_API_URL
         self.api_key = settings.MAILGUN_API_KEY
         self.from_email = settings.MAILGUN_FROM_EMAIL
@@ -32,7 +36,7 @@ class MailgunEmail:
         
         return formatted_links
 
-    def send_confirmation_email(self, name: str, email: str, subject: str, message: str, social_links: List[Dict[str, str]], portfolio_url: str, your_name: str) -> None:
+    async def send_confirmation_email(self, name: str, email: str, subject: str, message: str, social_links: List[Dict[str, str]], portfolio_url: str, your_name: str) -> None:
         """Send confirmation email to the user who submitted the contact form."""
         
         # Prepare dynamic template data
@@ -46,7 +50,7 @@ class MailgunEmail:
             'your_name': your_name
         }
         
-        res = requests.post(
+        res = await (self.client or http_clients.get("mailgun")).post(
             f"{self.base_url}/messages",
             auth=("api", self.api_key),
             data={
@@ -63,7 +67,7 @@ class MailgunEmail:
             res.raise_for_status()
         
 
-    def send_notification_email(self, name: str, email: str, subject: str, message: str, your_name: str) -> None:
+    async def send_notification_email(self, name: str, email: str, subject: str, message: str, your_name: str) -> None:
         """Send notification email to the admin about the new contact form submission."""
         
         # Prepare dynamic template data
@@ -75,7 +79,7 @@ class MailgunEmail:
             'your_name': your_name
         }
         
-        res = requests.post(
+        res = await (self.client or http_clients.get("mailgun")).post(
             f"{self.base_url}/messages",
             auth=("api", self.api_key),
             data={
@@ -90,3 +94,31 @@ class MailgunEmail:
         # print(res.status_code, res.text)
         if res.status_code != 200:
             res.raise_for_status()
+
+class LocalMailgunTransport(httpx.MockTransport):
+    """
+    Local stand-in for the Mailgun messages API, for tests and local development.
+    Accepted messages are recorded in `messages`; the first `fail_times` requests
+    are answered with `fail_status` to exercise the outbox retries.
+
+    Usage: MailgunEmail(client=httpx.AsyncClient(transport=LocalMailgunTransport()))
+    """
+
+    def __init__(self, fail_times: int = 0, fail_status: int = 503):
+        self.messages: List[Dict[str, Any]] = []
+        self.fail_times = fail_times
+        self.fail_status = fail_status
+        super().__init__(self._handle)
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        if not request.url.path.endswith("/messages"):
+            return httpx.Response(404, json={"message": "Not found"})
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            return httpx.Response(self.fail_status, json={"message": "Unavailable"})
+
+        form = parse_qs(request.content.decode())
+        message = {key: values if key == "to" else values[0] for key, values in form.items()}
+        message["t:variables"] = json.loads(message.get("t:variables", "{}"))
+        self.messages.append(message)
+        return httpx.Response(200, json={"id": f"<{len(self.messages)}@local.mailgun>", "message": "Queued. Thank you."})
@@ -0,0 +1,198 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+import collections
+from contextvars import ContextVar
+from typing import Dict, Optional, Tuple
+import httpx
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest, multiprocess
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.utils.db_pool import get_pool_status
+
+# Latency buckets (seconds) shared by request, query and outbound call histograms
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template",
+    ["method", "route", "status"], buckets=LATENCY_BUCKETS
+)
+REQUEST_SIZE = Histogram(
+    "http_request_size_bytes", "HTTP request body size by route template",
+    ["method", "route"], buckets=SIZE_BUCKETS
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes", "HTTP response body size by route template",
+    ["method", "route"], buckets=SIZE_BUCKETS
+)
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries", "Database queries executed per HTTP request",
+    ["method", "route"], buckets=QUERY_COUNT_BUCKETS
+)
+REQUEST_DB_DURATION = Histogram(
+    "http_request_db_duration_seconds", "Time spent in database queries per HTTP request",
+    ["method", "route"], buckets=LATENCY_BUCKETS
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds", "Database query latency by engine",
+    ["database"], buckets=LATENCY_BUCKETS
+)
+OUTBOUND_DURATION = Histogram(
+    "outbound_request_duration_seconds", "Latency of calls to external services (GitHub, Mailgun, Gemini)",
+    ["service", "operation", "status"], buckets=LATENCY_BUCKETS
+)
+CHAT_TURN_DURATION = Histogram(
+    "chat_turn_duration_seconds", "Chatbot turn timings: retrieval, time to first token and total",
+    ["stage", "source"], buckets=LATENCY_BUCKETS
+)
+CHAT_TURNS = Counter("chat_turns_total", "Chatbot turns answered", ["source"])
+
+class RequestQueryStats:
+    """
+    Database queries of the current request, shared by the threads serving it.
+    Statement shapes are only counted when the query inspector is enabled.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.duration = 0.0
+        self.shapes: "collections.Counter[str]" = collections.Counter()
+
+    def record(self, duration: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.duration += duration
+
+    def record_shape(self, shape: str) -> None:
+        with self._lock:
+            self.shapes[shape] += 1
+
+# Set by the metrics middleware; the threadpool copies the context, so sync handlers see it too
+current_query_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("current_query_stats", default=None)
+
+def route_template(request) -> str:
+    """Path template of the matched route (e.g. /api/v1/projects/{project_id}), never the raw path"""
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+def observe_request(method: str, route: str, status: int, duration: float, request_size: Optional[int], response_size: Optional[int], stats: RequestQueryStats) -> None:
+    REQUEST_DURATION.labels(method, route, str(status)).observe(duration)
+    if request_size is not None:
+        REQUEST_SIZE.labels(method, route).observe(request_size)
+    if response_size is not None:
+        RESPONSE_SIZE.labels(method, route).observe(response_size)
+    REQUEST_DB_QUERIES.labels(method, route).observe(stats.count)
+    REQUEST_DB_DURATION.labels(method, route).observe(stats.duration)
+
+def instrument_queries(engine: Engine, database: str) -> None:
+    """Time every statement of an engine, globally and for the request that ran it"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - conn.info["query_started"].pop()
+        DB_QUERY_DURATION.labels(database).observe(duration)
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.record(duration)
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        # after_cursor_execute doesn't run for failed statements
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_started"):
+            conn.info["query_started"].pop()
+
+@contextmanager
+def observe_outbound(service: str, operation: str):
+    """Time a call to an external service, e.g. `with observe_outbound("gemini", "embed_query"):`"""
+    started = time.perf_counter()
+    status = "error"
+    try:
+        yield
+        status = "ok"
+    finally:
+        OUTBOUND_DURATION.labels(service, operation, status).observe(time.perf_counter() - started)
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """Wraps an httpx transport to time every request of one integration until its response headers arrive"""
+
+    def __init__(self, service: str, transport: httpx.AsyncBaseTransport):
+        self.service = service
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        status = "error"
+        try:
+            response = await self._transport.handle_async_request(request)
+            status = str(response.status_code)
+            return response
+        finally:
+            OUTBOUND_DURATION.labels(self.service, request.method, status).observe(time.perf_counter() - started)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+class ChatTurnTimer:
+    """Timings of one chatbot turn, from the received question to the end of the answer"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.first_token_at: Optional[float] = None
+
+    def mark_retrieval(self) -> None:
+        CHAT_TURN_DURATION.labels("retrieval", "llm").observe(time.perf_counter() - self.started)
+
+    def mark_first_token(self) -> None:
+        if self.first_token_at is None:
+            self.first_token_at = time.perf_counter()
+
+    def finish(self, source: str) -> None:
+        if self.first_token_at is not None:
+            CHAT_TURN_DURATION.labels("first_token", source).observe(self.first_token_at - self.started)
+        CHAT_TURN_DURATION.labels("total", source).observe(time.perf_counter() - self.started)
+        CHAT_TURNS.labels(source).inc()
+
+class DatabasePoolCollector:
+    """Exposes the connection pool gauges of the database engines at scrape time"""
+
+    def __init__(self, engines: Dict[str, Engine]):
+        self.engines = engines
+
+    def collect(self):
+        in_use = GaugeMetricFamily("db_pool_connections_in_use", "Connections checked out of the pool", labels=["database"])
+        idle = GaugeMetricFamily("db_pool_connections_idle", "Idle connections kept in the pool", labels=["database"])
+        timeouts = CounterMetricFamily("db_pool_checkout_timeouts", "Checkouts that timed out waiting for a connection", labels=["database"])
+        wait = GaugeMetricFamily("db_pool_checkout_wait_seconds_max", "Longest checkout wait since startup", labels=["database"])
+        for database, engine in self.engines.items():
+            status = get_pool_status(engine, "")
+            in_use.add_metric([database], status.get("in_use", 0))
+            idle.add_metric([database], status.get("idle", 0))
+            timeouts.add_metric([database], status.get("timeouts", 0))
+            wait.add_metric([database], status.get("checkout_wait_seconds", {}).get("max", 0.0))
+        yield from (in_use, idle, timeouts, wait)
+
+def register_pool_collector(engines: Dict[str, Engine]) -> None:
+    REGISTRY.register(DatabasePoolCollector(engines))
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    Render all metrics in the Prometheus text format. With several worker
+    processes (PROMETHEUS_MULTIPROC_DIR set) the samples of all workers are merged.
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -0,0 +1,46 @@
+import base64
+import binascii
+import uuid
+import orjson
+from datetime import datetime
+from typing import Optional, Tuple
+from fastapi import HTTPException, status
+
+# Keyset position of a row: (created_at, id)
+CursorPosition = Tuple[datetime, uuid.UUID]
+
+def encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    """Encode the keyset position of the last row of a page as an opaque cursor"""
+    payload = orjson.dumps([created_at.isoformat(), str(row_id)])
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> CursorPosition:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = orjson.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), uuid.UUID(row_id)
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+def parse_cursor(cursor: Optional[str]) -> Optional[CursorPosition]:
+    """
+    Parse a `cursor` query parameter.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    if not cursor:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
@@ -0,0 +1,92 @@
+import threading
+import time
+import uuid
+import logging
+import orjson
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+from fastapi.encoders import jsonable_encoder
+from app.config.settings import settings
+from app.utils.http_cache import make_content_etag
+
+logger = logging.getLogger(__name__)
+
+class PublicDataSnapshot:
+    """A pre-encoded public data payload tied to the cache version it was built for."""
+
+    def __init__(self, body: bytes, version: int):
+        self.body = body
+        self.version = version
+        self.built_at = time.time()
+        self.etag = make_content_etag(body)
+        self.last_modified = datetime.now(timezone.utc)
+
+class PublicDataCache:
+    """
+    In-memory cache of the pre-encoded `/users/public-data/{user_id}` payload.
+
+    Every admin write calls `invalidate()`, which bumps the cache version and
+    drops all snapshots; the next read rebuilds the payload once and every
+    following read is served straight from memory. The TTL bounds how stale
+    a snapshot can get when the write happened in another worker process.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._version = 0
+        self._snapshots: Dict[uuid.UUID, PublicDataSnapshot] = {}
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+
+    def _is_fresh(self, snapshot: Optional[PublicDataSnapshot]) -> bool:
+        if snapshot is None or snapshot.version != self._version:
+            return False
+        return time.time() - snapshot.built_at < self.ttl_seconds
+
+    def get(self, user_id: uuid.UUID) -> Optional[PublicDataSnapshot]:
+        """Return the cached snapshot for a user if it is still valid"""
+        with self._lock:
+            snapshot = self._snapshots.get(user_id)
+            return snapshot if self._is_fresh(snapshot) else None
+
+    def get_or_build(self, user_id: uuid.UUID, builder: Callable[[], Optional[Dict[str, Any]]]) -> Optional[PublicDataSnapshot]:
+        """
+        Return the cached snapshot for a user, building it with `builder` on a miss.
+
+        Only one thread rebuilds at a time so a burst of visitors after an admin
+        write results in a single rebuild. Returns None if `builder` returns None.
+        """
+        snapshot = self.get(user_id)
+        if snapshot is not None:
+            return snapshot
+
+        with self._build_lock:
+            # Another thread may have rebuilt the snapshot while we waited
+            snapshot = self.get(user_id)
+            if snapshot is not None:
+                return snapshot
+
+            with self._lock:
+                version = self._version
+
+            payload = builder()
+            if payload is None:
+                return None
+
+            snapshot = PublicDataSnapshot(orjson.dumps(jsonable_encoder(payload)), version)
+
+            with self._lock:
+                # Don't store a snapshot that was invalidated while it was being built
+                if version == self._version and self.ttl_seconds > 0:
+                    self._snapshots[user_id] = snapshot
+
+            logger.info(f"Rebuilt public data snapshot for user {user_id} ({len(snapshot.body)} bytes)")
+            return snapshot
+
+    def invalidate(self) -> None:
+        """Mark every snapshot as stale after an admin write"""
+        with self._lock:
+            self._version += 1
+            self._snapshots.clear()
+
+public_data_cache = PublicDataCache(ttl_seconds=settings.PUBLIC_DATA_CACHE_TTL)
@@ -0,0 +1,85 @@
+import re
+import logging
+from contextlib import contextmanager
+from typing import Callable, List, Optional, Tuple, TypeVar
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.config.settings import settings
+from app.utils.metrics import RequestQueryStats, current_query_stats
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable)
+
+# Bound parameters (%(name)s, expanded IN lists like %(ids_1)s, %(ids_2)s) and literals
+_PARAMETER = re.compile(r"%\(\w+\)s|\$\d+|\?|'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_PARAMETER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+class QueryBudgetExceeded(Exception):
+    """Raised in strict mode when a request runs more statements than its budget"""
+
+def normalize_statement(statement: str) -> str:
+    """Shape of a statement: parameters and literals replaced by `?`, so the same query in a loop has one shape"""
+    shape = _PARAMETER.sub("?", statement)
+    shape = _PARAMETER_LIST.sub("?", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+def instrument_statement_shapes(engine: Engine) -> None:
+    """Count the shape of every statement of an engine for the request running it"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.record_shape(normalize_statement(statement))
+
+def query_budget(limit: int) -> Callable[[F], F]:
+    """
+    Declare the maximum number of statements a route may run, checked by the
+    query inspector. Place it below the router decorator:
+
+        @router.get("/public")
+        @query_budget(3)
+        def get_public_reviews(...):
+    """
+    def decorator(endpoint: F) -> F:
+        endpoint.query_budget = limit
+        return endpoint
+    return decorator
+
+def repeated_shapes(stats: RequestQueryStats, threshold: int) -> List[Tuple[str, int]]:
+    """Statement shapes run at least `threshold` times, the likely N+1 queries"""
+    return [(shape, count) for shape, count in stats.shapes.most_common() if count >= threshold]
+
+def check_queries(label: str, stats: RequestQueryStats, budget: Optional[int] = None) -> None:
+    """
+    Log likely N+1 queries and budget overruns of a request (or any tracked block).
+    With QUERY_BUDGET_STRICT an overrun raises QueryBudgetExceeded, so tests fail on query regressions.
+    """
+    for shape, count in repeated_shapes(stats, settings.QUERY_N_PLUS_ONE_THRESHOLD):
+        logger.warning(f"Possible N+1 in {label}: statement ran {count} times: {shape[:300]}")
+
+    budget = budget if budget is not None else settings.QUERY_BUDGET_DEFAULT or None
+    if budget is not None and stats.count > budget:
+        message = f"{label} ran {stats.count} SQL statements, over its budget of {budget}"
+        if settings.QUERY_BUDGET_STRICT:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
+
+@contextmanager
+def track_queries(label: str, budget: Optional[int] = None):
+    """
+    Count and check the statements run inside a block, e.g. a service call in a
+    test or a background job, the way the middleware does for requests:
+
+        with track_queries("refresh_github_data", budget=4) as stats:
+            ...
+    """
+    stats = RequestQueryStats()
+    token = current_query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        current_query_stats.reset(token)
+    check_queries(label, stats, budget)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Asset Migration Script
+
+Moves base64 images and documents that are stored inline in the database
+(project images, user avatars, about images and document-type social links)
+into the content-addressed asset store and replaces them with asset URLs.
+Project images and avatars also get their resized WebP variants, including
+images that were moved to the asset store before variants existed.
+Values that are already URLs are left untouched, so it is safe to run repeatedly.
+
+Usage:
+    python migrate_assets.py [--dry-run]
+"""
+
+import sys
+import os
+import argparse
+import copy
+import logging
+
+# Add parent directory to path so we can import our app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Import from our app
+from app.config.database import SessionLocal, Base, engine
+from app.models.project_model import Project
+from app.models.user_model import User
+from app.services.asset_service import AssetService, decode_base64_payload, asset_hash_from_url
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+def migrate_projects(db, asset_service, dry_run=False):
+    """Move inline project images into the asset store and generate missing variants."""
+    migrated = 0
+    for project in db.query(Project).filter(Project.image.is_not(None)).all():
+        is_inline = decode_base64_payload(project.image) is not None
+        needs_variants = project.image_variants is None and asset_hash_from_url(project.image) is not None
+        if not is_inline and not needs_variants:
+            continue
+        logger.info(f"Migrating image of project {project.id}")
+        if not dry_run:
+            if is_inline:
+                project.image, project.image_variants = asset_service.externalize_image(project.image)
+            else:
+                project.image_variants = asset_service.image_variants_for_url(project.image)
+            db.commit()
+        migrated += 1
+    return migrated
+
+def migrate_users(db, asset_service, dry_run=False):
+    """Move inline avatars, about images and documents into the asset store."""
+    migrated = 0
+    for user in db.query(User).all():
+        user_data = {
+            "avatar": user.avatar,
+            "about": copy.deepcopy(user.about) if user.about else None,
+            "social_links": copy.deepcopy(user.social_links) if user.social_links else None
+        }
+        has_inline_data = (
+            decode_base64_payload(user_data["avatar"])
+            or (user_data["about"] and decode_base64_payload(user_data["about"].get("image")))
+            or any(decode_base64_payload(link.get("url")) for link in user_data["social_links"] or [] if link.get("platform") == "document")
+        )
+        needs_variants = user.avatar_variants is None and asset_hash_from_url(user.avatar) is not None
+        if not has_inline_data and not needs_variants:
+            continue
+        logger.info(f"Migrating assets of user {user.id}")
+        if not dry_run:
+            user_data = asset_service.externalize_user_data(user_data)
+            # Reassign the JSON columns so SQLAlchemy picks up the change
+            user.avatar = user_data["avatar"]
+            user.about = user_data["about"]
+            user.social_links = user_data["social_links"]
+            if "avatar_variants" in user_data:
+                user.avatar_variants = user_data["avatar_variants"]
+            elif needs_variants:
+                user.avatar_variants = asset_service.image_variants_for_url(user.avatar)
+            db.commit()
+        migrated += 1
+    return migrated
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Move inline base64 data into the asset store")
+    parser.add_argument("--dry-run", action="store_true", help="Only report the rows that would be migrated")
+    return parser.parse_args()
+
+def main():
+    """Main function to run the asset migration."""
+    args = parse_args()
+    db = SessionLocal()
+    try:
+        asset_service = AssetService(db)
+        projects = migrate_projects(db, asset_service, args.dry_run)
+        users = migrate_users(db, asset_service, args.dry_run)
+        logger.info(f"{'Would migrate' if args.dry_run else 'Migrated'} {projects} projects and {users} users")
+    except Exception as e:
+        logger.error(f"Error migrating assets: {str(e)}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    # Create tables if they don't exist
+    Base.metadata.create_all(bind=engine)
+    main()
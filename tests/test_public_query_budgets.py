@@ -0,0 +1,62 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.config.settings import settings
+from app.dependencies.database import get_read_db
+from app.main import app
+from app.models.project_model import Project
+from app.utils.metrics import instrument_queries
+from app.utils.query_inspector import instrument_statement_shapes
+
+# The real application routes, with their read session on an in-memory database
+# instrumented like the application engines, so their @query_budget declarations gate the tests
+engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+instrument_queries(engine, "test")
+instrument_statement_shapes(engine)
+TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+PUBLIC_PROJECTS = f"{settings.API_PREFIX}/projects/public"
+
+def get_test_read_db():
+    db = TestSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+@pytest.fixture
+def client():
+    Project.__table__.create(bind=engine)
+    db = TestSessionLocal()
+    db.add_all([
+        Project(title=f"Project {number}", type="custom", tags=["python"], is_visible=number != 0)
+        for number in range(10)
+    ])
+    db.commit()
+    db.close()
+
+    app.dependency_overrides[get_read_db] = get_test_read_db
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_read_db, None)
+        Project.__table__.drop(bind=engine)
+
+def test_public_projects_stay_within_budget(strict_inspector, client):
+    response = client.get(PUBLIC_PROJECTS)
+    assert response.status_code == 200
+    assert response.json()["total"] == 9
+    assert int(response.headers["X-Query-Count"]) <= 3
+
+def test_public_projects_sparse_fields_stay_within_budget(strict_inspector, client):
+    response = client.get(PUBLIC_PROJECTS, params={"fields": "id,title", "limit": 5})
+    assert response.status_code == 200
+    assert int(response.headers["X-Query-Count"]) <= 3
+
+def test_public_projects_not_modified_stays_within_budget(strict_inspector, client):
+    etag = client.get(PUBLIC_PROJECTS).headers["ETag"]
+    response = client.get(PUBLIC_PROJECTS, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert int(response.headers["X-Query-Count"]) <= 1
@@ -0,0 +1,60 @@
+import logging
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from app.main import record_request_metrics
+from app.utils.metrics import instrument_queries
+from app.utils.query_inspector import (
+    QueryBudgetExceeded, instrument_statement_shapes, normalize_statement, query_budget, track_queries
+)
+
+# In-memory database, instrumented like the application engines
+engine = create_engine("sqlite://")
+instrument_queries(engine, "test")
+instrument_statement_shapes(engine)
+
+def run_queries(count: int) -> None:
+    with engine.connect() as connection:
+        for number in range(count):
+            connection.execute(text("SELECT :number"), {"number": number})
+
+test_app = FastAPI()
+test_app.middleware("http")(record_request_metrics)
+
+@test_app.get("/within-budget")
+@query_budget(2)
+def within_budget():
+    run_queries(2)
+    return {}
+
+@test_app.get("/over-budget")
+@query_budget(1)
+def over_budget():
+    run_queries(3)
+    return {}
+
+def test_route_within_budget_passes(strict_inspector):
+    response = TestClient(test_app).get("/within-budget")
+    assert response.status_code == 200
+    assert response.headers["X-Query-Count"] == "2"
+
+def test_route_over_budget_raises(strict_inspector):
+    with pytest.raises(QueryBudgetExceeded, match="ran 3 SQL statements, over its budget of 1"):
+        TestClient(test_app).get("/over-budget")
+
+def test_repeated_statement_is_reported_as_n_plus_one(strict_inspector, caplog):
+    with caplog.at_level(logging.WARNING, logger="app.utils.query_inspector"):
+        with track_queries("loop") as stats:
+            run_queries(3)
+    assert stats.count == 3
+    assert "Possible N+1 in loop: statement ran 3 times" in caplog.text
+
+def test_track_queries_enforces_budget(strict_inspector):
+    with pytest.raises(QueryBudgetExceeded):
+        with track_queries("service call", budget=2):
+            run_queries(3)
+
+def test_normalize_statement_collapses_parameters():
+    statement = "SELECT projects.id FROM projects\nWHERE projects.id IN (%(id_1_1)s, %(id_1_2)s) AND title = 'x' LIMIT %(param_1)s"
+    assert normalize_statement(statement) == "SELECT projects.id FROM projects WHERE projects.id IN (?) AND title = ? LIMIT ?"